@@ -1,11 +1,20 @@
 import logging
+from functools import lru_cache
 from fastapi import Depends, Request
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
 
 from app.core.auth.auth0_middleware import Auth0Middleware
+from app.core.llm.fake_provider import FakeLLMProvider
+from app.core.llm.interfaces import LLMProvider
+from app.core.llm.rate_limiter import RateLimitedLLMProvider, get_llm_rate_limiter
+from app.core.llm.registry import LLMProviderRegistry
+from app.core.llm.resilient_provider import ResilientLLMProvider
+from app.core.llm.response_cache import CachingLLMProvider, get_llm_response_cache
+from app.core.llm.router import RoutingLLMProvider
+from app.core.llm.usage import MeteringLLMProvider
 from app.core.llm.vertex_ai_llama import VertexAILlamaProvider
 from app.core.llm.openrouter_provider import OpenRouterProvider
 from app.db.session import get_session
@@ -20,9 +29,18 @@ from app.repositories.implementations.domain_repository import DomainRepository
 from app.repositories.implementations.source_repository import SourceRepository
 from app.repositories.implementations.search_repository import SearchRepository
 from app.repositories.implementations.feedback_repository import FeedbackRepository
+from app.repositories.implementations.llm_usage_repository import LLMUsageRepository
 from app.core.config import settings
+from app.core.utils.resilience import get_resilience_policy
+from app.services.analysis_context import AnalysisContext
 from app.services.analysis_orchestrator import AnalysisOrchestrator
+from app.services.analysis_cache import get_analysis_cache
+from app.services.analysis_single_flight import get_analysis_flights
+from app.services.batch_executor import BatchAnalysisExecutor
+from app.services.claim_detector import ClaimDetector
+from app.services.sufficiency_policy import get_sufficiency_policy
 from app.services.claim_conversation_service import ClaimConversationService
+from app.services.implementations.fake_web_search_service import FakeWebSearchService
 from app.services.implementations.web_search_service import GoogleWebSearchService
 from app.services.interfaces.web_search_service import WebSearchServiceInterface
 from app.services.implementations.embedding_generator import EmbeddingGenerator
@@ -36,6 +54,7 @@ from app.services.domain_service import DomainService
 from app.services.source_service import SourceService
 from app.services.search_service import SearchService
 from app.services.feedback_service import FeedbackService
+from app.services.usage_service import UsageService
 
 logger = logging.getLogger(__name__)
 
@@ -85,10 +104,20 @@ async def get_feedback_repository(session: Session = Depends(get_db)) -> Feedbac
     return FeedbackRepository(session)
 
 
-async def get_embedding_generator() -> EmbeddingGeneratorInterface:
+async def get_usage_repository(session: Session = Depends(get_db)) -> LLMUsageRepository:
+    return LLMUsageRepository(session)
+
+
+@lru_cache()
+def _get_shared_embedding_generator() -> EmbeddingGeneratorInterface:
+    """One generator per process, so the sentence transformer model is loaded only once."""
     return EmbeddingGenerator()
 
 
+async def get_embedding_generator() -> EmbeddingGeneratorInterface:
+    return _get_shared_embedding_generator()
+
+
 async def get_user_service(user_repository: UserRepository = Depends(get_user_repository)) -> UserService:
     return UserService(user_repository)
 
@@ -157,54 +186,187 @@ async def get_feedback_service(
     return FeedbackService(feedback_repository, analysis_repository)
 
 
-async def get_llm_provider():
+async def get_usage_service(
+    usage_repository: LLMUsageRepository = Depends(get_usage_repository),
+    analysis_repository: AnalysisRepository = Depends(get_analysis_repository),
+    claim_repository: ClaimRepository = Depends(get_claim_repository),
+) -> UsageService:
+    return UsageService(usage_repository, analysis_repository, claim_repository)
+
+
+_LLM_BACKENDS = {
+    "openrouter": lambda model: OpenRouterProvider(settings, model=model),
+    "vertex": lambda model: VertexAILlamaProvider(settings, model_id=model),
+    "fake": lambda model: FakeLLMProvider(settings, model=model),
+}
+
+
+def _create_llm_backend(name: str, model: Optional[str] = None) -> LLMProvider:
+    """
+    Build one backend behind its account's rate limiter and retry policy, which every model on that
+    account shares. Retries sit outside the limiter so each one waits its turn like a new call.
+    """
+    rate_limited = RateLimitedLLMProvider(
+        _LLM_BACKENDS[name](model),
+        get_llm_rate_limiter(name),
+        expected_output_tokens=settings.LLM_RATE_LIMIT_EXPECTED_OUTPUT_TOKENS,
+    )
+    return ResilientLLMProvider(rate_limited, get_resilience_policy(name))
+
+
+@lru_cache()
+def get_llm_router() -> Optional[RoutingLLMProvider]:
+    """Router over the configured backends for the default model, or None when routing is off."""
+    names = [name.strip() for name in settings.LLM_ROUTER_BACKENDS.split(",") if name.strip()]
+    if not names:
+        return None
+    unknown = [name for name in names if name not in _LLM_BACKENDS]
+    if unknown:
+        raise ValueError(f"Unknown LLM router backends: {', '.join(unknown)}")
+    logger.info(f"Routing LLM calls across: {', '.join(names)}")
+    return RoutingLLMProvider(
+        [(name, _create_llm_backend(name)) for name in names],
+        window=settings.LLM_ROUTER_WINDOW,
+        max_error_rate=settings.LLM_ROUTER_MAX_ERROR_RATE,
+        cooldown_seconds=settings.LLM_ROUTER_COOLDOWN_SECONDS,
+        hedge=settings.LLM_ROUTER_HEDGE,
+        hedge_min_delay_seconds=settings.LLM_ROUTER_HEDGE_MIN_DELAY_SECONDS,
+        default_temperature=settings.LLM_ROUTER_DEFAULT_TEMPERATURE,
+    )
+
+
+def _create_llm_provider(model: Optional[str] = None):
     try:
+        # Model overrides name one backend's model, so only the default model is routed
+        router = get_llm_router() if model is None else None
+        if router is not None:
+            provider = router
+        elif settings.LLM_PROVIDER:
+            if settings.LLM_PROVIDER not in _LLM_BACKENDS:
+                raise ValueError(f"Unknown LLM provider: {settings.LLM_PROVIDER}")
+            logger.info(f"Using {settings.LLM_PROVIDER} LLM provider")
+            provider = _create_llm_backend(settings.LLM_PROVIDER, model)
         # Try OpenRouter first if API key exists
-        if settings.OPENROUTER_API_KEY:
+        elif settings.OPENROUTER_API_KEY:
             logger.info("Using OpenRouter LLM provider")
-            provider = OpenRouterProvider(settings)
-            return provider
+            provider = _create_llm_backend("openrouter", model)
         else:
             # Fall back to Vertex AI
             logger.info("Using Vertex AI LLM provider")
-            provider = VertexAILlamaProvider(settings)
-            return provider
+            provider = _create_llm_backend("vertex", model)
     except Exception as e:
         logger.error(f"Failed to initialize LLM provider: {str(e)}", exc_info=True)
         raise
 
+    response_cache = get_llm_response_cache()
+    if response_cache is not None:
+        provider = CachingLLMProvider(provider, response_cache, settings.LLM_RESPONSE_CACHE_MAX_TEMPERATURE)
+    # Outermost, so cache hits are seen and the model reported is the backend that answered
+    prices = {model: tuple(price) for model, price in settings.LLM_PRICES_PER_MILLION_TOKENS.items()}
+    return MeteringLLMProvider(provider, prices)
+
+
+@lru_cache()
+def get_llm_registry() -> LLMProviderRegistry:
+    """Process-wide provider registry; the app lifespan starts and closes it."""
+    return LLMProviderRegistry(
+        _create_llm_provider,
+        refresh_margin_seconds=settings.LLM_CREDENTIAL_REFRESH_MARGIN_SECONDS,
+        refresh_interval_seconds=settings.LLM_CREDENTIAL_REFRESH_INTERVAL_SECONDS,
+    )
+
+
+def get_shared_llm_provider(model: Optional[str] = None) -> LLMProvider:
+    return get_llm_registry().get(model)
+
+
+async def get_llm_provider(registry: LLMProviderRegistry = Depends(get_llm_registry)) -> LLMProvider:
+    return registry.get()
+
+
+@lru_cache()
+def get_claim_detector() -> ClaimDetector:
+    """Process-wide claim detector, so its cache is shared across requests."""
+    return ClaimDetector(
+        get_shared_llm_provider(settings.CLAIM_DETECTION_MODEL), cache_size=settings.CLAIM_DETECTION_CACHE_SIZE
+    )
+
+
+async def start_llm_providers() -> None:
+    """Build the configured providers and start credential refresh; called from the app lifespan."""
+    await get_llm_registry().start([None, settings.CLAIM_DETECTION_MODEL])
+
+
+async def close_llm_providers() -> None:
+    await get_llm_registry().close()
+
+
+@lru_cache()
+def _get_shared_web_search_service() -> WebSearchServiceInterface:
+    """The search client without persistence; each analysis binds it to its own session."""
+    if settings.WEB_SEARCH_PROVIDER == "fake":
+        logger.info("Using simulated web search")
+        return FakeWebSearchService()
+    return GoogleWebSearchService()
+
 
 async def get_web_search_service(
     domain_service: DomainService = Depends(get_domain_service),
     source_repository: SourceRepository = Depends(get_source_repository),
 ) -> WebSearchServiceInterface:
-    return GoogleWebSearchService(domain_service, source_repository)
+    return _get_shared_web_search_service().bind(domain_service, source_repository)
 
 
-async def get_orchestrator_service(
-    claim_repository: ClaimRepository = Depends(get_claim_repository),
-    analysis_repository: AnalysisRepository = Depends(get_analysis_repository),
-    conversation_repository: ConversationRepository = Depends(get_conversation_repository),
-    claim_conversation_repository: ClaimConversationRepository = Depends(get_claim_conversation_repository),
-    message_repository: MessageRepository = Depends(get_message_repository),
-    source_repository: SourceRepository = Depends(get_source_repository),
-    search_repository: SearchRepository = Depends(get_search_repository),
-    web_search_service: WebSearchServiceInterface = Depends(get_web_search_service),
-    llm_provider=Depends(get_llm_provider),
-) -> AnalysisOrchestrator:
+@lru_cache()
+def get_shared_orchestrator() -> AnalysisOrchestrator:
+    """
+    One orchestrator per process, shared by every request and batch worker.
+
+    It holds no per-run state; the session and everything bound to it travel in an ``AnalysisContext``.
+    """
     return AnalysisOrchestrator(
-        claim_repo=claim_repository,
-        analysis_repo=analysis_repository,
-        conversation_repo=conversation_repository,
-        claim_conversation_repo=claim_conversation_repository,
-        message_repo=message_repository,
-        source_repo=source_repository,
-        search_repo=search_repository,
-        web_search_service=web_search_service,
-        llm_provider=llm_provider,
+        llm_provider=get_shared_llm_provider(),
+        web_search_service=_get_shared_web_search_service(),
+        analysis_cache=get_analysis_cache(),
+        embedding_generator=_get_shared_embedding_generator(),
+        write_behind=settings.ANALYSIS_WRITE_BEHIND,
+        analysis_flights=get_analysis_flights(),
+        claim_detector=get_claim_detector(),
+        sufficiency_policy=get_sufficiency_policy(),
     )
 
 
+async def get_orchestrator_service() -> AnalysisOrchestrator:
+    return get_shared_orchestrator()
+
+
+async def get_analysis_context(
+    session: AsyncSession = Depends(get_db),
+    orchestrator: AnalysisOrchestrator = Depends(get_orchestrator_service),
+) -> AnalysisContext:
+    return orchestrator.new_context(session)
+
+
+@lru_cache()
+def get_shared_batch_executor() -> BatchAnalysisExecutor:
+    return BatchAnalysisExecutor(
+        orchestrator=get_shared_orchestrator(),
+        num_workers=settings.BATCH_ANALYSIS_WORKERS,
+        claim_timeout_seconds=settings.BATCH_ANALYSIS_CLAIM_TIMEOUT_SECONDS,
+        persist_margin_seconds=settings.BATCH_ANALYSIS_PERSIST_MARGIN_SECONDS,
+    )
+
+
+async def get_batch_executor() -> BatchAnalysisExecutor:
+    return get_shared_batch_executor()
+
+
+async def stop_batch_executor() -> None:
+    """Stop the batch workers on shutdown; a process that never ran a batch job has none to stop."""
+    if get_shared_batch_executor.cache_info().currsize:
+        await get_shared_batch_executor().stop()
+
+
 def get_auth_middleware(user_service: UserService = Depends(get_user_service)) -> Auth0Middleware:
     return Auth0Middleware(user_service)
 
@@ -1,14 +1,21 @@
 import json
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
-from typing import List
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
+from typing import List, Optional
 from uuid import UUID
 import logging
 from datetime import datetime
 
-from app.api.dependencies import get_analysis_service, get_auth_middleware, get_orchestrator_service, get_current_user
+from app.api.dependencies import (
+    get_analysis_context,
+    get_analysis_service,
+    get_auth_middleware,
+    get_orchestrator_service,
+    get_current_user,
+)
 from app.core.auth.auth0_middleware import Auth0Middleware
 from app.models.domain.user import User
 from app.services.analysis_service import AnalysisService
+from app.services.analysis_context import AnalysisContext
 from app.services.analysis_orchestrator import AnalysisOrchestrator
 from app.schemas.analysis_schema import AnalysisRead
 from app.core.exceptions import NotFoundException
@@ -39,8 +46,11 @@ async def get_analysis(
 async def stream_claim_analysis(
     request: Request,
     claim_id: UUID,
+    timing: bool = Query(False, description="Emit per-stage timing events"),
+    x_analysis_deadline_ms: Optional[int] = Header(None),
     auth_middleware: Auth0Middleware = Depends(get_auth_middleware),
     analysis_orchestrator: AnalysisOrchestrator = Depends(get_orchestrator_service),
+    analysis_context: AnalysisContext = Depends(get_analysis_context),
 ) -> StreamingResponse:
     """Stream the analysis process for a claim in real-time."""
     try:
@@ -52,7 +62,11 @@ async def stream_claim_analysis(
                 yield f"data: {json.dumps({'type': 'status', 'content': 'Initializing analysis...'})}\n\n"
 
                 async for event in analysis_orchestrator.analyze_claim_stream(
-                    claim_id=claim_id, user_id=current_user.id
+                    analysis_context,
+                    claim_id=claim_id,
+                    user_id=current_user.id,
+                    include_timing=timing,
+                    deadline_ms=x_analysis_deadline_ms,
                 ):
                     if isinstance(event, dict):
                         yield f"data: {json.dumps(event)}\n\n"
@@ -1,11 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Header, status, Query, BackgroundTasks
 from typing import Optional, List
 from uuid import UUID
 import logging
 from datetime import datetime
 
-from app.api.dependencies import get_claim_service, get_current_user, get_embedding_generator, get_orchestrator_service
+from app.api.dependencies import (
+    get_analysis_context,
+    get_batch_executor,
+    get_claim_service,
+    get_current_user,
+    get_embedding_generator,
+    get_orchestrator_service,
+)
 from app.repositories.implementations.user_repository import UserRepository
+from app.core.config import settings
 from app.db.session import AsyncSessionLocal
 from app.models.database.models import ClaimStatus
 from app.models.domain.user import User
@@ -17,10 +25,13 @@ from app.schemas.claim_schema import (
     WordCloudRequest,
     BatchAnalysisResponse,
     BatchResponse,
+    SimilarClaimRead,
 )
 from app.schemas.analysis_schema import AnalysisRead
 from app.services.claim_service import ClaimService
+from app.services.analysis_context import AnalysisContext
 from app.services.analysis_orchestrator import AnalysisOrchestrator
+from app.services.batch_executor import BatchAnalysisExecutor
 from app.core.exceptions import NotFoundException, NotAuthorizedException
 from app.services.interfaces.embedding_generator import EmbeddingGeneratorInterface
 
@@ -31,9 +42,11 @@ logger = logging.getLogger(__name__)
 @router.post("/analyze", summary="Create and analyze claim in one step")
 async def analyze_claim(
     data: ClaimCreate,
+    x_analysis_deadline_ms: Optional[int] = Header(None),
     current_user: User = Depends(get_current_user),
     claim_service: ClaimService = Depends(get_claim_service),
     analysis_orchestrator: AnalysisOrchestrator = Depends(get_orchestrator_service),
+    analysis_context: AnalysisContext = Depends(get_analysis_context),
 ):
     """Create a claim and run full analysis, returning complete results."""
     try:
@@ -50,7 +63,8 @@ async def analyze_claim(
         
         # Step 2: Run complete analysis
         analysis_result = await analysis_orchestrator.analyze_claim_direct(
-            claim_id=claim.id, user_id=current_user.id
+            analysis_context,
+            claim_id=claim.id, user_id=current_user.id, deadline_ms=data.deadline_ms or x_analysis_deadline_ms
         )
         
         # Step 3: Get the updated claim with analysis
@@ -76,8 +90,10 @@ async def analyze_claim(
 @router.post("/analyze-test", summary="Create and analyze claim (NO AUTH - for testing)")
 async def analyze_claim_test(
     data: ClaimCreate,
+    x_analysis_deadline_ms: Optional[int] = Header(None),
     claim_service: ClaimService = Depends(get_claim_service),
     analysis_orchestrator: AnalysisOrchestrator = Depends(get_orchestrator_service),
+    analysis_context: AnalysisContext = Depends(get_analysis_context),
 ):
     """Create a claim and run full analysis without authentication - FOR TESTING ONLY."""
     try:
@@ -121,7 +137,8 @@ async def analyze_claim_test(
         
         # Step 2: Run complete analysis
         analysis_result = await analysis_orchestrator.analyze_claim_direct(
-            claim_id=claim.id, user_id=test_user.id
+            analysis_context,
+            claim_id=claim.id, user_id=test_user.id, deadline_ms=data.deadline_ms or x_analysis_deadline_ms
         )
         
         # Step 3: Get the updated claim with analysis
@@ -207,7 +224,7 @@ async def create_claims_batch(
     background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     claim_service: ClaimService = Depends(get_claim_service),
-    analysis_orchestrator: AnalysisOrchestrator = Depends(get_orchestrator_service),
+    batch_executor: BatchAnalysisExecutor = Depends(get_batch_executor),
 ) -> BatchResponse:
     if len(claims) > 100:
         raise HTTPException(status_code=400, detail="Maximum of 100 claims allowed.")
@@ -216,7 +233,7 @@ async def create_claims_batch(
         created_claims = await claim_service.create_claims_batch(claims, current_user.id)
         claim_ids = [str(claim.id) for claim in created_claims]
         background_tasks.add_task(
-            claim_service.process_claims_batch_async, created_claims, current_user.id, analysis_orchestrator
+            claim_service.process_claims_batch_async, created_claims, current_user.id, batch_executor
         )
         return {"message": f"Processing {len(created_claims)} claims in the background.", "claim_ids": claim_ids}
     except Exception as e:
@@ -324,6 +341,46 @@ async def update_claim_embedding(
         )
 
 
+@router.get("/{claim_id}/similar", response_model=List[SimilarClaimRead], summary="Find similar analyzed claims")
+async def get_similar_claims(
+    claim_id: UUID,
+    limit: int = Query(5, ge=1, le=20),
+    min_similarity: float = Query(settings.ANALYSIS_SEMANTIC_REUSE_THRESHOLD, ge=0, le=1),
+    current_user: User = Depends(get_current_user),
+    claim_service: ClaimService = Depends(get_claim_service),
+    embedding_generator: EmbeddingGeneratorInterface = Depends(get_embedding_generator),
+) -> List[SimilarClaimRead]:
+    """List previously analyzed claims whose analysis could be reused for this claim."""
+    try:
+        claim = await claim_service.get_claim(claim_id=claim_id, user_id=current_user.id)
+        if claim.embedding is None:
+            embedding = await embedding_generator.generate_embedding(claim.claim_text)
+            claim = await claim_service.update_claim_embedding(
+                claim_id=claim_id, embedding=embedding, user_id=current_user.id
+            )
+
+        matches = await claim_service.find_similar_analyzed_claims(
+            claim=claim, min_similarity=min_similarity, limit=limit
+        )
+        return [
+            SimilarClaimRead(
+                claim=ClaimRead.model_validate(similar_claim),
+                analysis_id=analysis.id,
+                veracity_score=analysis.veracity_score,
+                similarity=similarity,
+            )
+            for similar_claim, analysis, similarity in matches
+        ]
+    except NotFoundException:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Claim not found")
+    except NotAuthorizedException:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to access this claim")
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to find similar claims: {str(e)}"
+        )
+
+
 @router.post("/wordcloud/generate", response_model=dict, summary="Get the JSON for plotting a word cloud")
 async def generate_word_cloud(
     data: WordCloudRequest,
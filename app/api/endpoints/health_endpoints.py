@@ -1,5 +1,11 @@
 from fastapi import APIRouter, HTTPException
 from app.services.implementations.embedding_generator import EmbeddingGenerator
+from app.services.analysis_cache import get_analysis_cache
+from app.services.analysis_single_flight import get_analysis_flights
+from app.core.llm.response_cache import get_llm_response_cache
+from app.core.llm.rate_limiter import get_llm_rate_limiter
+from app.core.utils.resilience import get_resilience_policy
+from app.api.dependencies import get_llm_router
 from app.core.config import settings
 import aiohttp
 import logging
@@ -102,3 +108,33 @@ async def search_health_check():
             status_code=503, 
             detail=f"Search health check failed: {str(e)}"
         )
+
+
+@router.get("/health/cache")
+async def cache_health_check():
+    """Report claim analysis cache, LLM response cache and request coalescing statistics."""
+    cache = get_analysis_cache()
+    flights = get_analysis_flights()
+    llm_cache = get_llm_response_cache()
+    extra = {
+        "single_flight": flights.stats() if flights is not None else "disabled",
+        "llm_responses": llm_cache.stats() if llm_cache is not None else "disabled",
+    }
+    if cache is None:
+        return {"status": "healthy", "cache_status": "disabled", **extra}
+
+    return {"status": "healthy", "cache_status": "enabled", **cache.stats(), **extra}
+
+
+@router.get("/health/llm")
+async def llm_health_check():
+    """Report rate limiting, retries and breaker state per dependency and, when routing is on, per-backend latency."""
+    llm_router = get_llm_router()
+    return {
+        "status": "healthy",
+        "rate_limits": {name: get_llm_rate_limiter(name).stats() for name in ("openrouter", "vertex", "fake")},
+        "resilience": {
+            name: get_resilience_policy(name).stats() for name in ("openrouter", "vertex", "fake", "google_search")
+        },
+        "routing": llm_router.stats() if llm_router is not None else "disabled",
+    }
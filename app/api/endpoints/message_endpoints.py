@@ -8,10 +8,17 @@ from datetime import datetime
 
 from fastapi.responses import StreamingResponse
 
-from app.api.dependencies import get_auth_middleware, get_message_service, get_orchestrator_service, get_current_user
+from app.api.dependencies import (
+    get_analysis_context,
+    get_auth_middleware,
+    get_message_service,
+    get_orchestrator_service,
+    get_current_user,
+)
 from app.core.auth.auth0_middleware import Auth0Middleware
 from app.models.domain.user import User
 from app.schemas.message_schema import MessageCreate, MessageRead
+from app.services.analysis_context import AnalysisContext
 from app.services.analysis_orchestrator import AnalysisOrchestrator
 from app.services.message_service import MessageService
 from app.core.exceptions import NotAuthorizedException
@@ -50,6 +57,7 @@ async def stream_message(
     content: str,
     auth_middleware: Auth0Middleware = Depends(get_auth_middleware),
     orchestrator: AnalysisOrchestrator = Depends(get_orchestrator_service),
+    analysis_context: AnalysisContext = Depends(get_analysis_context),
 ) -> StreamingResponse:
     """Stream an interactive response in a claim conversation."""
     try:
@@ -58,6 +66,7 @@ async def stream_message(
         async def event_generator():
             try:
                 async for event in orchestrator.stream_claim_discussion(
+                    analysis_context,
                     conversation_id=conversation_id,
                     claim_conversation_id=claim_conversation_id,
                     claim_id=claim_id,
@@ -0,0 +1,57 @@
+from datetime import UTC, date, datetime, timedelta
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.api.dependencies import get_current_user, get_usage_service
+from app.core.exceptions import NotAuthorizedException, NotFoundException, ValidationError
+from app.models.domain.user import User
+from app.schemas.usage_schema import AnalysisUsageRead, DailyUsageRead, UsageTotals, UserUsageList
+from app.services.usage_service import UsageService
+
+router = APIRouter(prefix="/usage", tags=["usage"])
+
+DEFAULT_RANGE_DAYS = 30
+
+
+def _date_range(start_date: Optional[date], end_date: Optional[date]) -> tuple[date, date]:
+    end_date = end_date or datetime.now(UTC).date()
+    return start_date or end_date - timedelta(days=DEFAULT_RANGE_DAYS - 1), end_date
+
+
+@router.get("/me", response_model=UserUsageList)
+async def get_my_usage(
+    start_date: Optional[date] = Query(None, description="First day, inclusive; defaults to 30 days ago"),
+    end_date: Optional[date] = Query(None, description="Last day, inclusive; defaults to today (UTC)"),
+    current_user: User = Depends(get_current_user),
+    usage_service: UsageService = Depends(get_usage_service),
+):
+    """Tokens and cost of the current user's LLM calls per day, stage and model."""
+    start_date, end_date = _date_range(start_date, end_date)
+    try:
+        rows, totals = await usage_service.get_user_usage(current_user.id, start_date, end_date)
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return UserUsageList(
+        start_date=start_date,
+        end_date=end_date,
+        items=[DailyUsageRead.model_validate(row) for row in rows],
+        totals=UsageTotals(**totals),
+    )
+
+
+@router.get("/analyses/{analysis_id}", response_model=AnalysisUsageRead)
+async def get_analysis_usage(
+    analysis_id: UUID,
+    current_user: User = Depends(get_current_user),
+    usage_service: UsageService = Depends(get_usage_service),
+):
+    """Tokens, cost and first-token latency of one analysis, by stage and by model."""
+    try:
+        usage = await usage_service.get_analysis_usage(analysis_id, current_user.id)
+    except NotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except NotAuthorizedException:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to access this analysis")
+    return AnalysisUsageRead(analysis_id=analysis_id, usage=usage or None)
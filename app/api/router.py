@@ -11,6 +11,7 @@ from app.api.endpoints import (
     domain_endpoints,
     health_endpoints,
     claim_conversation_endpoints,
+    usage_endpoints,
 )
 
 router = APIRouter()
@@ -25,4 +26,5 @@ router.include_router(conversation_endpoints.router, tags=["conversations"])
 router.include_router(message_endpoints.router, tags=["messages"])
 router.include_router(domain_endpoints.router, tags=["domains"])
 router.include_router(claim_conversation_endpoints.router, tags=["claim-conversations"])
+router.include_router(usage_endpoints.router, tags=["usage"])
 router.include_router(health_endpoints.router, tags=["health"])
@@ -1,5 +1,5 @@
 import os
-from typing import Optional
+from typing import Dict, List, Optional
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 import logging
@@ -18,6 +18,66 @@ class Settings(BaseSettings):
 
     VERTEX_AI_LOCATION: str = "us-central1"
     VERTEX_AI_ENDPOINT_ID: str = "us-central1-aiplatform.googleapis.com"
+    VERTEX_AI_MAX_CONNECTIONS: int = 64
+    VERTEX_AI_KEEPALIVE_SECONDS: float = 60.0
+    # Provider credentials are renewed in the background once they are this close to expiring
+    LLM_CREDENTIAL_REFRESH_MARGIN_SECONDS: float = 300.0
+    LLM_CREDENTIAL_REFRESH_INTERVAL_SECONDS: float = 60.0
+
+    # Deterministic (low-temperature) LLM calls are answered from cache; the disk tier is off unless a path is set
+    LLM_RESPONSE_CACHE_ENABLED: bool = True
+    LLM_RESPONSE_CACHE_MAX_TEMPERATURE: float = 0.0
+    LLM_RESPONSE_CACHE_MAX_ENTRIES: int = 2048
+    LLM_RESPONSE_CACHE_TTL_SECONDS: int = 86400
+    LLM_RESPONSE_CACHE_DISK_PATH: Optional[str] = None
+    LLM_RESPONSE_CACHE_DISK_MAX_ENTRIES: int = 50000
+
+    # Comma-separated backends ("openrouter,vertex") to route the default model across; empty uses a single provider
+    LLM_ROUTER_BACKENDS: str = ""
+    LLM_ROUTER_WINDOW: int = 100
+    LLM_ROUTER_MAX_ERROR_RATE: float = 0.5
+    LLM_ROUTER_COOLDOWN_SECONDS: float = 30.0
+    LLM_ROUTER_HEDGE: bool = False
+    LLM_ROUTER_HEDGE_MIN_DELAY_SECONDS: float = 1.0
+    # Temperature routed calls use when the caller leaves it out; unset keeps each backend's own default,
+    # which differs between backends, so the response cache then skips those calls
+    LLM_ROUTER_DEFAULT_TEMPERATURE: Optional[float] = None
+
+    # Per provider account, shared by all callers; 0 disables a limit. Calls reserve prompt plus expected output tokens
+    LLM_RATE_LIMIT_REQUESTS_PER_MINUTE: int = 0
+    LLM_RATE_LIMIT_TOKENS_PER_MINUTE: int = 0
+    LLM_RATE_LIMIT_MAX_IN_FLIGHT: int = 32
+    LLM_RATE_LIMIT_EXPECTED_OUTPUT_TOKENS: int = 512
+
+    # Transient LLM and search failures are retried with jittered backoff; a dependency that keeps failing is
+    # short-circuited until the breaker's reset period has passed
+    RESILIENCE_MAX_ATTEMPTS: int = 3
+    RESILIENCE_INITIAL_BACKOFF_SECONDS: float = 0.5
+    RESILIENCE_MAX_BACKOFF_SECONDS: float = 8.0
+    # A Retry-After longer than this is not waited for; the call fails and the breaker takes over
+    RESILIENCE_MAX_RETRY_AFTER_SECONDS: float = 30.0
+    RESILIENCE_BREAKER_FAILURE_THRESHOLD: int = 5
+    RESILIENCE_BREAKER_RESET_SECONDS: float = 30.0
+
+    # USD per million [prompt, completion] tokens by model id, with "default" for models not listed
+    LLM_PRICES_PER_MILLION_TOKENS: Dict[str, List[float]] = {}
+
+    # "openrouter", "vertex" or "fake"; empty picks OpenRouter when its key is set, else Vertex AI
+    LLM_PROVIDER: str = ""
+    # "google" or "fake"
+    WEB_SEARCH_PROVIDER: str = "google"
+
+    # Simulated backends for load testing. Latency is "fixed", "uniform" or "lognormal" around the given means
+    FAKE_SEED: int = 0
+    FAKE_LATENCY_DISTRIBUTION: str = "lognormal"
+    FAKE_LATENCY_SPREAD: float = 0.5
+    FAKE_LLM_FIRST_TOKEN_MS: float = 400.0
+    FAKE_LLM_TOKENS_PER_SECOND: float = 60.0
+    FAKE_LLM_ERROR_RATE: float = 0.0
+    FAKE_LLM_SEARCH_TURNS: int = 2
+    FAKE_SEARCH_LATENCY_MS: float = 300.0
+    FAKE_SEARCH_RESULTS: int = 5
+    FAKE_SEARCH_ERROR_RATE: float = 0.0
     GOOGLE_CLOUD_PROJECT: str = "misinformation-mitigation"
     GOOGLE_APPLICATION_CREDENTIALS: str = os.path.join(
         os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "service-account.json"
@@ -26,8 +86,55 @@ class Settings(BaseSettings):
     GOOGLE_SEARCH_ENGINE_ID: str = ""
 
     LLAMA_MODEL_NAME: str = "meta/llama-3.3-70b-instruct-maas"
+    # Smaller model for claim detection in chat; the main model is used when unset
+    CLAIM_DETECTION_MODEL: Optional[str] = None
+    CLAIM_DETECTION_CACHE_SIZE: int = 512
     
     OPENROUTER_API_KEY: str = ""
+    # Pooled HTTP client shared by all OpenRouter calls
+    OPENROUTER_MAX_CONNECTIONS: int = 64
+    OPENROUTER_KEEPALIVE_SECONDS: float = 60.0
+    OPENROUTER_DNS_CACHE_SECONDS: int = 300
+    OPENROUTER_CONNECT_TIMEOUT_SECONDS: float = 10.0
+    OPENROUTER_READ_TIMEOUT_SECONDS: float = 120.0
+
+    ANALYSIS_PARALLEL_SEARCH: bool = False
+    ANALYSIS_MAX_PARALLEL_QUERIES: int = 3
+
+    ANALYSIS_CACHE_ENABLED: bool = True
+    ANALYSIS_CACHE_TTL_SECONDS: int = 3600
+    ANALYSIS_CACHE_MAX_ENTRIES: int = 1000
+
+    ANALYSIS_SEMANTIC_REUSE_ENABLED: bool = False
+    ANALYSIS_SEMANTIC_REUSE_THRESHOLD: float = 0.92
+    ANALYSIS_SINGLE_FLIGHT_ENABLED: bool = True
+
+    BATCH_ANALYSIS_WORKERS: int = 4
+    BATCH_ANALYSIS_CLAIM_TIMEOUT_SECONDS: float = 180.0
+    # Time kept back from the analysis deadline for storing the result before the hard timeout
+    BATCH_ANALYSIS_PERSIST_MARGIN_SECONDS: float = 10.0
+
+    ANALYSIS_WRITE_BEHIND: bool = True
+
+    ANALYSIS_PROMPT_MAX_TOKENS: int = 6000
+    ANALYSIS_PROMPT_MIN_SOURCE_CREDIBILITY: float = 0.2
+
+    # Completion caps: an agent turn gets this many tokens per search request it may make
+    ANALYSIS_AGENT_TURN_MAX_TOKENS_PER_QUERY: int = 160
+    ANALYSIS_VERDICT_MAX_TOKENS: int = 2048
+    # Ask the backend for a JSON object for the verdict; only for models that support response_format
+    ANALYSIS_VERDICT_JSON_MODE: bool = False
+
+    # When to stop searching: "quality" (independent credible sources that agree) or "count" (any N sources)
+    ANALYSIS_SUFFICIENCY_POLICY: str = "quality"
+    ANALYSIS_SUFFICIENCY_MIN_SOURCES: int = 8
+    ANALYSIS_SUFFICIENCY_MIN_INDEPENDENT_SOURCES: int = 3
+    ANALYSIS_SUFFICIENCY_MIN_CREDIBILITY: float = 0.6
+    ANALYSIS_SUFFICIENCY_MIN_AGREEMENT: float = 0.75
+
+    # Per-request budget when the caller does not send X-Analysis-Deadline-Ms; unset means no deadline
+    ANALYSIS_DEFAULT_DEADLINE_MS: Optional[int] = None
+    ANALYSIS_VERDICT_RESERVE_SECONDS: float = 5.0
 
     AUTH0_DOMAIN: str = "dev-biaz2wvxnngf4umq.us.auth0.com"
     AUTH0_AUDIENCE: str = "https://wahrify-backend-xei2aqlqeq-ew.a.run.app"
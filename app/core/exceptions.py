@@ -2,6 +2,8 @@
 Core exceptions
 """
 
+from typing import Optional
+
 
 class NotFoundException(Exception):
     """Raised when an entity is not found in the database."""
@@ -64,3 +66,47 @@ class InvalidMessageTypeError(Exception):
     """Raised when an invalid message type is provided."""
 
     pass
+
+
+"""
+LLM exceptions
+"""
+
+
+class MalformedLLMOutputError(Exception):
+    """Raised when an LLM response does not follow the requested output format."""
+
+    pass
+
+
+class LLMProviderError(Exception):
+    """Raised when an LLM provider's API rejects or fails a request."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None, retry_after: Optional[str] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        # Raw ``Retry-After`` header, in seconds or as an HTTP date
+        self.retry_after = retry_after
+
+
+"""
+External service exceptions
+"""
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose circuit breaker is open."""
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"{name} is unavailable, retrying in {retry_in:.0f}s")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class SearchAPIError(Exception):
+    """Raised when the web search API rejects or fails a request."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None, retry_after: Optional[str] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
@@ -0,0 +1,183 @@
+"""Simulated LLM provider for load testing without paying for real model calls."""
+import asyncio
+import hashlib
+import json
+import random
+import re
+from datetime import UTC, datetime
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
+from app.core.config import Settings
+from app.core.exceptions import LLMProviderError
+from app.core.llm.interfaces import LLMProvider
+from app.core.llm.messages import Message, Response, ResponseChunk
+from app.core.llm.prompts import AnalysisPrompt
+
+# Roughly one token per chunk, like the real providers stream them
+_CHUNK_CHARS = 4
+_STATEMENT_PATTERN = re.compile(r"(?:Statement|L’affirmation)\s*:\s*(.+)")
+_MAX_QUERIES_PATTERN = re.compile(r"(?:up to|jusqu'à) (\d+)")
+_SEARCH_ASPECTS = ("origin", "evidence", "expert assessment", "recent reporting", "statistics", "fact check")
+
+
+class SimulatedLatency:
+    """
+    Latency model for simulated backends.
+
+    ``distribution`` is ``fixed``, ``uniform`` (``mean_ms`` give or take ``spread`` as a fraction) or
+    ``lognormal`` (median ``mean_ms`` with shape ``spread``, for the long tail real APIs have).
+    Draws come from a seeded generator, so a run with the same seed and call order is repeatable.
+    """
+
+    def __init__(self, distribution: str, spread: float, seed: int):
+        if distribution not in ("fixed", "uniform", "lognormal"):
+            raise ValueError(f"Unknown latency distribution: {distribution}")
+        self._distribution = distribution
+        self._spread = spread
+        self.random = random.Random(seed)
+
+    def sample(self, mean_ms: float) -> float:
+        """Draw one delay, in seconds, around ``mean_ms``."""
+        if mean_ms <= 0:
+            return 0.0
+        if self._distribution == "uniform":
+            delay_ms = mean_ms * (1 + self.random.uniform(-self._spread, self._spread))
+        elif self._distribution == "lognormal":
+            delay_ms = mean_ms * self.random.lognormvariate(0.0, self._spread)
+        else:
+            delay_ms = mean_ms
+        return max(0.0, delay_ms) / 1000
+
+    def fails(self, error_rate: float) -> bool:
+        return error_rate > 0 and self.random.random() < error_rate
+
+
+def _stable_int(*parts: str) -> int:
+    return int.from_bytes(hashlib.sha256("\x00".join(parts).encode("utf-8")).digest()[:8], "big")
+
+
+class FakeLLMProvider(LLMProvider):
+    """
+    Answers the orchestrator's prompts with protocol-correct canned responses.
+
+    The reply is worked out from the messages alone, so one instance can serve any number of
+    concurrent analyses: an agent turn gets ``REASON:/SEARCH:`` lines until ``search_turns``
+    searches have been made and then ``READY`` (``PRÊT`` in French), the verdict prompt gets the
+    JSON verdict, and claim detection and score extraction get their JSON shapes. Scores and
+    queries are derived from a hash of the claim, so the same claim always gets the same verdict.
+
+    Time to first token and the token rate follow the configured latency distribution, and a
+    fraction of calls fail before their first token with a 503, a 429 carrying ``Retry-After``,
+    or a timeout, to exercise the retry, breaker and rate limiting paths.
+    """
+
+    def __init__(self, settings: Settings, model: Optional[str] = None):
+        self.model = model or "fake-llm"
+        self._first_token_ms = settings.FAKE_LLM_FIRST_TOKEN_MS
+        self._tokens_per_second = settings.FAKE_LLM_TOKENS_PER_SECOND
+        self._error_rate = settings.FAKE_LLM_ERROR_RATE
+        self._search_turns = settings.FAKE_LLM_SEARCH_TURNS
+        self._latency = SimulatedLatency(
+            settings.FAKE_LATENCY_DISTRIBUTION, settings.FAKE_LATENCY_SPREAD, settings.FAKE_SEED
+        )
+
+    def _reply(self, messages: List[Message]) -> str:
+        task, last = messages[0].content, messages[-1].content
+
+        if AnalysisPrompt.GET_VERACITY in last or AnalysisPrompt.GET_VERACITY_FR in last:
+            return self._verdict(task)
+        if last.startswith("Determine if the following message contains verifiable claims"):
+            claim = last.split("Message:", 1)[-1].split("\n\n", 1)[0].strip()
+            return json.dumps({"has_claim": bool(claim), "claims": [claim] if claim else [], "confidence": 0.9})
+        if last.startswith("Extract the veracity and confidence scores"):
+            score = _stable_int(last) % 101
+            return json.dumps({"veracity_score": score / 100, "confidence_score": 0.8})
+        if "REASON" in task and "SEARCH" in task:
+            return self._agent_turn(task, messages)
+        return f"This is a simulated reply to: {last[:200]}"
+
+    def _agent_turn(self, task: str, messages: List[Message]) -> str:
+        french = "PRÊT" in task
+        turn = sum(1 for message in messages[1:] if message.role == "assistant" and "SEARCH" in message.content)
+        if turn >= self._search_turns:
+            return "PRÊT" if french else "READY"
+
+        statement = self._statement(task)
+        max_queries = _MAX_QUERIES_PATTERN.search(task)
+        queries_per_turn = int(max_queries.group(1)) if max_queries else 1
+        lines = []
+        for index in range(queries_per_turn):
+            aspect = _SEARCH_ASPECTS[(turn * queries_per_turn + index) % len(_SEARCH_ASPECTS)]
+            lines.append(f"REASON: I need the {aspect} behind this statement. SEARCH: {statement[:80]} {aspect}")
+        return "\n".join(lines) + "\n"
+
+    def _verdict(self, task: str) -> str:
+        statement = self._statement(task)
+        score = _stable_int(statement) % 101
+        analysis = (
+            f"Simulated analysis of the statement based on the gathered sources; "
+            f"the evidence points to a veracity of {score} out of 100."
+        )
+        return json.dumps({"veracity_score": score, "analysis": analysis}, indent=2, ensure_ascii=False)
+
+    @staticmethod
+    def _statement(task: str) -> str:
+        match = _STATEMENT_PATTERN.search(task)
+        return match.group(1).strip() if match else task.strip()[:200]
+
+    @staticmethod
+    def _limited(text: str, stop: Optional[List[str]], max_tokens: Optional[int]) -> str:
+        """Apply stop strings and the token cap the way the real APIs do; the replies are already JSON where asked."""
+        for stop_string in stop or ():
+            index = text.find(stop_string)
+            if index != -1:
+                text = text[:index]
+        return text[: max_tokens * _CHUNK_CHARS] if max_tokens else text
+
+    async def _before_first_token(self, timeout: Optional[float]) -> None:
+        delay = self._latency.sample(self._first_token_ms)
+        if self._latency.fails(self._error_rate):
+            failure = self._latency.random.choice(("unavailable", "rate_limited", "timeout"))
+            await asyncio.sleep(delay / 2)
+            if failure == "unavailable":
+                raise LLMProviderError("Simulated provider error", status_code=503)
+            if failure == "rate_limited":
+                raise LLMProviderError("Simulated rate limit", status_code=429, retry_after="1")
+            raise TimeoutError("Simulated provider timeout")
+        if timeout and delay > timeout:
+            await asyncio.sleep(timeout)
+            raise TimeoutError(f"Simulated provider timed out after {timeout}s")
+        await asyncio.sleep(delay)
+
+    def _token_delay(self) -> float:
+        return self._latency.sample(1000 / self._tokens_per_second) if self._tokens_per_second > 0 else 0.0
+
+    async def generate_response(
+        self,
+        messages: List[Message],
+        temperature: float = 0.7,
+        timeout: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> Response:
+        text = self._limited(self._reply(messages), stop, max_tokens)
+        await self._before_first_token(timeout)
+        await asyncio.sleep(sum(self._token_delay() for _ in range(0, len(text), _CHUNK_CHARS)))
+        return Response(text=text, confidence_score=1.0, created_at=datetime.now(UTC), metadata={"model": self.model})
+
+    async def generate_stream(
+        self,
+        messages: List[Message],
+        temperature: float = 0.7,
+        timeout: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> AsyncGenerator[ResponseChunk, None]:
+        text = self._limited(self._reply(messages), stop, max_tokens)
+        await self._before_first_token(timeout)
+        for start in range(0, len(text), _CHUNK_CHARS):
+            yield ResponseChunk(text=text[start : start + _CHUNK_CHARS], is_complete=False, metadata={})
+            await asyncio.sleep(self._token_delay())
+        yield ResponseChunk(text="", is_complete=True, metadata={"model": self.model})
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator, List
+from typing import Any, AsyncGenerator, Dict, List, Optional
 from app.core.llm.messages import Message, Response, ResponseChunk
 
 
@@ -7,13 +7,84 @@ class LLMProvider(ABC):
     """Abstract base class for LLM providers"""
 
     @abstractmethod
-    async def generate_response(self, messages: List[Message], temperature: float = 0.7) -> Response:
-        """Generate a complete response"""
+    async def generate_response(
+        self,
+        messages: List[Message],
+        temperature: float = 0.7,
+        timeout: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> Response:
+        """
+        Generate a complete response, giving up after ``timeout`` seconds if set.
+
+        Generation ends at the first of the ``stop`` strings, which is left out of the text, or after
+        ``max_tokens`` completion tokens. ``response_format`` is passed on as in the OpenAI API, e.g.
+        ``{"type": "json_object"}``. Options left as None keep the provider's defaults.
+        """
         pass
 
     @abstractmethod
     async def generate_stream(
-        self, messages: List[Message], temperature: float = 0.7
+        self,
+        messages: List[Message],
+        temperature: float = 0.7,
+        timeout: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
     ) -> AsyncGenerator[ResponseChunk, None]:
-        """Generate a streaming response"""
+        """Generate a streaming response, giving up after ``timeout`` seconds if set (options as above)"""
         pass
+
+    async def start(self) -> None:
+        """Open long-lived resources such as connection pools; called once at application startup"""
+
+    async def close(self) -> None:
+        """Release what ``start`` opened; called once at shutdown"""
+
+    async def refresh_credentials(self, margin_seconds: float) -> None:
+        """Renew credentials that expire within ``margin_seconds``; called periodically in the background"""
+
+
+def forwarded_options(
+    temperature: Optional[float],
+    timeout: Optional[float],
+    stop: Optional[List[str]],
+    max_tokens: Optional[int],
+    response_format: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    The keyword arguments a wrapper passes on to the provider(s) it wraps.
+
+    Options the caller left as None are dropped, so every provider keeps its own defaults for them.
+    """
+    options = dict(temperature=temperature, stop=stop, max_tokens=max_tokens, response_format=response_format)
+    return {"timeout": timeout, **{name: value for name, value in options.items() if value is not None}}
+
+
+class ForwardingLLMProvider(LLMProvider):
+    """
+    Base for wrappers that add behaviour around a single provider and forward calls to it.
+
+    The wrapped provider is exposed as ``wrapped``, so code that needs the innermost provider can
+    unwrap the chain, and the lifecycle hooks are passed straight through.
+    """
+
+    def __init__(self, provider: LLMProvider):
+        self._provider = provider
+        self.model = getattr(provider, "model", None) or getattr(provider, "model_id", None) or type(provider).__name__
+
+    @property
+    def wrapped(self) -> LLMProvider:
+        return self._provider
+
+    async def start(self) -> None:
+        await self._provider.start()
+
+    async def close(self) -> None:
+        await self._provider.close()
+
+    async def refresh_credentials(self, margin_seconds: float) -> None:
+        await self._provider.refresh_credentials(margin_seconds)
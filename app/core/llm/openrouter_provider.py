@@ -1,28 +1,71 @@
 """OpenRouter LLM Provider implementation."""
 import logging
-from typing import List, AsyncGenerator, Dict, Any
+from typing import List, AsyncGenerator, Dict, Any, Optional
 import aiohttp
 import json
 from datetime import datetime
 from app.core.llm.interfaces import LLMProvider
 from app.core.llm.messages import Message, Response, ResponseChunk
 from app.core.config import Settings
+from app.core.exceptions import LLMProviderError
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_TOKENS = 4096
+
 
 class OpenRouterProvider(LLMProvider):
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, model: Optional[str] = None):
         self.api_key = getattr(settings, 'OPENROUTER_API_KEY', None)
         if not self.api_key:
             raise ValueError("OPENROUTER_API_KEY not found in settings")
         
         self.api_url = "https://openrouter.ai/api/v1/chat/completions"
-        self.model = "meta-llama/llama-3.1-70b-instruct"  # Using Llama 3.1 70B
+        self.model = model or "meta-llama/llama-3.1-70b-instruct"  # Using Llama 3.1 70B
+        self._max_connections = settings.OPENROUTER_MAX_CONNECTIONS
+        self._keepalive_seconds = settings.OPENROUTER_KEEPALIVE_SECONDS
+        self._dns_cache_seconds = settings.OPENROUTER_DNS_CACHE_SECONDS
+        self._connect_timeout = settings.OPENROUTER_CONNECT_TIMEOUT_SECONDS
+        self._read_timeout = settings.OPENROUTER_READ_TIMEOUT_SECONDS
+        self._session: Optional[aiohttp.ClientSession] = None
         logger.info(f"✅ OpenRouter provider initialized with model: {self.model}")
+
+    async def start(self) -> None:
+        self._get_session()
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the pooled session, opening it on first use.
+
+        Every call shares its keep-alive connections and cached DNS lookups, so only the first
+        request to openrouter.ai pays for the handshake. Normally opened in the app lifespan; the
+        lazy path covers scripts and workers that use the provider without it.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._max_connections,
+                keepalive_timeout=self._keepalive_seconds,
+                ttl_dns_cache=self._dns_cache_seconds,
+            )
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self._client_timeout())
+        return self._session
+
+    def _client_timeout(self, total: Optional[float] = None) -> aiohttp.ClientTimeout:
+        return aiohttp.ClientTimeout(total=total, sock_connect=self._connect_timeout, sock_read=self._read_timeout)
     
     async def generate_response(
-        self, messages: List[Message], temperature: float = 0.0, max_tokens: int = 4096
+        self,
+        messages: List[Message],
+        temperature: float = 0.0,
+        timeout: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
     ) -> Response:
         """Generate a non-streaming response."""
         headers = {
@@ -34,33 +77,48 @@ class OpenRouterProvider(LLMProvider):
             "model": self.model,
             "messages": [{"role": msg.role, "content": msg.content} for msg in messages],
             "temperature": temperature,
-            "max_tokens": max_tokens,
+            "max_tokens": max_tokens or DEFAULT_MAX_TOKENS,
             "stream": False
         }
+        payload.update(self._optional_params(stop, response_format))
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.api_url, headers=headers, json=payload) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"OpenRouter API error: {error_text}")
-                        raise Exception(f"OpenRouter API error: {error_text}")
-                    
-                    data = await response.json()
-                    content = data['choices'][0]['message']['content']
-                    return Response(
-                        text=content,
-                        confidence_score=1.0,
-                        created_at=datetime.utcnow(),
-                        metadata={'model': self.model}
+            async with self._get_session().post(
+                self.api_url, headers=headers, json=payload, **self._timeout_kwargs(timeout)
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"OpenRouter API error: {error_text}")
+                    raise LLMProviderError(
+                        f"OpenRouter API error: {error_text}",
+                        status_code=response.status,
+                        retry_after=response.headers.get("Retry-After"),
                     )
-                    
+
+                data = await response.json()
+                content = data['choices'][0]['message']['content']
+                metadata = {'model': self.model}
+                if data.get('usage'):
+                    metadata['usage'] = data['usage']
+                return Response(
+                    text=content,
+                    confidence_score=1.0,
+                    created_at=datetime.utcnow(),
+                    metadata=metadata
+                )
+
         except Exception as e:
             logger.error(f"Error in OpenRouter generate_response: {str(e)}", exc_info=True)
             raise
     
     async def generate_stream(
-        self, messages: List[Message], temperature: float = 0.0, max_tokens: int = 4096
+        self,
+        messages: List[Message],
+        temperature: float = 0.0,
+        timeout: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
     ) -> AsyncGenerator[ResponseChunk, None]:
         """Generate a streaming response."""
         headers = {
@@ -72,35 +130,59 @@ class OpenRouterProvider(LLMProvider):
             "model": self.model,
             "messages": [{"role": msg.role, "content": msg.content} for msg in messages],
             "temperature": temperature,
-            "max_tokens": max_tokens,
-            "stream": True
+            "max_tokens": max_tokens or DEFAULT_MAX_TOKENS,
+            "stream": True,
+            # Ask for token counts in the last event, which plain streaming leaves out
+            "usage": {"include": True}
         }
+        payload.update(self._optional_params(stop, response_format))
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.api_url, headers=headers, json=payload) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"OpenRouter API error: {error_text}")
-                        raise Exception(f"OpenRouter API error: {error_text}")
-                    
-                    async for line in response.content:
-                        if line:
-                            line_text = line.decode('utf-8').strip()
-                            if line_text.startswith('data: '):
-                                data_str = line_text[6:]
-                                if data_str == '[DONE]':
-                                    yield ResponseChunk(text="", is_complete=True, metadata={})
-                                else:
-                                    try:
-                                        data = json.loads(data_str)
-                                        if 'choices' in data and len(data['choices']) > 0:
-                                            delta = data['choices'][0].get('delta', {})
-                                            if 'content' in delta:
-                                                yield ResponseChunk(text=delta['content'], is_complete=False, metadata={})
-                                    except json.JSONDecodeError:
-                                        logger.warning(f"Failed to parse streaming data: {data_str}")
-                                        
+            async with self._get_session().post(
+                self.api_url, headers=headers, json=payload, **self._timeout_kwargs(timeout)
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"OpenRouter API error: {error_text}")
+                    raise LLMProviderError(
+                        f"OpenRouter API error: {error_text}",
+                        status_code=response.status,
+                        retry_after=response.headers.get("Retry-After"),
+                    )
+
+                usage = None
+                async for line in response.content:
+                    if line:
+                        line_text = line.decode('utf-8').strip()
+                        if line_text.startswith('data: '):
+                            data_str = line_text[6:]
+                            if data_str == '[DONE]':
+                                metadata = {'model': self.model, 'usage': usage} if usage else {}
+                                yield ResponseChunk(text="", is_complete=True, metadata=metadata)
+                            else:
+                                try:
+                                    data = json.loads(data_str)
+                                    usage = data.get('usage') or usage
+                                    if 'choices' in data and len(data['choices']) > 0:
+                                        delta = data['choices'][0].get('delta', {})
+                                        if 'content' in delta:
+                                            yield ResponseChunk(text=delta['content'], is_complete=False, metadata={})
+                                except json.JSONDecodeError:
+                                    logger.warning(f"Failed to parse streaming data: {data_str}")
+
         except Exception as e:
             logger.error(f"Error in OpenRouter generate_stream: {str(e)}", exc_info=True)
-            raise
\ No newline at end of file
+            raise
+
+    @staticmethod
+    def _optional_params(stop: Optional[List[str]], response_format: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        params: Dict[str, Any] = {}
+        if stop:
+            params["stop"] = stop
+        if response_format:
+            params["response_format"] = response_format
+        return params
+
+    def _timeout_kwargs(self, timeout: Optional[float]) -> Dict[str, Any]:
+        """Per-request overall timeout for aiohttp; without one the session's connect/read timeouts apply."""
+        return {"timeout": self._client_timeout(total=timeout)} if timeout else {}
@@ -32,6 +32,37 @@ class AnalysisPrompt:
 
         """
 
+    ORCHESTRATOR_MULTI_QUERY_PROMPT = """
+        You have access to a search engine tool. You may request up to {max_queries} independent searches at once; they
+        will be run in parallel. For each search, write one line beginning with the phrase "REASON: " explaining why
+        you need it, followed on the same line by the phrase "SEARCH: " and the query. Choose queries that cover
+        different aspects of the statement so that their results do not overlap. After the results come back you may
+        request further searches in the same format if something is still unclear. Today is {date}. Your task is to
+        analyze the factuality of the given statement (for today's date) and state a score from 0 to 100, where 0
+        represents definitively false and 100 represents definitively true.
+        When you have finished conducting all searches, your only message should be "READY".
+        There should be no extra text. You must then wait for the User to specify their desired output format.
+        "REASON: " and "SEARCH: " should only be used when invoking the search tool and must not appear in any other context.
+
+        Statement: {statement}
+
+        """
+
+    ORCHESTRATOR_MULTI_QUERY_PROMPT_FR = """ Vous avez accès à un moteur de recherche. Vous pouvez demander jusqu'à {max_queries} recherches
+        indépendantes à la fois ; elles seront exécutées en parallèle. Pour chaque recherche, écrivez une ligne commençant par la phrase
+        "REASON : " expliquant pourquoi vous en avez besoin, suivie sur la même ligne de la phrase "SEARCH : " et de la requête.
+        Choisissez des requêtes qui couvrent différents aspects de l'affirmation afin que leurs résultats ne se recoupent pas.
+        Après avoir reçu les résultats, vous pouvez demander d'autres recherches dans le même format si quelque chose reste incertain.
+        Aujourd’hui, nous sommes le {date}. Votre tâche consiste à analyser la véracité de l'affirmation donnée (pour la date
+        d’aujourd’hui) et à indiquer un index de 0 à 100, où 0 représente définitivement faux et 100 représente définitivement vrai.
+        Lorsque vous avez terminé d'effectuer toutes les recherches, votre seul message devrait être "PRÊT".
+        Il ne doit pas y avoir de texte supplémentaire. Vous devez ensuite attendre que l'utilisateur spécifie le format de sortie souhaité.
+        "REASON : " et "SEARCH : " doivent seulement être utilisées lors de l’invocation du moteur de recherche et ne doivent pas apparaître dans d’autres contextes.
+
+        L’affirmation : {statement}
+
+        """
+
     GET_VERACITY = """
 
     "After providing all your analysis steps, summarize your analysis and state a score from 0 to 100,
@@ -64,6 +95,10 @@ class AnalysisPrompt:
 
     """
 
+    VERDICT_SOURCES = "Sources gathered across all searches:"
+
+    VERDICT_SOURCES_FR = "Sources recueillies lors de toutes les recherches :"
+
     IDEAL_PROMPT = """
         After providing all your analysis steps, summarize your analysis and and state “Factuality: ” and a score from 0 to 1,
         where 0 represents definitively false and 100 represents definitively true. You should begin your summary with the phrase ”Summary:
@@ -99,21 +134,23 @@ class AnalysisPrompt:
 
     CLAIM_ANALYSIS_FRENCH = """I Can't"""
 
-    CLAIM_DETECTION = """Determine if the following message contains a verifiable claim:
+    CLAIM_DETECTION = """Determine if the following message contains verifiable claims that could be fact-checked:
 
         Message: {message}
 
-        If a claim is found, extract and respond with the claim in JSON format:
+        If claims are found, extract each one as a separate, self-contained statement and respond in JSON format:
         {{
             "has_claim": true,
-            "claim": "extracted claim",
+            "claims": ["first extracted claim", "second extracted claim"],
             "confidence": float
         }}
 
         If no claim is found, respond with:
         {{
             "has_claim": false,
-            "claim": null,
+            "claims": [],
             "confidence": 0.0
         }}
+
+        Respond with the JSON object only.
         """
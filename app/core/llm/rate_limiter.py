@@ -0,0 +1,233 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, AsyncGenerator, AsyncIterator, Deque, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.llm.interfaces import ForwardingLLMProvider, LLMProvider, forwarded_options
+from app.core.llm.messages import Message, Response, ResponseChunk
+from app.core.llm.tokens import count_message_tokens, get_token_counter
+from app.core.utils.resilience import retry_after_seconds
+
+logger = logging.getLogger(__name__)
+
+
+class _TokenBucket:
+    """Refills continuously up to ``capacity`` per minute; the level may go negative to repay underestimates."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.level = per_minute
+        self._rate = per_minute / 60.0
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def wait_time(self, amount: float) -> float:
+        self._refill()
+        return max(0.0, (min(amount, self.capacity) - self.level) / self._rate)
+
+    def take(self, amount: float) -> None:
+        self._refill()
+        self.level -= amount
+
+
+class LLMRateLimiter:
+    """
+    Keep one provider account under its request, token and concurrency limits.
+
+    Callers are admitted strictly in arrival order: the head of the queue waits for an in-flight
+    slot, then for the request and token budgets to refill, and only then lets the next caller in.
+    Token use is reserved up front from an estimate and settled against the real size of the
+    response afterwards. A 429 with ``Retry-After`` pauses admission for everyone until it expires,
+    rather than letting every queued caller hit the same wall. A limit of 0 disables that check.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        max_in_flight: int = 0,
+        wait_window: int = 1000,
+    ):
+        self.name = name
+        self._requests = _TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self._tokens = _TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self._slots = asyncio.Semaphore(max_in_flight) if max_in_flight > 0 else None
+        self._max_in_flight = max_in_flight
+        # asyncio.Lock wakes waiters in FIFO order, which is what makes admission fair
+        self._admission = asyncio.Lock()
+        self._paused_until = 0.0
+        self._waits: Deque[float] = deque(maxlen=wait_window)
+        self.in_flight = 0
+        self.queued = 0
+        self.admitted = 0
+        self.throttled = 0
+
+    @asynccontextmanager
+    async def slot(self, estimated_tokens: int = 0) -> AsyncIterator["_Reservation"]:
+        """Wait for admission, hold an in-flight slot for the duration of the block."""
+        queued_at = time.monotonic()
+        self.queued += 1
+        try:
+            async with self._admission:
+                if self._slots is not None:
+                    await self._slots.acquire()
+                try:
+                    await self._wait_for_budget(estimated_tokens)
+                except BaseException:
+                    if self._slots is not None:
+                        self._slots.release()
+                    raise
+        finally:
+            self.queued -= 1
+
+        self._waits.append(time.monotonic() - queued_at)
+        self.admitted += 1
+        self.in_flight += 1
+        reservation = _Reservation(self, estimated_tokens)
+        try:
+            yield reservation
+        finally:
+            self.in_flight -= 1
+            if self._slots is not None:
+                self._slots.release()
+
+    async def _wait_for_budget(self, estimated_tokens: int) -> None:
+        while True:
+            delay = self._paused_until - time.monotonic()
+            if self._requests is not None:
+                delay = max(delay, self._requests.wait_time(1))
+            if self._tokens is not None:
+                delay = max(delay, self._tokens.wait_time(estimated_tokens))
+            if delay <= 0:
+                break
+            await asyncio.sleep(delay)
+
+        if self._requests is not None:
+            self._requests.take(1)
+        if self._tokens is not None:
+            self._tokens.take(estimated_tokens)
+
+    def settle(self, reserved_tokens: int, actual_tokens: int) -> None:
+        if self._tokens is not None:
+            self._tokens.take(actual_tokens - reserved_tokens)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back new calls for ``seconds``, as a provider's ``Retry-After`` asks."""
+        until = time.monotonic() + seconds
+        if until > self._paused_until:
+            self._paused_until = until
+            self.throttled += 1
+            logger.warning(f"LLM provider {self.name} asked to back off, pausing calls for {seconds:.1f}s")
+
+    def stats(self) -> Dict[str, Any]:
+        waits = sorted(self._waits)
+        return {
+            "in_flight": self.in_flight,
+            "max_in_flight": self._max_in_flight or None,
+            "queued": self.queued,
+            "admitted": self.admitted,
+            "throttled": self.throttled,
+            "paused_seconds": round(max(0.0, self._paused_until - time.monotonic()), 1),
+            "queue_wait_ms_p50": round(waits[len(waits) // 2] * 1000, 1) if waits else None,
+            "queue_wait_ms_p95": round(waits[int(0.95 * (len(waits) - 1))] * 1000, 1) if waits else None,
+            "queue_wait_ms_max": round(waits[-1] * 1000, 1) if waits else None,
+            "request_budget": round(self._requests.level, 1) if self._requests is not None else None,
+            "token_budget": round(self._tokens.level) if self._tokens is not None else None,
+        }
+
+
+class _Reservation:
+    def __init__(self, limiter: LLMRateLimiter, reserved_tokens: int):
+        self._limiter = limiter
+        self._reserved_tokens = reserved_tokens
+
+    def settle(self, actual_tokens: int) -> None:
+        self._limiter.settle(self._reserved_tokens, actual_tokens)
+        self._reserved_tokens = actual_tokens
+
+
+class RateLimitedLLMProvider(ForwardingLLMProvider):
+    """
+    Wrap a provider so every call goes through its account's ``LLMRateLimiter``.
+
+    A call reserves its prompt size plus ``expected_output_tokens`` and is settled against the
+    prompt plus what actually came back. A stream holds its in-flight slot until it ends.
+    """
+
+    def __init__(self, provider: LLMProvider, limiter: LLMRateLimiter, expected_output_tokens: int = 512):
+        super().__init__(provider)
+        self._limiter = limiter
+        self._expected_output_tokens = expected_output_tokens
+        self._count = get_token_counter()
+
+    def _note_error(self, error: BaseException) -> None:
+        retry_after = retry_after_seconds(error)
+        if retry_after is not None:
+            self._limiter.pause(retry_after)
+
+    def _expected_output(self, max_tokens: Optional[int]) -> int:
+        # A call capped below the usual expectation cannot use more than its cap
+        return min(self._expected_output_tokens, max_tokens) if max_tokens else self._expected_output_tokens
+
+    async def generate_response(
+        self,
+        messages: List[Message],
+        temperature: Optional[float] = None,
+        timeout: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> Response:
+        kwargs = forwarded_options(temperature, timeout, stop, max_tokens, response_format)
+        prompt_tokens = count_message_tokens(messages, self._count)
+        async with self._limiter.slot(prompt_tokens + self._expected_output(max_tokens)) as reservation:
+            try:
+                response = await self._provider.generate_response(messages, **kwargs)
+            except Exception as e:
+                self._note_error(e)
+                raise
+            reservation.settle(prompt_tokens + self._count(response.text))
+            return response
+
+    async def generate_stream(
+        self,
+        messages: List[Message],
+        temperature: Optional[float] = None,
+        timeout: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> AsyncGenerator[ResponseChunk, None]:
+        kwargs = forwarded_options(temperature, timeout, stop, max_tokens, response_format)
+        prompt_tokens = count_message_tokens(messages, self._count)
+        async with self._limiter.slot(prompt_tokens + self._expected_output(max_tokens)) as reservation:
+            parts: List[str] = []
+            try:
+                async for chunk in self._provider.generate_stream(messages, **kwargs):
+                    parts.append(chunk.text)
+                    yield chunk
+            except Exception as e:
+                self._note_error(e)
+                raise
+            finally:
+                reservation.settle(prompt_tokens + self._count("".join(parts)))
+
+
+@lru_cache()
+def get_llm_rate_limiter(name: str) -> LLMRateLimiter:
+    """The limiter for one provider account, shared by every model and caller that uses it."""
+    return LLMRateLimiter(
+        name,
+        requests_per_minute=settings.LLM_RATE_LIMIT_REQUESTS_PER_MINUTE,
+        tokens_per_minute=settings.LLM_RATE_LIMIT_TOKENS_PER_MINUTE,
+        max_in_flight=settings.LLM_RATE_LIMIT_MAX_IN_FLIGHT,
+    )
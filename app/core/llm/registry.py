@@ -0,0 +1,59 @@
+import asyncio
+import logging
+from typing import Callable, Dict, Iterable, Optional
+
+from app.core.llm.interfaces import LLMProvider
+
+logger = logging.getLogger(__name__)
+
+ProviderFactory = Callable[[Optional[str]], LLMProvider]
+
+
+class LLMProviderRegistry:
+    """
+    The process's LLM providers, one per model, built once and shared by every request.
+
+    ``start`` builds the configured providers at application startup and runs a background task
+    that renews provider credentials shortly before they expire, so no request ever waits on a
+    token refresh. A model that was not built at startup is built on first use.
+    """
+
+    def __init__(self, factory: ProviderFactory, refresh_margin_seconds: float, refresh_interval_seconds: float):
+        self._factory = factory
+        self._refresh_margin_seconds = refresh_margin_seconds
+        self._refresh_interval_seconds = refresh_interval_seconds
+        self._providers: Dict[Optional[str], LLMProvider] = {}
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def get(self, model: Optional[str] = None) -> LLMProvider:
+        """Return the provider for ``model``, or for the default model when it is None."""
+        provider = self._providers.get(model)
+        if provider is None:
+            provider = self._providers[model] = self._factory(model)
+        return provider
+
+    async def start(self, models: Iterable[Optional[str]] = (None,)) -> None:
+        for model in dict.fromkeys(models):
+            await self.get(model).start()
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_loop(), name="llm-credential-refresh")
+        logger.info(f"Started {len(self._providers)} LLM providers")
+
+    async def close(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            await asyncio.gather(self._refresh_task, return_exceptions=True)
+            self._refresh_task = None
+        for provider in self._providers.values():
+            await provider.close()
+        self._providers.clear()
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            for model, provider in list(self._providers.items()):
+                try:
+                    await provider.refresh_credentials(self._refresh_margin_seconds)
+                except Exception as e:
+                    # Requests still refresh on demand if this keeps failing
+                    logger.error(f"Background credential refresh failed for model {model or 'default'}: {str(e)}")
+            await asyncio.sleep(self._refresh_interval_seconds)
@@ -0,0 +1,70 @@
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
+
+from app.core.llm.interfaces import ForwardingLLMProvider, LLMProvider, forwarded_options
+from app.core.llm.messages import Message, Response, ResponseChunk
+from app.core.utils.resilience import ResiliencePolicy, is_transient_error
+
+
+class ResilientLLMProvider(ForwardingLLMProvider):
+    """
+    Wrap a provider so transient failures are retried and a failing backend is short-circuited.
+
+    Generating a completion has no side effects, so a response can always be retried. A stream is
+    only retried until its first chunk arrives; after that the consumer has already seen output,
+    and a failure is passed on (and still counted by the breaker).
+    """
+
+    def __init__(self, provider: LLMProvider, policy: ResiliencePolicy):
+        super().__init__(provider)
+        self._policy = policy
+
+    async def generate_response(
+        self,
+        messages: List[Message],
+        temperature: Optional[float] = None,
+        timeout: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> Response:
+        async def attempt(attempt_timeout: Optional[float]) -> Response:
+            kwargs = forwarded_options(temperature, attempt_timeout, stop, max_tokens, response_format)
+            return await self._provider.generate_response(messages, **kwargs)
+
+        return await self._policy.call(attempt, timeout)
+
+    async def generate_stream(
+        self,
+        messages: List[Message],
+        temperature: Optional[float] = None,
+        timeout: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> AsyncGenerator[ResponseChunk, None]:
+        async def attempt(
+            attempt_timeout: Optional[float],
+        ) -> Tuple[AsyncGenerator[ResponseChunk, None], Optional[ResponseChunk]]:
+            kwargs = forwarded_options(temperature, attempt_timeout, stop, max_tokens, response_format)
+            stream = self._provider.generate_stream(messages, **kwargs)
+            try:
+                return stream, await stream.__anext__()
+            except StopAsyncIteration:
+                return stream, None
+            except BaseException:
+                await stream.aclose()
+                raise
+
+        stream, first_chunk = await self._policy.call(attempt, timeout)
+        try:
+            if first_chunk is None:
+                return
+            yield first_chunk
+            async for chunk in stream:
+                yield chunk
+        except Exception as e:
+            if is_transient_error(e):
+                self._policy.breaker.record_failure()
+            raise
+        finally:
+            await stream.aclose()
@@ -0,0 +1,285 @@
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.llm.interfaces import ForwardingLLMProvider, LLMProvider, forwarded_options
+from app.core.llm.messages import Message, Response, ResponseChunk
+
+logger = logging.getLogger(__name__)
+
+# Cached text is replayed in pieces so streaming consumers still see incremental chunks
+_REPLAY_CHUNK_CHARS = 64
+
+
+@dataclass
+class CachedResponse:
+    text: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    stored_at: float = 0.0
+
+
+class _SqliteResponseStore:
+    """On-disk tier: one SQLite table, least recently used rows pruned past ``max_entries``."""
+
+    def __init__(self, path: str, max_entries: int):
+        self._path = path
+        self._max_entries = max_entries
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_responses "
+                "(key TEXT PRIMARY KEY, text TEXT NOT NULL, metadata TEXT NOT NULL, "
+                "stored_at REAL NOT NULL, used_at REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self._path, timeout=5.0)
+
+    def get(self, key: str, ttl_seconds: float) -> Optional[CachedResponse]:
+        now = time.time()
+        with self._connect() as db:
+            row = db.execute("SELECT text, metadata, stored_at FROM llm_responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if now - row[2] > ttl_seconds:
+                db.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                return None
+            db.execute("UPDATE llm_responses SET used_at = ? WHERE key = ?", (now, key))
+        return CachedResponse(text=row[0], metadata=json.loads(row[1]), stored_at=row[2])
+
+    def put(self, key: str, response: CachedResponse) -> None:
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, text, metadata, stored_at, used_at) VALUES (?, ?, ?, ?, ?)",
+                (key, response.text, json.dumps(response.metadata, default=str), response.stored_at, time.time()),
+            )
+            db.execute(
+                "DELETE FROM llm_responses WHERE key IN "
+                "(SELECT key FROM llm_responses ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                (self._max_entries,),
+            )
+
+
+class LLMResponseCache:
+    """
+    Content-addressed store of LLM responses: an in-memory LRU in front of an optional SQLite file.
+
+    Entries are keyed on a hash of everything that determines the output, so a key never needs
+    invalidating; they only age out after ``ttl_seconds`` or when a tier is over its size cap.
+    The disk tier survives restarts, which is what makes repeated benchmark runs cheap.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        disk_path: Optional[str] = None,
+        disk_max_entries: int = 0,
+    ):
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._disk = _SqliteResponseStore(disk_path, disk_max_entries) if disk_path else None
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.disk_errors = 0
+
+    @staticmethod
+    def make_key(model: str, messages: List[Message], temperature: float, **params: Any) -> str:
+        payload = {
+            "model": model,
+            "messages": [[message.role, message.content] for message in messages],
+            "temperature": temperature,
+            **params,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is not None and time.time() - entry.stored_at <= self._ttl_seconds:
+            self._entries.move_to_end(key)
+            self.memory_hits += 1
+            return entry
+        self._entries.pop(key, None)
+
+        if self._disk is not None:
+            try:
+                entry = await asyncio.to_thread(self._disk.get, key, self._ttl_seconds)
+            except sqlite3.Error as e:
+                self.disk_errors += 1
+                logger.warning(f"LLM response cache disk read failed: {str(e)}")
+                entry = None
+            if entry is not None:
+                self._remember(key, entry)
+                self.disk_hits += 1
+                return entry
+
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, text: str, metadata: Dict[str, Any]) -> None:
+        entry = CachedResponse(text=text, metadata=metadata, stored_at=time.time())
+        self._remember(key, entry)
+        self.stores += 1
+        if self._disk is not None:
+            try:
+                await asyncio.to_thread(self._disk.put, key, entry)
+            except sqlite3.Error as e:
+                self.disk_errors += 1
+                logger.warning(f"LLM response cache disk write failed: {str(e)}")
+
+    def _remember(self, key: str, entry: CachedResponse) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        hits = self.memory_hits + self.disk_hits
+        lookups = hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self._max_entries,
+            "ttl_seconds": self._ttl_seconds,
+            "disk": self._disk is not None,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "disk_errors": self.disk_errors,
+            "hit_rate": hits / lookups if lookups else 0.0,
+        }
+
+
+class CachingLLMProvider(ForwardingLLMProvider):
+    """
+    Wrap a provider so deterministic calls are answered from an ``LLMResponseCache``.
+
+    Only calls at or below ``max_temperature`` are cached, since sampled output is not meant to
+    repeat. A stream is stored once it has run to completion, and a hit is replayed as a series of
+    ``ResponseChunk``s ending with the completion chunk, like a live stream.
+    """
+
+    def __init__(self, provider: LLMProvider, cache: LLMResponseCache, max_temperature: float = 0.0):
+        super().__init__(provider)
+        self._cache = cache
+        self._max_temperature = max_temperature
+        # Callers that leave temperature out get the wrapped provider's own default, which the key must reflect;
+        # every ``ForwardingLLMProvider`` exposes the provider it forwards to as ``wrapped``
+        innermost = provider
+        while getattr(innermost, "wrapped", None) is not None:
+            innermost = innermost.wrapped
+        self._default_temperature = {
+            name: inspect.signature(getattr(innermost, name)).parameters["temperature"].default
+            for name in ("generate_response", "generate_stream")
+        }
+        # A provider that applies a default of its own, such as the router, declares it as ``default_temperature``
+        declared = getattr(innermost, "default_temperature", None)
+        if declared is not None:
+            self._default_temperature = dict.fromkeys(self._default_temperature, declared)
+        if any(default is None or default is inspect.Parameter.empty for default in self._default_temperature.values()):
+            logger.warning(
+                f"{self.model} has no fixed default temperature, so calls that leave temperature out are not cached"
+            )
+
+    def _cache_key(self, method: str, messages: List[Message], kwargs: Dict[str, Any]) -> Optional[str]:
+        options = {name: value for name, value in kwargs.items() if name not in ("temperature", "timeout")}
+        temperature = kwargs.get("temperature")
+        effective = self._default_temperature[method] if temperature is None else temperature
+        # A provider without a fixed default (such as a router with no default temperature) cannot be keyed
+        if effective is None or effective is inspect.Parameter.empty or effective > self._max_temperature:
+            return None
+        # Stop strings, token caps and output formats change the reply, so they are part of the key when set
+        return self._cache.make_key(self.model, messages, effective, **options)
+
+    async def generate_response(
+        self,
+        messages: List[Message],
+        temperature: Optional[float] = None,
+        timeout: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> Response:
+        kwargs = forwarded_options(temperature, timeout, stop, max_tokens, response_format)
+        key = self._cache_key("generate_response", messages, kwargs)
+        if key is not None:
+            cached = await self._cache.get(key)
+            if cached is not None:
+                return Response(
+                    text=cached.text,
+                    confidence_score=cached.metadata.get("confidence_score", 1.0),
+                    created_at=datetime.fromtimestamp(cached.stored_at, UTC),
+                    metadata={**cached.metadata, "cached": True},
+                )
+
+        response = await self._provider.generate_response(messages, **kwargs)
+        if key is not None:
+            await self._cache.put(
+                key, response.text, {**(response.metadata or {}), "confidence_score": response.confidence_score}
+            )
+        return response
+
+    async def generate_stream(
+        self,
+        messages: List[Message],
+        temperature: Optional[float] = None,
+        timeout: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> AsyncGenerator[ResponseChunk, None]:
+        kwargs = forwarded_options(temperature, timeout, stop, max_tokens, response_format)
+        key = self._cache_key("generate_stream", messages, kwargs)
+        if key is not None:
+            cached = await self._cache.get(key)
+            if cached is not None:
+                metadata = {**cached.metadata, "cached": True}
+                for start in range(0, len(cached.text), _REPLAY_CHUNK_CHARS):
+                    yield ResponseChunk(
+                        text=cached.text[start : start + _REPLAY_CHUNK_CHARS], is_complete=False, metadata=metadata
+                    )
+                yield ResponseChunk(text="", is_complete=True, metadata=metadata)
+                return
+
+        parts: List[str] = []
+        async for chunk in self._provider.generate_stream(messages, **kwargs):
+            if chunk.is_complete:
+                # A stream the consumer abandoned never gets here, so partial text is never stored
+                if key is not None:
+                    await self._cache.put(key, "".join(parts), dict(chunk.metadata or {}))
+            else:
+                parts.append(chunk.text)
+            yield chunk
+
+
+@lru_cache()
+def get_llm_response_cache() -> Optional[LLMResponseCache]:
+    """Process-wide LLM response cache, or None when it is disabled."""
+    if not settings.LLM_RESPONSE_CACHE_ENABLED:
+        return None
+    return LLMResponseCache(
+        max_entries=settings.LLM_RESPONSE_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.LLM_RESPONSE_CACHE_TTL_SECONDS,
+        disk_path=settings.LLM_RESPONSE_CACHE_DISK_PATH,
+        disk_max_entries=settings.LLM_RESPONSE_CACHE_DISK_MAX_ENTRIES,
+    )
@@ -0,0 +1,302 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, AsyncGenerator, Deque, Dict, List, Optional, Set, Tuple
+
+from app.core.llm.interfaces import LLMProvider, forwarded_options
+from app.core.llm.messages import Message, Response, ResponseChunk
+from app.core.utils.resilience import is_transient_error, retry_after_seconds
+
+logger = logging.getLogger(__name__)
+
+
+class _BackendStats:
+    """Rolling latency and outcome window for one backend."""
+
+    def __init__(self, window: int):
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.outcomes: Deque[bool] = deque(maxlen=window)
+        self.cooldown_until = 0.0
+
+    def record(self, ok: bool, latency: Optional[float] = None) -> None:
+        self.outcomes.append(ok)
+        if ok and latency is not None:
+            self.latencies.append(latency)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+    @property
+    def error_rate(self) -> float:
+        return self.outcomes.count(False) / len(self.outcomes) if self.outcomes else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        p50, p95 = self.percentile(0.5), self.percentile(0.95)
+        return {
+            "calls": len(self.outcomes),
+            "error_rate": round(self.error_rate, 3),
+            "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+            "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            "cooling_down": self.cooldown_until > time.monotonic(),
+        }
+
+
+class RoutingLLMProvider(LLMProvider):
+    """
+    Spread calls over several backends, preferring the fastest healthy one.
+
+    Every backend keeps a rolling window of latencies (time to the full response, or to the first
+    chunk of a stream) and outcomes. Calls go to the healthy backend with the lowest p50; a backend
+    that fails with a rate limit, 5xx, timeout or dropped connection is cooled down for a while and
+    the call fails over to the next one. A stream can only fail over before its first chunk.
+
+    With hedging on, a call that has not answered within the chosen backend's p95 is also sent to
+    the runner-up, and whichever answers first wins; the other request is cancelled.
+
+    Backends may default to different temperatures. A ``default_temperature`` is sent to whichever
+    backend answers when the caller leaves it out, so the reply does not depend on the route taken
+    (and the response cache can key it); without one, each backend keeps its own default.
+    """
+
+    def __init__(
+        self,
+        backends: List[Tuple[str, LLMProvider]],
+        window: int = 100,
+        max_error_rate: float = 0.5,
+        cooldown_seconds: float = 30.0,
+        hedge: bool = False,
+        hedge_min_delay_seconds: float = 1.0,
+        default_temperature: Optional[float] = None,
+    ):
+        if not backends:
+            raise ValueError("RoutingLLMProvider needs at least one backend")
+        self._backends = backends
+        self._max_error_rate = max_error_rate
+        self._cooldown_seconds = cooldown_seconds
+        self._hedge = hedge
+        self._hedge_min_delay_seconds = hedge_min_delay_seconds
+        self.default_temperature = default_temperature
+        self._stats: Dict[Tuple[str, str], _BackendStats] = {
+            (name, kind): _BackendStats(window) for name, _ in backends for kind in ("response", "stream")
+        }
+        self.model = "router:" + ",".join(name for name, _ in backends)
+
+    async def start(self) -> None:
+        for _, backend in self._backends:
+            await backend.start()
+
+    async def close(self) -> None:
+        for _, backend in self._backends:
+            await backend.close()
+
+    async def refresh_credentials(self, margin_seconds: float) -> None:
+        for _, backend in self._backends:
+            await backend.refresh_credentials(margin_seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        return {f"{name}.{kind}": stats.to_dict() for (name, kind), stats in self._stats.items()}
+
+    def _ranked(self, kind: str) -> List[Tuple[str, LLMProvider]]:
+        """Healthy backends by p50 (untried ones first, so they get measured), then the rest as a last resort."""
+        now = time.monotonic()
+
+        def healthy(name: str) -> bool:
+            stats = self._stats[(name, kind)]
+            return stats.cooldown_until <= now and stats.error_rate <= self._max_error_rate
+
+        def speed(name: str) -> float:
+            p50 = self._stats[(name, kind)].percentile(0.5)
+            return p50 if p50 is not None else 0.0
+
+        return sorted(self._backends, key=lambda backend: (not healthy(backend[0]), speed(backend[0])))
+
+    def _hedge_delay(self, name: str, kind: str) -> float:
+        p95 = self._stats[(name, kind)].percentile(0.95)
+        return max(self._hedge_min_delay_seconds, p95 or 0.0)
+
+    def _record_failure(self, name: str, kind: str, error: BaseException) -> None:
+        stats = self._stats[(name, kind)]
+        stats.record(ok=False)
+        if is_transient_error(error):
+            cooldown = max(self._cooldown_seconds, retry_after_seconds(error) or 0.0)
+            stats.cooldown_until = time.monotonic() + cooldown
+        logger.warning(f"LLM backend {name} failed ({type(error).__name__}: {str(error)[:200]})")
+
+    async def generate_response(
+        self,
+        messages: List[Message],
+        temperature: Optional[float] = None,
+        timeout: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> Response:
+        if temperature is None:
+            temperature = self.default_temperature
+        kwargs = forwarded_options(temperature, timeout, stop, max_tokens, response_format)
+        ranked = self._ranked("response")
+        attempted: Set[str] = set()
+        last_error: Optional[BaseException] = None
+
+        for index, (name, backend) in enumerate(ranked):
+            if name in attempted:
+                continue
+            hedge = self._hedge_candidate(ranked[index + 1 :], attempted)
+            try:
+                return await self._respond(name, backend, hedge, messages, kwargs, attempted)
+            except Exception as e:
+                last_error = e
+                if not is_transient_error(e):
+                    raise
+        raise last_error
+
+    async def _respond(
+        self,
+        name: str,
+        backend: LLMProvider,
+        hedge: Optional[Tuple[str, LLMProvider]],
+        messages: List[Message],
+        kwargs: Dict[str, Any],
+        attempted: Set[str],
+    ) -> Response:
+        async def timed(backend_name: str, provider: LLMProvider) -> Response:
+            attempted.add(backend_name)
+            started = time.monotonic()
+            try:
+                response = await provider.generate_response(messages, **kwargs)
+            except asyncio.CancelledError:
+                # Lost a hedge race: the time it had taken is a lower bound on its latency, worth keeping
+                self._stats[(backend_name, "response")].record(ok=True, latency=time.monotonic() - started)
+                raise
+            except Exception as e:
+                self._record_failure(backend_name, "response", e)
+                raise
+            self._stats[(backend_name, "response")].record(ok=True, latency=time.monotonic() - started)
+            return response
+
+        if hedge is None:
+            return await timed(name, backend)
+
+        primary = asyncio.create_task(timed(name, backend))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self._hedge_delay(name, "response"))
+            if not done:
+                logger.info(f"Hedging slow LLM call on {name} with {hedge[0]}")
+                tasks.add(asyncio.create_task(timed(*hedge)))
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+            # Every attempt failed; surface the primary's error
+            return primary.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def generate_stream(
+        self,
+        messages: List[Message],
+        temperature: Optional[float] = None,
+        timeout: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> AsyncGenerator[ResponseChunk, None]:
+        if temperature is None:
+            temperature = self.default_temperature
+        kwargs = forwarded_options(temperature, timeout, stop, max_tokens, response_format)
+        ranked = self._ranked("stream")
+        attempted: Set[str] = set()
+        last_error: Optional[BaseException] = None
+
+        for index, (name, backend) in enumerate(ranked):
+            if name in attempted:
+                continue
+            hedge = self._hedge_candidate(ranked[index + 1 :], attempted)
+            try:
+                winner, stream, first_chunk = await self._first_chunk(name, backend, hedge, messages, kwargs, attempted)
+            except Exception as e:
+                last_error = e
+                if not is_transient_error(e):
+                    raise
+                continue
+
+            try:
+                if first_chunk is not None:
+                    yield first_chunk
+                    async for chunk in stream:
+                        yield chunk
+            except Exception as e:
+                # Too late to fail over once chunks have gone out
+                self._record_failure(winner, "stream", e)
+                raise
+            finally:
+                await stream.aclose()
+            return
+        raise last_error
+
+    def _hedge_candidate(
+        self, remaining: List[Tuple[str, LLMProvider]], attempted: Set[str]
+    ) -> Optional[Tuple[str, LLMProvider]]:
+        if not self._hedge:
+            return None
+        return next((backend for backend in remaining if backend[0] not in attempted), None)
+
+    async def _first_chunk(
+        self,
+        name: str,
+        backend: LLMProvider,
+        hedge: Optional[Tuple[str, LLMProvider]],
+        messages: List[Message],
+        kwargs: Dict[str, Any],
+        attempted: Set[str],
+    ) -> Tuple[str, AsyncGenerator[ResponseChunk, None], Optional[ResponseChunk]]:
+        """Open a stream and wait for its first chunk, racing the hedge backend if the primary is slow."""
+        streams: Dict[asyncio.Task, Tuple[str, AsyncGenerator[ResponseChunk, None], float]] = {}
+
+        def open_stream(backend_name: str, provider: LLMProvider) -> None:
+            attempted.add(backend_name)
+            stream = provider.generate_stream(messages, **kwargs)
+            streams[asyncio.create_task(self._next_or_none(stream))] = (backend_name, stream, time.monotonic())
+
+        first_error: Optional[BaseException] = None
+        try:
+            open_stream(name, backend)
+            if hedge is not None:
+                done, _ = await asyncio.wait(set(streams), timeout=self._hedge_delay(name, "stream"))
+                if not done:
+                    logger.info(f"Hedging slow LLM stream on {name} with {hedge[0]}")
+                    open_stream(*hedge)
+
+            while streams:
+                done, _ = await asyncio.wait(set(streams), return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    backend_name, stream, started = streams.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        self._stats[(backend_name, "stream")].record(ok=True, latency=time.monotonic() - started)
+                        return backend_name, stream, task.result()
+                    self._record_failure(backend_name, "stream", error)
+                    first_error = first_error or error
+                    await stream.aclose()
+            raise first_error
+        finally:
+            # Whatever is still in flight lost the race, or the caller gave up
+            for task, (backend_name, stream, started) in streams.items():
+                self._stats[(backend_name, "stream")].record(ok=True, latency=time.monotonic() - started)
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+                await stream.aclose()
+
+    @staticmethod
+    async def _next_or_none(stream: AsyncGenerator[ResponseChunk, None]) -> Optional[ResponseChunk]:
+        try:
+            return await stream.__anext__()
+        except StopAsyncIteration:
+            return None
@@ -0,0 +1,40 @@
+import logging
+from functools import lru_cache
+from typing import Callable, List
+
+from app.core.llm.messages import Message
+
+logger = logging.getLogger(__name__)
+
+TokenCounter = Callable[[str], int]
+
+# Role markers and separators the chat template adds around every message
+MESSAGE_OVERHEAD_TOKENS: int = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for when no tokenizer is installed, at about four characters per token."""
+    return (len(text) + 3) // 4
+
+
+@lru_cache()
+def get_token_counter(encoding_name: str = "cl100k_base") -> TokenCounter:
+    """
+    Return a token counter backed by tiktoken, or a character-based estimate without it.
+
+    The served models use their own tokenizers, so either way the count is an approximation
+    that is only used to keep prompts comfortably inside a budget.
+    """
+    try:
+        import tiktoken
+
+        encoding = tiktoken.get_encoding(encoding_name)
+    except Exception as e:
+        logger.warning(f"tiktoken unavailable ({e}), estimating token counts from text length")
+        return estimate_tokens
+
+    return lambda text: len(encoding.encode(text, disallowed_special=()))
+
+
+def count_message_tokens(messages: List[Message], counter: TokenCounter) -> int:
+    return sum(counter(message.content) + MESSAGE_OVERHEAD_TOKENS for message in messages)
@@ -0,0 +1,211 @@
+import logging
+import time
+from collections import defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
+
+from app.core.llm.interfaces import ForwardingLLMProvider, LLMProvider, forwarded_options
+from app.core.llm.messages import Message, Response, ResponseChunk
+from app.core.llm.tokens import count_message_tokens, get_token_counter
+from app.core.utils.timing import get_current_stage
+
+logger = logging.getLogger(__name__)
+
+# Per million prompt and completion tokens
+Prices = Dict[str, Tuple[float, float]]
+
+
+@dataclass
+class LLMCallUsage:
+    """What one LLM call consumed. A call answered from the response cache bills no tokens."""
+
+    model: str
+    stage: str
+    prompt_tokens: int
+    completion_tokens: int
+    cost_usd: float
+    latency_ms: float
+    first_token_ms: Optional[float]
+    estimated: bool = False
+    cached: bool = False
+
+
+class UsageScope:
+    """
+    Collects the LLM calls made on behalf of one unit of work, such as an analysis or a chat message.
+
+    Scopes nest: a call is recorded in the innermost open scope only, so an analysis started from a
+    chat message is accounted once, as an analysis.
+    """
+
+    def __init__(self, name: str, parent: Optional["UsageScope"] = None):
+        self.name = name
+        self.parent = parent
+        self.calls: List[LLMCallUsage] = []
+
+    def record(self, call: LLMCallUsage) -> None:
+        self.calls.append(call)
+
+    def totals(self, key: str) -> Dict[str, Dict[str, Any]]:
+        """Totals grouped by ``stage`` or ``model``."""
+        grouped: Dict[str, Dict[str, Any]] = defaultdict(_empty_totals)
+        for call in self.calls:
+            _add(grouped[getattr(call, key)], call)
+        return {name: _rounded(totals) for name, totals in grouped.items()}
+
+    def breakdown(self) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """Totals per ``(stage, model)`` pair, the grain usage is stored at."""
+        grouped: Dict[Tuple[str, str], Dict[str, Any]] = defaultdict(_empty_totals)
+        for call in self.calls:
+            _add(grouped[(call.stage, call.model)], call)
+        return dict(grouped)
+
+    def summary(self) -> Dict[str, Any]:
+        totals = _empty_totals()
+        for call in self.calls:
+            _add(totals, call)
+        first_token = [call.first_token_ms for call in self.calls if call.first_token_ms is not None]
+        return {
+            **_rounded(totals),
+            "mean_first_token_ms": round(sum(first_token) / len(first_token), 1) if first_token else None,
+            "stages": self.totals("stage"),
+            "models": self.totals("model"),
+        }
+
+
+def _empty_totals() -> Dict[str, Any]:
+    return {"calls": 0, "cached_calls": 0, "prompt_tokens": 0, "completion_tokens": 0, "cost_usd": 0.0}
+
+
+def _add(totals: Dict[str, Any], call: LLMCallUsage) -> None:
+    totals["calls"] += 1
+    totals["cached_calls"] += int(call.cached)
+    totals["prompt_tokens"] += call.prompt_tokens
+    totals["completion_tokens"] += call.completion_tokens
+    totals["cost_usd"] += call.cost_usd
+
+
+def _rounded(totals: Dict[str, Any]) -> Dict[str, Any]:
+    return {**totals, "cost_usd": round(totals["cost_usd"], 6)}
+
+
+_current_scope: ContextVar[Optional[UsageScope]] = ContextVar("current_usage_scope", default=None)
+
+
+def start_usage_scope(name: str) -> UsageScope:
+    """Open a scope and make it current; LLM calls made until ``end_usage_scope`` are recorded in it."""
+    scope = UsageScope(name, parent=_current_scope.get())
+    _current_scope.set(scope)
+    return scope
+
+
+def end_usage_scope(scope: UsageScope) -> None:
+    _current_scope.set(scope.parent)
+
+
+def get_current_usage_scope() -> Optional[UsageScope]:
+    return _current_scope.get()
+
+
+class MeteringLLMProvider(ForwardingLLMProvider):
+    """
+    Wrap a provider to record the usage, cost and latency of every call in the current ``UsageScope``.
+
+    Token counts come from the provider's ``usage`` metadata when it reports them and are otherwise
+    estimated from the text. The stage is the innermost open timing span (``llm.agent_turn``,
+    ``llm.veracity``, ...), or the scope's name outside of one.
+    """
+
+    def __init__(self, provider: LLMProvider, prices: Prices):
+        super().__init__(provider)
+        self._prices = prices
+        self._count = get_token_counter()
+
+    def _record(
+        self,
+        messages: List[Message],
+        text: str,
+        metadata: Dict[str, Any],
+        started: float,
+        first_token_at: Optional[float],
+    ) -> None:
+        scope = _current_scope.get()
+        if scope is None:
+            return
+
+        cached = bool(metadata.get("cached"))
+        usage = metadata.get("usage") or {}
+        estimated = not usage
+        if cached:
+            prompt_tokens = completion_tokens = 0
+        elif usage:
+            prompt_tokens = int(usage.get("prompt_tokens") or 0)
+            completion_tokens = int(usage.get("completion_tokens") or 0)
+        else:
+            prompt_tokens = count_message_tokens(messages, self._count)
+            completion_tokens = self._count(text)
+
+        model = metadata.get("model") or self.model
+        input_price, output_price = self._prices.get(model, self._prices.get("default", (0.0, 0.0)))
+        now = time.monotonic()
+        scope.record(
+            LLMCallUsage(
+                model=model,
+                stage=get_current_stage() or scope.name,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                cost_usd=(prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000,
+                latency_ms=(now - started) * 1000,
+                first_token_ms=(first_token_at - started) * 1000 if first_token_at is not None else None,
+                estimated=estimated and not cached,
+                cached=cached,
+            )
+        )
+
+    async def generate_response(
+        self,
+        messages: List[Message],
+        temperature: Optional[float] = None,
+        timeout: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> Response:
+        kwargs = forwarded_options(temperature, timeout, stop, max_tokens, response_format)
+        started = time.monotonic()
+        response = await self._provider.generate_response(messages, **kwargs)
+        # The whole response arrives at once, so its first token is its last
+        self._record(messages, response.text, response.metadata or {}, started, time.monotonic())
+        return response
+
+    async def generate_stream(
+        self,
+        messages: List[Message],
+        temperature: Optional[float] = None,
+        timeout: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> AsyncGenerator[ResponseChunk, None]:
+        kwargs = forwarded_options(temperature, timeout, stop, max_tokens, response_format)
+        started = time.monotonic()
+        first_token_at: Optional[float] = None
+        parts: List[str] = []
+        metadata: Dict[str, Any] = {}
+        recorded = False
+        try:
+            async for chunk in self._provider.generate_stream(messages, **kwargs):
+                if chunk.text and first_token_at is None:
+                    first_token_at = time.monotonic()
+                parts.append(chunk.text)
+                metadata.update(chunk.metadata or {})
+                if chunk.is_complete:
+                    # Recorded before handing over the last chunk, since consumers often stop reading at it
+                    self._record(messages, "".join(parts), metadata, started, first_token_at)
+                    recorded = True
+                yield chunk
+        finally:
+            # Streams the consumer closes early are still billed for what was generated
+            if not recorded:
+                self._record(messages, "".join(parts), metadata, started, first_token_at)
@@ -0,0 +1,111 @@
+"""Incremental parser for the streamed GET_VERACITY response."""
+import json
+import re
+from typing import NamedTuple, Optional
+
+from app.core.exceptions import MalformedLLMOutputError
+
+# A score is only taken once the token after it has arrived, so "8" is never mistaken for "85"
+_SCORE_PATTERN = re.compile(r'"veracity_score"\s*:\s*"?(-?\d+(?:\.\d+)?)"?\s*[,}\n]')
+_FINAL_SCORE_PATTERN = re.compile(r'"veracity_score"\s*:\s*"?(-?\d+(?:\.\d+)?)')
+# Greedy, so unescaped quotes inside the analysis text do not end the value early
+_ANALYSIS_PATTERN = re.compile(r'"analysis"\s*:\s*"(.*)"\s*(?:,\s*"\w+"\s*:|\})', re.DOTALL)
+# Long enough for a short preamble or a ```json fence before the object starts
+_MAX_PREAMBLE_CHARS = 500
+# How far back to rescan on each chunk, in case the key was split across chunks
+_SCAN_OVERLAP = 64
+
+
+class ParsedVeracity(NamedTuple):
+    veracity_score: int
+    analysis: str
+
+
+class VeracityStreamParser:
+    """
+    Parse the final veracity JSON while it streams in.
+
+    ``feed`` returns the veracity score as soon as that field is complete, so it can be shown
+    before the analysis text has finished generating, and raises as soon as the output clearly
+    is not the requested JSON object. ``finish`` returns the score and analysis once the stream
+    ends, tolerating unescaped quotes and raw newlines inside the analysis text.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._object_start: Optional[int] = None
+        self._scan_from = 0
+        self.veracity_score: Optional[int] = None
+
+    @property
+    def text(self) -> str:
+        return self._buffer
+
+    def feed(self, text: str) -> Optional[int]:
+        """Add a streamed chunk; return the veracity score the first time it becomes available."""
+        self._buffer += text
+
+        if self._object_start is None:
+            start = self._buffer.find("{")
+            if start == -1:
+                if len(self._buffer.lstrip()) > _MAX_PREAMBLE_CHARS:
+                    raise MalformedLLMOutputError("Veracity response does not contain a JSON object")
+                return None
+            self._object_start = start
+            self._scan_from = start
+
+        if self.veracity_score is not None:
+            return None
+
+        match = _SCORE_PATTERN.search(self._buffer, self._scan_from)
+        if match is None:
+            self._scan_from = max(self._object_start, len(self._buffer) - _SCAN_OVERLAP)
+            return None
+
+        self.veracity_score = _normalize_score(match.group(1))
+        return self.veracity_score
+
+    def finish(self) -> ParsedVeracity:
+        """Return the parsed response once the stream is complete."""
+        if self._object_start is None:
+            raise MalformedLLMOutputError("Veracity response does not contain a JSON object")
+
+        end = self._buffer.rfind("}")
+        candidate = self._buffer[self._object_start : end + 1 if end > self._object_start else None]
+        candidate = candidate.replace("\x00", "").replace("\x1a", "").replace("\\'", "'")
+
+        try:
+            data = json.loads(candidate, strict=False)
+            score = data.get("veracity_score")
+            analysis = data.get("analysis")
+            veracity_score = _normalize_score(score) if score is not None else None
+        except (json.JSONDecodeError, AttributeError, ValueError):
+            veracity_score = self.veracity_score
+            if veracity_score is None:
+                score_match = _FINAL_SCORE_PATTERN.search(candidate)
+                veracity_score = _normalize_score(score_match.group(1)) if score_match else None
+            analysis_match = _ANALYSIS_PATTERN.search(candidate)
+            analysis = _unescape(analysis_match.group(1)) if analysis_match else None
+
+        if veracity_score is None:
+            raise MalformedLLMOutputError("Veracity response is missing veracity_score")
+
+        return ParsedVeracity(
+            veracity_score=veracity_score,
+            analysis=str(analysis) if analysis else "No analysis provided",
+        )
+
+
+def _normalize_score(value) -> int:
+    """Clamp a score to 0-100, accepting decimals and 0-1 fractions as well as integers."""
+    score = float(value)
+    if 0 < score < 1:
+        score *= 100
+    return int(round(max(0.0, min(100.0, score))))
+
+
+def _unescape(raw: str) -> str:
+    try:
+        return json.loads(f'"{raw}"', strict=False)
+    except json.JSONDecodeError:
+        return raw.replace("\\n", "\n").replace('\\"', '"').replace("\\\\", "\\")
@@ -3,8 +3,9 @@ import base64
 import json
 import logging
 import os
-from typing import AsyncGenerator, List
-from datetime import UTC, datetime
+from typing import Any, AsyncGenerator, Dict, List, Optional
+from datetime import UTC, datetime, timedelta
+import httpx
 import openai
 from google.oauth2 import service_account
 from google.auth.transport import requests
@@ -16,7 +17,7 @@ logger = logging.getLogger(__name__)
 
 
 class VertexAILlamaProvider(LLMProvider):
-    def __init__(self, settings):
+    def __init__(self, settings, model_id: Optional[str] = None):
         try:
             creds_path = settings.GOOGLE_APPLICATION_CREDENTIALS
             logger.info(f"Loading service account from: {creds_path}")
@@ -50,9 +51,8 @@ class VertexAILlamaProvider(LLMProvider):
             self.credentials = service_account.Credentials.from_service_account_file(
                 creds_path, scopes=["https://www.googleapis.com/auth/cloud-platform"]
             )
-
-            auth_req = requests.Request()
-            self.credentials.refresh(auth_req)
+            # The first token is fetched on first use (or in start()), off the event loop
+            self._refresh_lock = asyncio.Lock()
 
             project_path = f"projects/{settings.GOOGLE_CLOUD_PROJECT}"
             location_path = f"locations/{settings.VERTEX_AI_LOCATION}"
@@ -63,13 +63,23 @@ class VertexAILlamaProvider(LLMProvider):
 
             logger.info(f"Initializing OpenAI client with base URL: {base_url}")
 
-            self.client = openai.OpenAI(
+            # One pooled HTTP client for every call. The bearer header comes from api_key, which is
+            # swapped on refresh; a default Authorization header would pin the first token.
+            # Retries are left to the shared resilience policy, so the client's own are turned off.
+            self.client = openai.AsyncOpenAI(
                 base_url=base_url,
-                api_key=self.credentials.token,
-                default_headers={"Authorization": f"Bearer {self.credentials.token}"},
+                api_key="pending-refresh",
+                max_retries=0,
+                http_client=openai.DefaultAsyncHttpxClient(
+                    limits=httpx.Limits(
+                        max_connections=settings.VERTEX_AI_MAX_CONNECTIONS,
+                        max_keepalive_connections=settings.VERTEX_AI_MAX_CONNECTIONS,
+                        keepalive_expiry=settings.VERTEX_AI_KEEPALIVE_SECONDS,
+                    )
+                ),
             )
 
-            self.model_id = settings.LLAMA_MODEL_NAME
+            self.model_id = model_id or settings.LLAMA_MODEL_NAME
             self.safety_settings = {
                 "enabled": True,
                 "llama_guard_settings": {},
@@ -84,28 +94,60 @@ class VertexAILlamaProvider(LLMProvider):
             logger.error(f"Failed to initialize Vertex AI Llama provider: {str(e)}", exc_info=True)
             raise
 
-    def _refresh_token_if_needed(self):
-        """Refresh the access token if needed"""
+    async def start(self) -> None:
+        await self._refresh_token_if_needed()
+
+    async def refresh_credentials(self, margin_seconds: float) -> None:
+        await self._refresh_token_if_needed(margin_seconds)
+
+    async def close(self) -> None:
+        await self.client.close()
+
+    def _token_expires_within(self, margin_seconds: float) -> bool:
         if not self.credentials.valid:
-            auth_req = requests.Request()
-            self.credentials.refresh(auth_req)
-            # Update client with new token
+            return True
+        # google-auth keeps expiry as a naive UTC datetime
+        expiry = self.credentials.expiry
+        if expiry is None:
+            return False
+        return expiry - datetime.now(UTC).replace(tzinfo=None) < timedelta(seconds=margin_seconds)
+
+    async def _refresh_token_if_needed(self, margin_seconds: float = 0.0):
+        """Refresh the access token if it expires within the margin, in a worker thread since google-auth blocks"""
+        if not self._token_expires_within(margin_seconds):
+            return
+        async with self._refresh_lock:
+            # Another call may have refreshed it while this one waited
+            if not self._token_expires_within(margin_seconds):
+                return
+            await asyncio.to_thread(self.credentials.refresh, requests.Request())
             self.client.api_key = self.credentials.token
-            self.client.default_headers["Authorization"] = f"Bearer {self.credentials.token}"
             logger.info("Refreshed access token")
 
-    async def generate_response(self, messages: List[Message], temperature: float = 0.7) -> Response:
+    async def generate_response(
+        self,
+        messages: List[Message],
+        temperature: float = 0.7,
+        timeout: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> Response:
         try:
-            self._refresh_token_if_needed()
+            await self._refresh_token_if_needed()
 
             logger.debug(f"Generating response with temperature {temperature}")
             logger.debug(f"Number of messages: {len(messages)}")
             logger.debug(f"Model ID: {self.model_id}")
 
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.model_id,
                 messages=[{"role": m.role, "content": m.content} for m in messages],
                 temperature=temperature,
+                stop=stop or openai.NOT_GIVEN,
+                max_tokens=max_tokens or openai.NOT_GIVEN,
+                response_format=response_format or openai.NOT_GIVEN,
+                timeout=timeout if timeout else openai.NOT_GIVEN,
                 extra_body={"extra_body": {"google": {"model_safety_settings": self.safety_settings}}},
             )
 
@@ -113,9 +155,15 @@ class VertexAILlamaProvider(LLMProvider):
                 text=response.choices[0].message.content,
                 confidence_score=response.choices[0].finish_reason != "content_filtered",
                 created_at=datetime.now(UTC),
-                metadata={"model": self.model_id, "finish_reason": response.choices[0].finish_reason},
+                metadata={
+                    "model": self.model_id,
+                    "finish_reason": response.choices[0].finish_reason,
+                    "usage": response.usage.model_dump() if response.usage else None,
+                },
             )
 
+        except openai.APITimeoutError as e:
+            raise TimeoutError(f"Vertex AI request timed out after {timeout}s") from e
         except Exception as e:
             logger.error(f"Error generating response: {str(e)}", exc_info=True)
             if hasattr(e, "response"):
@@ -124,33 +172,51 @@ class VertexAILlamaProvider(LLMProvider):
             raise
 
     async def generate_stream(
-        self, messages: List[Message], temperature: float = 0.7
+        self,
+        messages: List[Message],
+        temperature: float = 0.7,
+        timeout: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
     ) -> AsyncGenerator[ResponseChunk, None]:
         """Generate a streaming response."""
         try:
-            self._refresh_token_if_needed()
+            await self._refresh_token_if_needed()
 
             logger.debug("Starting stream generation")
             logger.debug(f"Messages: {messages}")
 
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.model_id,
                 messages=[{"role": m.role, "content": m.content} for m in messages],
                 temperature=temperature,
+                stop=stop or openai.NOT_GIVEN,
+                max_tokens=max_tokens or openai.NOT_GIVEN,
+                response_format=response_format or openai.NOT_GIVEN,
                 stream=True,
+                timeout=timeout if timeout else openai.NOT_GIVEN,
                 extra_body={"extra_body": {"google": {"model_safety_settings": self.safety_settings}}},
             )
 
-            for chunk in response:
-                if chunk.choices and chunk.choices[0].delta.content:
-                    content = chunk.choices[0].delta.content
-                    logger.debug(f"Streaming chunk: {content}")
-                    yield ResponseChunk(text=content, is_complete=False, metadata={"model": self.model_id})
-                    # Small delay for chunking
-                    await asyncio.sleep(0.01)
-
-            yield ResponseChunk(text="", is_complete=True, metadata={"model": self.model_id})
-
+            usage = None
+            try:
+                async for chunk in response:
+                    # Only sent when the endpoint reports usage on streams
+                    if getattr(chunk, "usage", None):
+                        usage = chunk.usage.model_dump()
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        content = chunk.choices[0].delta.content
+                        logger.debug(f"Streaming chunk: {content}")
+                        yield ResponseChunk(text=content, is_complete=False, metadata={"model": self.model_id})
+            finally:
+                # Releases the connection when the consumer stops reading early
+                await response.close()
+
+            yield ResponseChunk(text="", is_complete=True, metadata={"model": self.model_id, "usage": usage})
+
+        except openai.APITimeoutError as e:
+            raise TimeoutError(f"Vertex AI stream timed out after {timeout}s") from e
         except Exception as e:
             logger.error(f"Error in generate_stream: {str(e)}", exc_info=True)
             raise
@@ -0,0 +1,235 @@
+import logging
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+import aiohttp
+from tenacity import AsyncRetrying, RetryCallState, retry_if_exception, stop_after_attempt, stop_any
+from tenacity import wait_random_exponential
+
+from app.core.config import settings
+from app.core.exceptions import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_RETRYABLE_STATUS_CODES = {408, 425, 429}
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Whether an error is worth retrying elsewhere or later: rate limits, 5xx, timeouts, dropped connections."""
+    if isinstance(error, (TimeoutError, ConnectionError, aiohttp.ClientConnectionError, CircuitOpenError)):
+        return True
+    status_code = getattr(error, "status_code", None) or getattr(error, "status", None)
+    if isinstance(status_code, int):
+        return status_code in _RETRYABLE_STATUS_CODES or status_code >= 500
+    # openai.APIConnectionError and APITimeoutError carry no status code
+    return type(error).__name__ in ("APIConnectionError", "APITimeoutError")
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """The delay a service asked for in a 429/503 ``Retry-After``, if the error carries one."""
+    retry_after = getattr(error, "retry_after", None)
+    if retry_after is None:
+        # openai.APIStatusError keeps the httpx response
+        headers = getattr(getattr(error, "response", None), "headers", None)
+        retry_after = headers.get("retry-after") if headers is not None else None
+    return parse_retry_after(retry_after)
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """Parse a ``Retry-After`` value given either in seconds or as an HTTP date."""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(str(value)) - datetime.now(UTC)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class CircuitBreaker:
+    """
+    Fail fast while a dependency is down.
+
+    After ``failure_threshold`` transient failures in a row the breaker opens and calls are refused
+    with ``CircuitOpenError`` for ``reset_timeout_seconds``. Then a single trial call is let through:
+    success closes the breaker, failure opens it for another period.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout_seconds: float = 30.0):
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout_seconds = reset_timeout_seconds
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self.times_opened = 0
+        self.short_circuited = 0
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at < self._reset_timeout_seconds:
+            return "open"
+        return "half_open"
+
+    def before_call(self) -> None:
+        state = self.state
+        if state == "closed":
+            return
+        if state == "half_open" and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return
+        self.short_circuited += 1
+        retry_in = max(0.0, self._opened_at + self._reset_timeout_seconds - time.monotonic())
+        raise CircuitOpenError(self.name, retry_in)
+
+    def record_success(self) -> None:
+        if self._opened_at is not None:
+            logger.info(f"Circuit {self.name} closed")
+        self._consecutive_failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self._consecutive_failures += 1
+        if self._trial_in_flight or (self._opened_at is None and self._consecutive_failures >= self._failure_threshold):
+            self.times_opened += 1
+            logger.warning(f"Circuit {self.name} opened after {self._consecutive_failures} consecutive failures")
+            self._opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+    def release(self) -> None:
+        """Let another trial through when a call ends without a verdict, e.g. it was cancelled."""
+        self._trial_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._consecutive_failures,
+            "times_opened": self.times_opened,
+            "short_circuited": self.short_circuited,
+        }
+
+
+class ResiliencePolicy:
+    """
+    Retry transient failures of an idempotent call with jittered exponential backoff, behind a breaker.
+
+    A ``Retry-After`` from the service stretches the backoff, up to ``max_retry_after_seconds``; a
+    service that asks for a longer pause is not waited for and the error is raised at once, leaving
+    it to the breaker. When the caller gives a timeout it is the budget for all attempts together:
+    each attempt gets what is left and no retry starts once it is spent. An open breaker is not
+    retried; the caller sees ``CircuitOpenError`` at once.
+    """
+
+    def __init__(
+        self,
+        breaker: CircuitBreaker,
+        max_attempts: int = 3,
+        initial_backoff_seconds: float = 0.5,
+        max_backoff_seconds: float = 8.0,
+        max_retry_after_seconds: float = 30.0,
+    ):
+        self.breaker = breaker
+        self._max_attempts = max_attempts
+        self._max_retry_after_seconds = max_retry_after_seconds
+        self._backoff = wait_random_exponential(multiplier=initial_backoff_seconds, max=max_backoff_seconds)
+        self.calls = 0
+        self.retries = 0
+        self.failures = 0
+
+    async def call(self, operation: Callable[[Optional[float]], Awaitable[T]], timeout: Optional[float] = None) -> T:
+        """Run ``operation(attempt_timeout)`` until it succeeds, fails for good, or the budget is spent."""
+        self.calls += 1
+        expires = time.monotonic() + timeout if timeout else None
+
+        def remaining() -> Optional[float]:
+            return None if expires is None else max(0.0, expires - time.monotonic())
+
+        def wait(retry_state: RetryCallState) -> float:
+            retry_after = retry_after_seconds(retry_state.outcome.exception()) or 0.0
+            delay = max(self._backoff(retry_state), min(retry_after, self._max_retry_after_seconds))
+            left = remaining()
+            return delay if left is None else min(delay, left)
+
+        def retry_after_too_long(retry_state: RetryCallState) -> bool:
+            retry_after = retry_after_seconds(retry_state.outcome.exception())
+            if retry_after is None or retry_after <= self._max_retry_after_seconds:
+                return False
+            logger.warning(f"{self.breaker.name} asked to retry after {retry_after:.0f}s, giving up instead")
+            return True
+
+        def before_sleep(retry_state: RetryCallState) -> None:
+            self.retries += 1
+            error = retry_state.outcome.exception()
+            logger.warning(
+                f"{self.breaker.name} call failed ({type(error).__name__}: {str(error)[:200]}), "
+                f"retrying in {retry_state.next_action.sleep:.2f}s (attempt {retry_state.attempt_number})"
+            )
+
+        retrying = AsyncRetrying(
+            stop=stop_any(stop_after_attempt(self._max_attempts), lambda _: remaining() == 0.0, retry_after_too_long),
+            wait=wait,
+            retry=retry_if_exception(lambda e: is_transient_error(e) and not isinstance(e, CircuitOpenError)),
+            before_sleep=before_sleep,
+            reraise=True,
+        )
+        try:
+            async for attempt in retrying:
+                with attempt:
+                    return await self._attempt(operation, remaining())
+        except Exception:
+            self.failures += 1
+            raise
+
+    async def _attempt(self, operation: Callable[[Optional[float]], Awaitable[T]], timeout: Optional[float]) -> T:
+        if timeout is not None and timeout <= 0:
+            raise TimeoutError(f"{self.breaker.name} call ran out of time before it could be retried")
+        self.breaker.before_call()
+        try:
+            result = await operation(timeout)
+        except Exception as e:
+            # A rejected request means the service is up, so only transient failures count against it
+            if is_transient_error(e):
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            raise
+        except BaseException:
+            self.breaker.release()
+            raise
+        self.breaker.record_success()
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "retries": self.retries,
+            "failures": self.failures,
+            "breaker": self.breaker.stats(),
+        }
+
+
+@lru_cache()
+def get_resilience_policy(name: str) -> ResiliencePolicy:
+    """The retry policy and breaker for one external dependency, shared by all of its callers."""
+    return ResiliencePolicy(
+        CircuitBreaker(
+            name,
+            failure_threshold=settings.RESILIENCE_BREAKER_FAILURE_THRESHOLD,
+            reset_timeout_seconds=settings.RESILIENCE_BREAKER_RESET_SECONDS,
+        ),
+        max_attempts=settings.RESILIENCE_MAX_ATTEMPTS,
+        initial_backoff_seconds=settings.RESILIENCE_INITIAL_BACKOFF_SECONDS,
+        max_backoff_seconds=settings.RESILIENCE_MAX_BACKOFF_SECONDS,
+        max_retry_after_seconds=settings.RESILIENCE_MAX_RETRY_AFTER_SECONDS,
+    )
@@ -0,0 +1,54 @@
+import re
+import unicodedata
+from typing import Iterable, Set
+
+_WORD_PATTERN = re.compile(r"\w+")
+# Snippets sharing this fraction of their words with an earlier one add no independent evidence
+REDUNDANT_SNIPPET_OVERLAP = 0.8
+
+
+def normalize_claim_text(text: str) -> str:
+    """
+    Normalize claim text so that trivially different submissions of the same claim compare equal.
+
+    Examples:
+        >>> normalize_claim_text("  Vaccines  cause Autism!! ")
+        'vaccines cause autism'
+        >>> normalize_claim_text("“The Earth   is flat.”")
+        'the earth is flat'
+    """
+    text = unicodedata.normalize("NFKC", text or "")
+    text = text.lower()
+
+    # Drop surrounding quotes and trailing punctuation that do not change the claim
+    text = re.sub(r"^[\s\"'“”‘’«»]+", "", text)
+    text = re.sub(r"[\s\"'“”‘’«».!?;:,]+$", "", text)
+
+    # Collapse runs of whitespace
+    return re.sub(r"\s+", " ", text)
+
+
+def snippet_words(snippet: str) -> Set[str]:
+    """The lowercased words of a search result snippet, as compared by ``is_redundant_snippet``."""
+    return set(_WORD_PATTERN.findall((snippet or "").lower()))
+
+
+def snippet_overlap(words: Set[str], other: Set[str]) -> float:
+    """Share of the smaller word set that also appears in the other one."""
+    if not words or not other:
+        return 0.0
+    return len(words & other) / min(len(words), len(other))
+
+
+def is_redundant_snippet(words: Set[str], earlier: Iterable[Set[str]]) -> bool:
+    """
+    Whether a snippet mostly repeats one already seen, such as the same wire story on several sites.
+
+    Examples:
+        >>> seen = [snippet_words("New study says the Earth is flat")]
+        >>> is_redundant_snippet(snippet_words("The Earth is flat, says a new study"), seen)
+        True
+        >>> is_redundant_snippet(snippet_words(""), [snippet_words("")])
+        False
+    """
+    return bool(words) and any(snippet_overlap(words, other) >= REDUNDANT_SNIPPET_OVERLAP for other in earlier)
@@ -0,0 +1,100 @@
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TimingSpan:
+    """A single timed stage, with its offset from the start of the trace."""
+
+    stage: str
+    offset_ms: float
+    duration_ms: float = 0.0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "stage": self.stage,
+            "offset_ms": round(self.offset_ms, 1),
+            "duration_ms": round(self.duration_ms, 1),
+            **self.attributes,
+        }
+
+
+class StageTrace:
+    """Collects timing spans for the stages of one unit of work, such as a claim analysis."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.spans: List[TimingSpan] = []
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def span(self, stage: str, **attributes: Any) -> Iterator[TimingSpan]:
+        started = time.perf_counter()
+        span = TimingSpan(stage=stage, offset_ms=(started - self._start) * 1000, attributes=attributes)
+        outer_stage = _current_stage.get()
+        _current_stage.set(stage)
+        try:
+            yield span
+        finally:
+            _current_stage.set(outer_stage)
+            span.duration_ms = (time.perf_counter() - started) * 1000
+            self.spans.append(span)
+            logger.debug(f"[{self.name}] {stage} took {span.duration_ms:.1f}ms {attributes or ''}")
+
+    def summary(self) -> Dict[str, Any]:
+        """Aggregate spans per stage: how often it ran, total and slowest duration."""
+        stages: Dict[str, Dict[str, Any]] = {}
+        for span in self.spans:
+            stage = stages.setdefault(span.stage, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            stage["count"] += 1
+            stage["total_ms"] += span.duration_ms
+            stage["max_ms"] = max(stage["max_ms"], span.duration_ms)
+
+        for stage in stages.values():
+            stage["total_ms"] = round(stage["total_ms"], 1)
+            stage["max_ms"] = round(stage["max_ms"], 1)
+
+        return {"total_ms": round((time.perf_counter() - self._start) * 1000, 1), "stages": stages}
+
+
+_current_trace: ContextVar[Optional[StageTrace]] = ContextVar("current_stage_trace", default=None)
+_current_stage: ContextVar[Optional[str]] = ContextVar("current_stage", default=None)
+
+
+def start_trace(name: str) -> StageTrace:
+    """Start a trace and make it current, so nested code can record spans with ``trace_span``."""
+    trace = StageTrace(name)
+    _current_trace.set(trace)
+    return trace
+
+
+def end_trace() -> None:
+    _current_trace.set(None)
+
+
+def get_current_trace() -> Optional[StageTrace]:
+    return _current_trace.get()
+
+
+def get_current_stage() -> Optional[str]:
+    """The innermost span open in this context, so work done inside it can be attributed to its stage."""
+    return _current_stage.get()
+
+
+@contextmanager
+def trace_span(stage: str, **attributes: Any) -> Iterator[Optional[TimingSpan]]:
+    """Time a block as a span of the current trace; a no-op when no trace is active."""
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+
+    with trace.span(stage, **attributes) as span:
+        yield span
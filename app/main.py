@@ -6,6 +6,7 @@ from app.core.auth.auth0_middleware import Auth0Middleware
 from app.services.user_service import UserService
 from app.repositories.implementations.user_repository import UserRepository
 from app.db.session import AsyncSessionLocal
+from app.api.dependencies import close_llm_providers, start_llm_providers, stop_batch_executor
 import logging
 
 formatter = logging.Formatter(fmt="%(asctime)s | %(levelname)s | %(name)s | %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
@@ -32,8 +33,11 @@ async def lifespan(app: FastAPI):
     logging.info("API Starting up")
     user_service = await get_user_service()
     app.state.auth_middleware = Auth0Middleware(user_service)
+    await start_llm_providers()
     yield
     logging.info("API Shutting down")
+    await stop_batch_executor()
+    await close_llm_providers()
 
 
 app = FastAPI(
@@ -1,10 +1,11 @@
 import enum
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
 from typing import Optional, List
 import uuid
 from sqlalchemy import (
     UUID,
     CheckConstraint,
+    Date,
     DateTime,
     Float,
     Index,
@@ -18,10 +19,14 @@ from sqlalchemy import (
     ARRAY,
     DOUBLE_PRECISION,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.database.base import Base
 
+# Dimension of the all-MiniLM-L6-v2 sentence embeddings stored on claims
+CLAIM_EMBEDDING_DIMENSION: int = 384
+
 
 class ConversationStatus(str, enum.Enum):
     active = "active"
@@ -123,6 +128,15 @@ class ClaimModel(Base):
     )
     messages: Mapped[List["MessageModel"]] = relationship(back_populates="claim", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index(
+            "ix_claims_embedding_hnsw",
+            text(f"(embedding::vector({CLAIM_EMBEDDING_DIMENSION})) vector_cosine_ops"),
+            postgresql_using="hnsw",
+            postgresql_where=text("embedding IS NOT NULL"),
+        ),
+    )
+
 
 class AnalysisModel(Base):
     __tablename__ = "analysis"
@@ -137,6 +151,10 @@ class AnalysisModel(Base):
         nullable=False,
         index=True,
     )
+    timing: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True, doc="Per-stage latency summary")
+    llm_usage: Mapped[Optional[dict]] = mapped_column(
+        JSONB, nullable=True, doc="LLM calls, tokens and cost, in total and per stage and model"
+    )
 
     claim: Mapped["ClaimModel"] = relationship(back_populates="analyses", doc="Related claim")
     searches: Mapped[List["SearchModel"]] = relationship(back_populates="analysis", cascade="all, delete-orphan")
@@ -309,3 +327,23 @@ class MessageModel(Base):
         Index("idx_message_conversation_timestamp", conversation_id, timestamp.desc()),
         Index("idx_message_claim_conversation_timestamp", claim_conversation_id, timestamp.desc()),
     )
+
+
+class LLMDailyUsageModel(Base):
+    """LLM usage per user, day, stage and model, accumulated as analyses and conversations finish."""
+
+    __tablename__ = "llm_daily_usage"
+
+    user_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    day: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    stage: Mapped[str] = mapped_column(String(100), nullable=False)
+    model: Mapped[str] = mapped_column(String(255), nullable=False)
+    calls: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    cached_calls: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    prompt_tokens: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    completion_tokens: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    cost_usd: Mapped[float] = mapped_column(DOUBLE_PRECISION, nullable=False, default=0.0)
+
+    __table_args__ = (Index("ix_llm_daily_usage_user_day_stage_model", user_id, day, stage, model, unique=True),)
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from uuid import UUID
 
 from app.models.database.models import AnalysisModel, AnalysisStatus
@@ -22,6 +22,8 @@ class Analysis:
     updated_at: datetime
     searches: Optional[List["Search"]] = None
     feedback: Optional[List["Feedback"]] = None
+    timing: Optional[Dict[str, Any]] = None
+    llm_usage: Optional[Dict[str, Any]] = None
 
     @classmethod
     def from_model(cls, model: "AnalysisModel") -> "Analysis":
@@ -37,6 +39,8 @@ class Analysis:
             updated_at=model.updated_at,
             searches=[Search.from_model(s) for s in model.searches] if model.searches else None,
             feedback=[Feedback.from_model(f) for f in model.feedbacks] if model.feedbacks else None,
+            timing=model.timing,
+            llm_usage=model.llm_usage,
         )
 
     def to_model(self) -> "AnalysisModel":
@@ -48,4 +52,6 @@ class Analysis:
             confidence_score=self.confidence_score,
             analysis_text=self.analysis_text,
             status=AnalysisStatus(self.status),
+            timing=self.timing,
+            llm_usage=self.llm_usage,
         )
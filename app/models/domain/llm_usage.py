@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from uuid import UUID
+
+from app.models.database.models import LLMDailyUsageModel
+
+
+@dataclass
+class LLMDailyUsage:
+    id: UUID
+    user_id: UUID
+    day: date
+    stage: str
+    model: str
+    calls: int = 0
+    cached_calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost_usd: float = 0.0
+    created_at: datetime = None
+    updated_at: datetime = None
+
+    @classmethod
+    def from_model(cls, model: "LLMDailyUsageModel") -> "LLMDailyUsage":
+        """Create domain model from database model."""
+        return cls(
+            id=model.id,
+            user_id=model.user_id,
+            day=model.day,
+            stage=model.stage,
+            model=model.model,
+            calls=model.calls,
+            cached_calls=model.cached_calls,
+            prompt_tokens=model.prompt_tokens,
+            completion_tokens=model.completion_tokens,
+            cost_usd=model.cost_usd,
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+        )
+
+    def to_model(self) -> "LLMDailyUsageModel":
+        """Convert to database model."""
+        return LLMDailyUsageModel(
+            id=self.id,
+            user_id=self.user_id,
+            day=self.day,
+            stage=self.stage,
+            model=self.model,
+            calls=self.calls,
+            cached_calls=self.cached_calls,
+            prompt_tokens=self.prompt_tokens,
+            completion_tokens=self.completion_tokens,
+            cost_usd=self.cost_usd,
+        )
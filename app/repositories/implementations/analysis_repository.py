@@ -1,11 +1,11 @@
-from typing import Optional, List
-from uuid import UUID
+from typing import Any, Dict, Optional, List
+from uuid import UUID, uuid4
 from sqlalchemy import desc, select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from datetime import datetime
 
-from app.models.database.models import AnalysisModel, AnalysisStatus, SearchModel
+from app.models.database.models import AnalysisModel, AnalysisStatus, SearchModel, SourceModel
 from app.models.domain.analysis import Analysis
 from app.models.domain.feedback import Feedback
 from app.models.domain.search import Search
@@ -24,6 +24,8 @@ class AnalysisRepository(BaseRepository[AnalysisModel, Analysis]):
             confidence_score=analysis.confidence_score,
             analysis_text=analysis.analysis_text,
             status=AnalysisStatus(analysis.status),
+            timing=analysis.timing,
+            llm_usage=analysis.llm_usage,
         )
 
     def _to_domain(self, model: AnalysisModel) -> Analysis:
@@ -39,6 +41,8 @@ class AnalysisRepository(BaseRepository[AnalysisModel, Analysis]):
             updated_at=model.updated_at,
             searches=None,
             feedback=None,
+            timing=model.timing,
+            llm_usage=model.llm_usage,
         )
 
     async def create(self, analysis: Analysis) -> Analysis:
@@ -73,6 +77,61 @@ class AnalysisRepository(BaseRepository[AnalysisModel, Analysis]):
 
         return Analysis.from_model(model=model)
 
+    async def clone_to_claim(self, analysis_id: UUID, claim_id: UUID) -> Optional[Analysis]:
+        """
+        Copy a completed analysis, with its searches and sources, onto another claim in one transaction.
+
+        The clone keeps the original's stage timings and LLM usage, marked with ``reused_from`` (the
+        analysis that actually ran), so a reuse is not mistaken for a run that took no time or tokens.
+        """
+        query = (
+            select(self._model_class)
+            .where(self._model_class.id == analysis_id, self._model_class.status == AnalysisStatus.completed)
+            .options(selectinload(self._model_class.searches).selectinload(SearchModel.sources))
+        )
+        result = await self._session.execute(query)
+        original = result.scalar_one_or_none()
+
+        if not original:
+            return None
+
+        clone = AnalysisModel(
+            id=uuid4(),
+            claim_id=claim_id,
+            veracity_score=original.veracity_score,
+            confidence_score=original.confidence_score,
+            analysis_text=original.analysis_text,
+            status=AnalysisStatus.completed,
+            timing=_reused(original.timing, original.id),
+            llm_usage=_reused(original.llm_usage, original.id),
+        )
+        self._session.add(clone)
+
+        for search in original.searches:
+            search_clone = SearchModel(id=uuid4(), analysis_id=clone.id, prompt=search.prompt, summary=search.summary)
+            self._session.add(search_clone)
+            self._session.add_all(
+                [
+                    SourceModel(
+                        id=uuid4(),
+                        search_id=search_clone.id,
+                        url=source.url,
+                        title=source.title,
+                        snippet=source.snippet,
+                        domain_id=source.domain_id,
+                        content=source.content,
+                        credibility_score=source.credibility_score,
+                    )
+                    for source in search.sources
+                ]
+            )
+
+        await self._session.commit()
+
+        self._session.expunge(clone)
+
+        return self._to_domain(clone)
+
     async def get_by_claim(
         self,
         claim_id: UUID,
@@ -113,6 +172,8 @@ class AnalysisRepository(BaseRepository[AnalysisModel, Analysis]):
                         if include_feedback and model.feedbacks
                         else None
                     ),
+                    timing=model.timing,
+                    llm_usage=model.llm_usage,
                 )
                 for model in models
             ]
@@ -184,6 +245,8 @@ class AnalysisRepository(BaseRepository[AnalysisModel, Analysis]):
                 feedback=(
                     [Feedback.from_model(f) for f in model.feedbacks] if include_feedback and model.feedbacks else None
                 ),
+                timing=model.timing,
+                llm_usage=model.llm_usage,
             )
         else:
             return self._to_domain(model)
@@ -198,3 +261,9 @@ class AnalysisRepository(BaseRepository[AnalysisModel, Analysis]):
         )
         result = await self._session.execute(stmt)
         return [self._to_domain(model) for model in result.scalars().all()]
+
+
+def _reused(summary: Optional[Dict[str, Any]], original_id: UUID) -> Dict[str, Any]:
+    # A clone of a clone points at the analysis the numbers were measured on
+    summary = summary or {}
+    return {**summary, "reused_from": summary.get("reused_from", str(original_id))}
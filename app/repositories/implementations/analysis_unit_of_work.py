@@ -0,0 +1,158 @@
+import logging
+from datetime import UTC, datetime
+from typing import Dict, Iterable, List, Set
+from uuid import UUID, uuid4
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.utils.timing import trace_span
+from app.core.utils.url import normalize_domain_name
+from app.models.database.models import DomainModel, SearchModel, SourceModel
+from app.models.domain.search import Search
+
+logger = logging.getLogger(__name__)
+
+
+class AnalysisUnitOfWork:
+    """
+    Collect the searches, sources and new domains produced by one analysis and write them in bulk.
+
+    Nothing is written until ``flush``, which inserts everything staged so far in a single
+    transaction: domains with ``ON CONFLICT (domain_name) DO NOTHING``, then searches and sources.
+    Sources handed out before the flush are transient models carrying their domain, so they can be
+    formatted for the prompt straight away. When another request inserts the same domain first,
+    the flush picks up the existing row and repoints the staged sources at it.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+        self._domains: Dict[str, DomainModel] = {}
+        self._new_domain_names: Set[str] = set()
+        self._searches: List[SearchModel] = []
+        self._sources: List[SourceModel] = []
+
+    @property
+    def pending(self) -> int:
+        return len(self._new_domain_names) + len(self._searches) + len(self._sources)
+
+    def add_search(self, search: Search) -> Search:
+        self._searches.append(
+            SearchModel(
+                id=search.id,
+                analysis_id=search.analysis_id,
+                prompt=search.prompt,
+                summary=search.summary,
+                created_at=search.created_at,
+                updated_at=search.updated_at,
+            )
+        )
+        return search
+
+    async def resolve_domains(self, domain_names: Iterable[str]) -> Dict[str, DomainModel]:
+        """Return domains by normalized name, loading known ones in one query and staging the rest."""
+        names = {normalize_domain_name(name) for name in domain_names}
+        missing = names - self._domains.keys()
+
+        if missing:
+            with trace_span("domain.get_or_create", count=len(missing)):
+                result = await self._session.execute(select(DomainModel).where(DomainModel.domain_name.in_(missing)))
+                for model in result.scalars().all():
+                    self._domains[model.domain_name] = model
+
+            for name in missing - self._domains.keys():
+                now = datetime.now(UTC)
+                self._domains[name] = DomainModel(
+                    id=uuid4(),
+                    domain_name=name,
+                    credibility_score=None,
+                    is_reliable=False,
+                    description=None,
+                    created_at=now,
+                    updated_at=now,
+                )
+                self._new_domain_names.add(name)
+                logger.info(f"🆕 Staged new domain record for: {name}")
+
+        return {name: self._domains[name] for name in names}
+
+    def add_source(self, item: dict, search_id: UUID, domain: DomainModel) -> SourceModel:
+        now = datetime.now(UTC)
+        source = SourceModel(
+            id=uuid4(),
+            search_id=search_id,
+            url=item["link"],
+            title=item["title"],
+            snippet=item["snippet"],
+            domain_id=domain.id,
+            content=None,
+            credibility_score=domain.credibility_score,
+            created_at=now,
+            updated_at=now,
+        )
+        # Only set for prompt formatting; the source is inserted through core, not the session
+        source.domain = domain
+        self._sources.append(source)
+        return source
+
+    async def flush(self) -> None:
+        """Write everything staged so far in one transaction."""
+        if not self.pending:
+            return
+
+        try:
+            with trace_span("analysis.flush", searches=len(self._searches), sources=len(self._sources)):
+                await self._flush_domains()
+                if self._searches:
+                    await self._session.execute(
+                        insert(SearchModel).values([_column_values(search) for search in self._searches])
+                    )
+                if self._sources:
+                    await self._session.execute(
+                        insert(SourceModel).values([_column_values(source) for source in self._sources])
+                    )
+                await self._session.commit()
+        except Exception:
+            await self._session.rollback()
+            raise
+
+        logger.info(
+            f"💾 Flushed {len(self._new_domain_names)} domains, {len(self._searches)} searches "
+            f"and {len(self._sources)} sources"
+        )
+        self._new_domain_names.clear()
+        self._searches.clear()
+        self._sources.clear()
+
+    async def _flush_domains(self) -> None:
+        if not self._new_domain_names:
+            return
+
+        staged = [self._domains[name] for name in self._new_domain_names]
+        result = await self._session.execute(
+            insert(DomainModel)
+            .values([_column_values(domain) for domain in staged])
+            .on_conflict_do_nothing(index_elements=["domain_name"])
+            .returning(DomainModel.domain_name)
+        )
+        inserted = set(result.scalars().all())
+        lost_race = self._new_domain_names - inserted
+        if not lost_race:
+            return
+
+        # Another request created these domains after we looked them up; use its rows instead
+        logger.warning(f"⚠️ Domains created concurrently, reusing existing rows: {sorted(lost_race)}")
+        result = await self._session.execute(select(DomainModel).where(DomainModel.domain_name.in_(lost_race)))
+        existing = {model.domain_name: model for model in result.scalars().all()}
+        for source in self._sources:
+            replacement = existing.get(source.domain.domain_name)
+            if replacement is not None:
+                source.domain_id = replacement.id
+                source.credibility_score = replacement.credibility_score
+                source.domain = replacement
+        self._domains.update(existing)
+
+
+def _column_values(model) -> dict:
+    return {column.name: getattr(model, column.name) for column in model.__table__.columns}
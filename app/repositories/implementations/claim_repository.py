@@ -1,11 +1,11 @@
 import logging
 from typing import Optional, List, Tuple
 from uuid import UUID
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 
-from app.models.database.models import ClaimModel, ClaimStatus
+from app.models.database.models import CLAIM_EMBEDDING_DIMENSION, ClaimModel, ClaimStatus
 from app.models.domain.claim import Claim
 from app.repositories.base import BaseRepository
 from app.repositories.interfaces.claim_repository import ClaimRepositoryInterface
@@ -78,6 +78,12 @@ class ClaimRepository(BaseRepository[ClaimModel, Claim], ClaimRepositoryInterfac
             logger.exception("Error updating claim status")
             raise
 
+    async def update_embedding(self, claim_id: UUID, embedding: List[float]) -> None:
+        """Store a claim embedding without touching any other column."""
+        stmt = update(self._model_class).where(self._model_class.id == claim_id).values(embedding=embedding)
+        await self._session.execute(stmt)
+        await self._session.commit()
+
     async def get_claims_in_date_range(self, start_date: datetime, end_date: datetime, language: str) -> List[Claim]:
         stmt = select(self._model_class).where(
             and_(
@@ -96,3 +102,48 @@ class ClaimRepository(BaseRepository[ClaimModel, Claim], ClaimRepositoryInterfac
         await self._session.flush()  # get generated fields like id, created_at
         await self._session.commit()
         return [self._to_domain(model) for model in models]
+
+    async def find_similar_claim_ids(
+        self,
+        embedding: List[float],
+        language: str,
+        min_similarity: float,
+        limit: int = 5,
+        exclude_claim_id: Optional[UUID] = None,
+    ) -> List[Tuple[UUID, float]]:
+        """Find analyzed claims in the same language whose embeddings are closest by cosine similarity.
+
+        The distance expression matches ix_claims_embedding_hnsw exactly so Postgres can answer
+        the query from the HNSW index instead of scanning every stored embedding.
+        """
+        vector_expr = f"embedding::vector({CLAIM_EMBEDDING_DIMENSION})"
+        query_expr = f"CAST(:query_embedding AS vector({CLAIM_EMBEDDING_DIMENSION}))"
+        stmt = text(
+            f"""
+            SELECT id, {vector_expr} <=> {query_expr} AS distance
+            FROM claims
+            WHERE embedding IS NOT NULL
+              AND language = :language
+              AND status = :status
+              AND (CAST(:exclude_claim_id AS uuid) IS NULL OR id <> CAST(:exclude_claim_id AS uuid))
+            ORDER BY {vector_expr} <=> {query_expr}
+            LIMIT :limit
+            """
+        )
+        result = await self._session.execute(
+            stmt,
+            {
+                "query_embedding": "[" + ",".join(str(float(value)) for value in embedding) + "]",
+                "language": language,
+                "status": ClaimStatus.analyzed.name,
+                "exclude_claim_id": exclude_claim_id,
+                "limit": limit,
+            },
+        )
+
+        matches = []
+        for claim_id, distance in result.all():
+            similarity = 1.0 - float(distance)
+            if similarity >= min_similarity:
+                matches.append((claim_id, similarity))
+        return matches
@@ -0,0 +1,66 @@
+from datetime import UTC, date, datetime
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.llm.usage import UsageScope
+from app.models.database.models import LLMDailyUsageModel
+from app.models.domain.llm_usage import LLMDailyUsage
+from app.repositories.base import BaseRepository
+from app.repositories.interfaces.llm_usage_repository import LLMUsageRepositoryInterface
+
+_COUNTERS = ("calls", "cached_calls", "prompt_tokens", "completion_tokens", "cost_usd")
+
+
+class LLMUsageRepository(BaseRepository[LLMDailyUsageModel, LLMDailyUsage], LLMUsageRepositoryInterface):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, LLMDailyUsageModel)
+
+    def _to_model(self, usage: LLMDailyUsage) -> LLMDailyUsageModel:
+        return usage.to_model()
+
+    def _to_domain(self, model: LLMDailyUsageModel) -> LLMDailyUsage:
+        return LLMDailyUsage.from_model(model)
+
+    async def add_scope(self, user_id: UUID, scope: UsageScope, day: Optional[date] = None) -> None:
+        """Add a scope's totals to the daily rows, creating them on first use and incrementing them in place after."""
+        breakdown = scope.breakdown()
+        if not breakdown:
+            return
+
+        day = day or datetime.now(UTC).date()
+        now = datetime.now(UTC)
+        table = LLMDailyUsageModel.__table__
+        try:
+            for (stage, model), totals in breakdown.items():
+                statement = insert(LLMDailyUsageModel).values(
+                    user_id=user_id, day=day, stage=stage, model=model, **{name: totals[name] for name in _COUNTERS}
+                )
+                # Concurrent analyses of one user land on the same rows, so add in SQL instead of read-modify-write
+                await self._session.execute(
+                    statement.on_conflict_do_update(
+                        index_elements=["user_id", "day", "stage", "model"],
+                        set_={
+                            **{name: table.c[name] + statement.excluded[name] for name in _COUNTERS},
+                            "updated_at": now,
+                        },
+                    )
+                )
+            await self._session.commit()
+        except Exception:
+            await self._session.rollback()
+            raise
+
+    async def get_daily(self, user_id: UUID, start_date: date, end_date: date) -> List[LLMDailyUsage]:
+        """Get a user's daily usage rows in a date range."""
+        query = select(self._model_class).where(
+            self._model_class.user_id == user_id,
+            self._model_class.day >= start_date,
+            self._model_class.day <= end_date,
+        )
+        query = query.order_by(self._model_class.day, self._model_class.stage, self._model_class.model)
+        result = await self._session.execute(query)
+        return [self._to_domain(model) for model in result.scalars().all()]
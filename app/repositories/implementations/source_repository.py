@@ -5,6 +5,7 @@ from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 
+from app.core.utils.timing import trace_span
 from app.models.domain.source import Source
 from app.repositories.base import BaseRepository
 from app.models.database.models import SourceModel, SearchModel, AnalysisModel, ClaimModel
@@ -42,10 +43,11 @@ class SourceRepository(BaseRepository[SourceModel, Source]):
     async def create_with_domain(self, source: SourceModel) -> Optional[SourceModel]:
         """Create a source with its domain relationship."""
         try:
-            self._session.add(source)
-            await self._session.flush()
-            await self._session.refresh(source, ["domain"])
-            await self._session.commit()
+            with trace_span("source.create_with_domain"):
+                self._session.add(source)
+                await self._session.flush()
+                await self._session.refresh(source, ["domain"])
+                await self._session.commit()
             return source
         except Exception as e:
             await self._session.rollback()
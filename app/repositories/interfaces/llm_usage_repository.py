@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List, Optional
+from uuid import UUID
+
+from app.core.llm.usage import UsageScope
+from app.models.domain.llm_usage import LLMDailyUsage
+
+
+class LLMUsageRepositoryInterface(ABC):
+    """Interface for LLM usage repository operations."""
+
+    @abstractmethod
+    async def add_scope(self, user_id: UUID, scope: UsageScope, day: Optional[date] = None) -> None:
+        """Add the usage recorded in a scope to the user's daily totals."""
+        pass
+
+    @abstractmethod
+    async def get_daily(self, user_id: UUID, start_date: date, end_date: date) -> List[LLMDailyUsage]:
+        """Get a user's daily usage rows in a date range."""
+        pass
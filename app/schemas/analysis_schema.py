@@ -1,7 +1,7 @@
 from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 from uuid import UUID
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from app.schemas.source_schema import SourceRead
 from app.schemas.search_schema import SearchRead
 
@@ -32,6 +32,8 @@ class AnalysisRead(BaseModel):
     created_at: datetime
     sources: Optional[List[SourceRead]] = None
     searches: Optional[List[SearchWithSourcesRead]] = None
+    timing: Optional[Dict[str, Any]] = None
+    llm_usage: Optional[Dict[str, Any]] = None
 
     model_config = ConfigDict(from_attributes=True)
 
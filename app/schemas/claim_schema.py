@@ -12,6 +12,8 @@ class ClaimCreate(BaseModel):
     language: str = "english"
     batch_user_id: str = None
     batch_post_id: str = None
+    # Time budget for analyzing the claim right away, overriding the X-Analysis-Deadline-Ms header
+    deadline_ms: Optional[int] = None
 
 
 class ClaimStatusUpdate(BaseModel):
@@ -44,6 +46,15 @@ class ClaimRead(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class SimilarClaimRead(BaseModel):
+    """Schema for a previously analyzed claim similar to a given claim."""
+
+    claim: ClaimRead
+    analysis_id: UUID
+    veracity_score: float
+    similarity: float
+
+
 class ClaimList(BaseModel):
     """Schema for paginated claim list."""
 
@@ -0,0 +1,32 @@
+from pydantic import BaseModel, ConfigDict
+from datetime import date
+from uuid import UUID
+from typing import Any, Dict, Optional, List
+
+
+class UsageTotals(BaseModel):
+    calls: int
+    cached_calls: int
+    prompt_tokens: int
+    completion_tokens: int
+    cost_usd: float
+
+
+class DailyUsageRead(UsageTotals):
+    day: date
+    stage: str
+    model: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class UserUsageList(BaseModel):
+    start_date: date
+    end_date: date
+    items: List[DailyUsageRead]
+    totals: UsageTotals
+
+
+class AnalysisUsageRead(BaseModel):
+    analysis_id: UUID
+    usage: Optional[Dict[str, Any]] = None
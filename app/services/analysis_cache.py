@@ -0,0 +1,98 @@
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from app.core.config import settings
+from app.core.utils.text import normalize_claim_text
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str]
+
+
+@dataclass
+class _CacheEntry:
+    analysis_id: UUID
+    stored_at: float
+
+
+class ClaimAnalysisCache:
+    """In-process LRU cache mapping a normalized claim and language to its last completed analysis.
+
+    Only the analysis id is cached; the analysis itself (with searches and sources) is read back
+    from the database on a hit, so entries stay small and never hold on to ORM objects.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[CacheKey, _CacheEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(claim_text: str, language: str) -> CacheKey:
+        return normalize_claim_text(claim_text), (language or "").lower()
+
+    def get(self, claim_text: str, language: str) -> Optional[UUID]:
+        """Return the cached analysis id for a claim, or None on a miss or stale entry."""
+        key = self.make_key(claim_text, language)
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if time.monotonic() - entry.stored_at > self._ttl_seconds:
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.analysis_id
+
+    def put(self, claim_text: str, language: str, analysis_id: UUID) -> None:
+        key = self.make_key(claim_text, language)
+        self._entries[key] = _CacheEntry(analysis_id=analysis_id, stored_at=time.monotonic())
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, claim_text: str, language: str) -> None:
+        self._entries.pop(self.make_key(claim_text, language), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self._max_entries,
+            "ttl_seconds": self._ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "expirations": self.expirations,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+@lru_cache()
+def get_analysis_cache() -> Optional[ClaimAnalysisCache]:
+    """Process-wide analysis cache, or None when caching is disabled."""
+    if not settings.ANALYSIS_CACHE_ENABLED:
+        return None
+    return ClaimAnalysisCache(
+        max_entries=settings.ANALYSIS_CACHE_MAX_ENTRIES, ttl_seconds=settings.ANALYSIS_CACHE_TTL_SECONDS
+    )
@@ -0,0 +1,69 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.domain.analysis import Analysis
+from app.models.domain.claim import Claim
+from app.models.domain.claim_conversation import ClaimConversation
+from app.models.domain.conversation import Conversation
+from app.repositories.implementations.analysis_repository import AnalysisRepository
+from app.repositories.implementations.analysis_unit_of_work import AnalysisUnitOfWork
+from app.repositories.implementations.claim_conversation_repository import ClaimConversationRepository
+from app.repositories.implementations.claim_repository import ClaimRepository
+from app.repositories.implementations.conversation_repository import ConversationRepository
+from app.repositories.implementations.domain_repository import DomainRepository
+from app.repositories.implementations.llm_usage_repository import LLMUsageRepository
+from app.repositories.implementations.message_repository import MessageRepository
+from app.repositories.implementations.search_repository import SearchRepository
+from app.repositories.implementations.source_repository import SourceRepository
+from app.services.domain_service import DomainService
+from app.services.interfaces.web_search_service import WebSearchServiceInterface
+
+
+@dataclass
+class AnalysisContext:
+    """
+    Everything that belongs to a single analysis run: its database session, the repositories and
+    search persistence bound to that session, and the claim, analysis and conversations it works on.
+
+    The orchestrator itself holds no per-run state, so one instance can serve any number of
+    concurrent runs as long as each has its own context.
+    """
+
+    session: AsyncSession
+    claim_repo: ClaimRepository
+    analysis_repo: AnalysisRepository
+    conversation_repo: ConversationRepository
+    claim_conversation_repo: ClaimConversationRepository
+    message_repo: MessageRepository
+    search_repo: SearchRepository
+    usage_repo: LLMUsageRepository
+    web_search: WebSearchServiceInterface
+    write_behind: bool = False
+    claim: Optional[Claim] = None
+    analysis: Optional[Analysis] = None
+    conversation: Optional[Conversation] = None
+    claim_conversation: Optional[ClaimConversation] = None
+
+    @classmethod
+    def for_session(
+        cls, session: AsyncSession, web_search: WebSearchServiceInterface, write_behind: bool = False
+    ) -> "AnalysisContext":
+        """Build a context whose repositories, and search persistence, all use ``session``."""
+        source_repository = SourceRepository(session)
+        return cls(
+            session=session,
+            claim_repo=ClaimRepository(session),
+            analysis_repo=AnalysisRepository(session),
+            conversation_repo=ConversationRepository(session),
+            claim_conversation_repo=ClaimConversationRepository(session),
+            message_repo=MessageRepository(session),
+            search_repo=SearchRepository(session),
+            usage_repo=LLMUsageRepository(session),
+            web_search=web_search.bind(DomainService(DomainRepository(session)), source_repository),
+            write_behind=write_behind,
+        )
+
+    def new_unit_of_work(self) -> Optional[AnalysisUnitOfWork]:
+        return AnalysisUnitOfWork(self.session) if self.write_behind else None
@@ -0,0 +1,34 @@
+import time
+from typing import Optional
+
+
+class AnalysisDeadline:
+    """
+    Wall-clock budget for a single claim analysis.
+
+    The orchestrator keeps ``reserve_seconds`` of the budget back for the final verdict, and
+    spends the rest on agent turns and searches. Stages that would not fit are skipped, so a
+    tight deadline yields a verdict from fewer sources rather than an error.
+    """
+
+    def __init__(self, budget_seconds: float, reserve_seconds: float):
+        self.budget_seconds = budget_seconds
+        self.reserve_seconds = min(reserve_seconds, budget_seconds)
+        self._expires_at = time.monotonic() + budget_seconds
+
+    @classmethod
+    def from_ms(cls, deadline_ms: Optional[int], reserve_seconds: float) -> Optional["AnalysisDeadline"]:
+        if not deadline_ms or deadline_ms <= 0:
+            return None
+        return cls(deadline_ms / 1000, reserve_seconds)
+
+    def remaining(self) -> float:
+        return max(0.0, self._expires_at - time.monotonic())
+
+    def remaining_for_research(self) -> float:
+        """Time left for agent turns and searches once the verdict reserve is set aside."""
+        return max(0.0, self.remaining() - self.reserve_seconds)
+
+    def verdict_timeout(self) -> float:
+        """Timeout for the final verdict: whatever is left, but never less than the reserve."""
+        return max(self.remaining(), self.reserve_seconds)
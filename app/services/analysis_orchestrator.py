@@ -1,13 +1,28 @@
+import asyncio
 import logging
-from typing import AsyncGenerator, Dict, Any, List, Optional, NamedTuple
+from dataclasses import dataclass, field
+from typing import AsyncGenerator, Dict, Any, List, Optional, NamedTuple, Set
 from uuid import UUID, uuid4
 from datetime import UTC, datetime
 import json
 import re
+import time
 
-from app.core.exceptions import NotAuthorizedException, NotFoundException, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.exceptions import MalformedLLMOutputError, NotAuthorizedException, NotFoundException, ValidationError
 from app.core.llm.interfaces import LLMProvider
-from app.models.database.models import AnalysisStatus, ClaimStatus, ConversationStatus, MessageSenderType
+from app.core.llm.usage import UsageScope, end_usage_scope, start_usage_scope
+from app.core.llm.veracity_parser import VeracityStreamParser
+from app.core.utils.timing import StageTrace, TimingSpan, end_trace, start_trace
+from app.models.database.models import (
+    AnalysisStatus,
+    ClaimStatus,
+    ConversationStatus,
+    MessageSenderType,
+    SourceModel,
+)
 from app.models.domain.claim import Claim
 from app.models.domain.analysis import Analysis
 from app.models.domain.search import Search
@@ -15,14 +30,17 @@ from app.models.domain.message import Message
 from app.core.llm.messages import Message as LLMMessage
 from app.models.domain.conversation import Conversation
 from app.models.domain.claim_conversation import ClaimConversation
-from app.repositories.implementations.claim_conversation_repository import ClaimConversationRepository
-from app.repositories.implementations.claim_repository import ClaimRepository
-from app.repositories.implementations.analysis_repository import AnalysisRepository
-from app.repositories.implementations.message_repository import MessageRepository
-from app.repositories.implementations.conversation_repository import ConversationRepository
-from app.repositories.implementations.source_repository import SourceRepository
-from app.repositories.implementations.search_repository import SearchRepository
+from app.repositories.implementations.analysis_unit_of_work import AnalysisUnitOfWork
 from app.services.interfaces.web_search_service import WebSearchServiceInterface
+from app.services.analysis_cache import ClaimAnalysisCache
+from app.services.analysis_context import AnalysisContext
+from app.services.analysis_deadline import AnalysisDeadline
+from app.services.analysis_single_flight import AnalysisEvent, AnalysisFlightBackend
+from app.services.prompt_assembler import AnalysisPromptAssembler
+from app.services.claim_detector import ClaimDetector
+from app.services.sufficiency_policy import EvidenceSufficiencyPolicy, get_sufficiency_policy
+from app.core.llm.tokens import get_token_counter
+from app.services.interfaces.embedding_generator import EmbeddingGeneratorInterface
 
 from app.core.llm.prompts import AnalysisPrompt
 
@@ -31,6 +49,19 @@ logger = logging.getLogger(__name__)
 MAX_NUM_TURNS: int = 3  # Reduced from 10 for faster analysis (15-45 sec instead of 5+ min)
 MAX_SEARCH_RESULTS: int = 10
 
+_SEARCH_LINE_PATTERN = re.compile(r"SEARCH\s*:\s+\S.*?\n")
+_READY_ONLY_PATTERN = re.compile(r"^\W*(ready|prêt|prête)\W*$", re.IGNORECASE)
+_READY_PATTERN = re.compile(r"\b(ready|prêt|prête)\b", re.IGNORECASE)
+_RESULT_PREFIXES = {"english": "Search result: ", "french": "Résultat(s) de la recherche sur le Web: "}
+
+
+@dataclass
+class _ResearchState:
+    """What the search turns of one analysis found, filled in as they run."""
+
+    sources: List[SourceModel] = field(default_factory=list)
+    best_effort: bool = False
+
 
 class _KeywordExtractionOutput(NamedTuple):
     """Represent the part up to the matched string, and the match itself."""
@@ -39,48 +70,90 @@ class _KeywordExtractionOutput(NamedTuple):
     matched_content: str
 
 
-class AnalysisState:
-    def __init__(self):
-        self.current_claim: Optional[Claim] = None
-        self.current_analysis: Optional[Analysis] = None
-        self.current_conversation: Optional[Conversation] = None
-        self.current_claim_conversation: Optional[ClaimConversation] = None
-        self.analysis_text: List[str] = []
-        self.is_complete: bool = False
+class AnalysisOrchestrator:
+    """
+    Run claim analyses and claim discussions.
 
+    An orchestrator only holds long-lived collaborators (the LLM provider, the search client and
+    the shared caches), so a single instance is shared by the whole process. Everything tied to
+    one run, including the database session, lives in the ``AnalysisContext`` passed to each call.
+    """
 
-class AnalysisOrchestrator:
     def __init__(
         self,
         llm_provider: LLMProvider,
-        claim_repo: ClaimRepository,
-        analysis_repo: AnalysisRepository,
-        conversation_repo: ConversationRepository,
-        claim_conversation_repo: ClaimConversationRepository,
-        message_repo: MessageRepository,
-        source_repo: SourceRepository,
-        search_repo: SearchRepository,
         web_search_service: WebSearchServiceInterface,
+        analysis_cache: Optional[ClaimAnalysisCache] = None,
+        embedding_generator: Optional[EmbeddingGeneratorInterface] = None,
+        write_behind: bool = False,
+        analysis_flights: Optional[AnalysisFlightBackend] = None,
+        claim_detector: Optional[ClaimDetector] = None,
+        sufficiency_policy: Optional[EvidenceSufficiencyPolicy] = None,
     ):
         self._llm = llm_provider
-        self._claim_repo = claim_repo
-        self._analysis_repo = analysis_repo
-        self._conversation_repo = conversation_repo
-        self._claim_conversation_repo = claim_conversation_repo
-        self._message_repo = message_repo
-        self._source_repo = source_repo
-        self._search_repo = search_repo
         self._web_search = web_search_service
-        self._analysis_state = AnalysisState()
+        self._analysis_cache = analysis_cache
+        self._embedding_generator = embedding_generator
+        self._write_behind = write_behind
+        self._analysis_flights = analysis_flights
+        self._claim_detector = claim_detector or ClaimDetector(llm_provider, settings.CLAIM_DETECTION_CACHE_SIZE)
+        self._sufficiency_policy = sufficiency_policy or get_sufficiency_policy()
+        self._parallel_search = settings.ANALYSIS_PARALLEL_SEARCH
+        self._max_parallel_queries = settings.ANALYSIS_MAX_PARALLEL_QUERIES
+        self._semantic_reuse = settings.ANALYSIS_SEMANTIC_REUSE_ENABLED
+        self._semantic_reuse_threshold = settings.ANALYSIS_SEMANTIC_REUSE_THRESHOLD
+
+    def new_context(self, session: AsyncSession) -> AnalysisContext:
+        """Start the per-run state for an analysis or discussion that uses ``session``."""
+        return AnalysisContext.for_session(session, self._web_search, write_behind=self._write_behind)
 
     async def _generate_analysis(
-        self, claim_text: str, context: str, language: str
+        self,
+        ctx: AnalysisContext,
+        claim_text: str,
+        context: str,
+        language: str,
+        emit_timing: bool = False,
+        deadline: Optional[AnalysisDeadline] = None,
     ) -> AsyncGenerator[Dict[str, Any], None]:
-        """Generate analysis for a claim with web search and source management."""
+        """Generate analysis for a claim with web search and source management.
+
+        Each stage is timed; with ``emit_timing`` a ``timing`` event follows every stage, and the
+        per-stage summary is logged and stored with the completed analysis either way. The tokens
+        and cost of its LLM calls are stored with it too, and added to the user's daily usage.
+
+        With a ``deadline``, turns and searches stop once the next one would not fit in the time
+        left before the verdict reserve, and the verdict is given from the sources found so far.
+        """
+        trace = start_trace("analysis")
+        usage = start_usage_scope("analysis")
         try:
+            with trace.span("analysis.reuse") as reuse_span:
+                cached_analysis = await self._reuse_cached_analysis(ctx, claim_text, language)
+                if cached_analysis is None:
+                    cached_analysis = await self._reuse_similar_analysis(ctx, claim_text, language)
+            if emit_timing:
+                yield self._timing_event(reuse_span)
+            if cached_analysis is not None:
+                cached_sources = [
+                    source for search in (cached_analysis.searches or []) for source in (search.sources or [])
+                ]
+                yield {"type": "status", "content": "Reusing a recent analysis of this claim..."}
+                yield {
+                    "type": "analysis_complete",
+                    "content": {
+                        "analysis_id": str(cached_analysis.id),
+                        "veracity_score": cached_analysis.veracity_score,
+                        "num_sources": len(cached_sources),
+                        "source_credibility": self._web_search.calculate_overall_credibility(cached_sources),
+                        "cached": True,
+                    },
+                }
+                return
+
             initial_analysis = Analysis(
                 id=uuid4(),
-                claim_id=self._analysis_state.current_claim.id,
+                claim_id=ctx.claim.id,
                 veracity_score=0.0,
                 confidence_score=0.0,
                 analysis_text="",
@@ -88,78 +161,17 @@ class AnalysisOrchestrator:
                 created_at=datetime.now(UTC),
                 updated_at=datetime.now(UTC),
             )
-            current_analysis = await self._analysis_repo.create(initial_analysis)
+            current_analysis = await ctx.analysis_repo.create(initial_analysis)
+            ctx.analysis = current_analysis
 
             yield {"type": "status", "content": "Searching for relevant sources..."}
 
-            query = self._query_initial(claim_text, language)
-            messages = [LLMMessage(role="user", content=query)]
-            all_sources = []
-            for turns in range(MAX_NUM_TURNS):
-
-                response = await self._llm.generate_response(messages)
-
-                main_agent_message = response.text
-
-                assert main_agent_message is not None, (
-                    "Invalid Main Agent API response:",
-                    response,
-                )
-
-                # If search is requested in a message, truncate that message
-                # up to the search request. (Discard anything after the query.)
-
-                search_request_match = self._extract_search_query_or_none(main_agent_message, language)
-                if search_request_match is not None:
-                    initial_search = Search(
-                        id=uuid4(),
-                        analysis_id=current_analysis.id,
-                        prompt=search_request_match.matched_content,
-                        summary=search_request_match.content_up_to_match,
-                        created_at=datetime.now(UTC),
-                        updated_at=datetime.now(UTC),
-                    )
-                    current_search = await self._search_repo.create(initial_search)
-                    sources = await self._web_search.search_and_create_sources(
-                        claim_text=search_request_match.matched_content, search_id=current_search.id, language=language
-                    )
-
-                    all_sources += sources
-
-                    search_response = self._web_search.format_sources_for_prompt(sources, language)
-
-                    if language == "english":
-                        messages += [
-                            LLMMessage(role="assistant", content=main_agent_message),
-                            LLMMessage(role="user", content=f"Search result: {search_response}"),
-                        ]
-                    elif language == "french":
-                        messages += [
-                            LLMMessage(role="assistant", content=main_agent_message),
-                            LLMMessage(
-                                role="user", content=f"Résultat(s) de la recherche sur le Web: {search_response}"
-                            ),
-                        ]
-                    else:
-                        current_analysis.status = AnalysisStatus.failed.value
-                        updated_analysis = await self._analysis_repo.update(current_analysis)
-                        raise ValidationError("Claim Language is invalid")
-
-                    # Early termination: if we have enough high-quality sources, stop searching
-                    if len(all_sources) >= 8:  # If we have 8+ sources total
-                        logger.info(f"Early termination: Found {len(all_sources)} sources, sufficient for analysis")
-                        break
-
-                    continue
-                else:
-                    messages += [LLMMessage(role="assistant", content=main_agent_message)]
-
-                if (
-                    main_agent_message.strip().lower().endswith("ready")
-                    or main_agent_message.strip().lower().endswith("prêt")
-                    or main_agent_message.strip().lower().endswith("prête")
-                ):
-                    break
+            prompt = self._new_prompt_assembler(claim_text, language)
+            research = _ResearchState()
+            async for event in self._research(ctx, prompt, current_analysis, language, trace, research, deadline):
+                if emit_timing:
+                    yield event
+            all_sources = research.sources
 
             source_credibility = self._web_search.calculate_overall_credibility(all_sources)
 
@@ -171,127 +183,462 @@ class AnalysisOrchestrator:
             else:
                 yield {
                     "type": "status",
-                    "content": f"Found {len(sources)} relevant sources (overall credibility: {source_credibility:.2f})",
+                    "content": f"Found {len(all_sources)} relevant sources (overall credibility: {source_credibility:.2f})",
+                }
+
+            if research.best_effort:
+                yield {
+                    "type": "status",
+                    "content": "Time budget reached, giving a verdict from the sources found so far",
                 }
 
-            sources_text = self._web_search.format_sources_for_prompt(all_sources, language)
-            logger.debug(f"Sources for all searches to be analyzed {sources_text}")
             yield {"type": "status", "content": "Analyzing claim with gathered sources..."}
 
-            if language == "english":
-                messages += [LLMMessage(role="user", content=AnalysisPrompt.GET_VERACITY)]
-            elif language == "french":
-                messages += [LLMMessage(role="user", content=AnalysisPrompt.GET_VERACITY_FR)]
+            if language == "french":
+                messages = prompt.verdict_messages(AnalysisPrompt.GET_VERACITY_FR, AnalysisPrompt.VERDICT_SOURCES_FR)
+            else:
+                messages = prompt.verdict_messages(AnalysisPrompt.GET_VERACITY, AnalysisPrompt.VERDICT_SOURCES)
 
-            analysis_text = []
             logger.debug(messages)
-            async for chunk in self._llm.generate_stream(messages):
-                if not chunk.is_complete:
-                    analysis_text.append(chunk.text)
-                    yield {"type": "content", "content": chunk.text}
-                else:
-                    full_text = "".join(analysis_text)
-
-                    try:
-                        # Clean the text before parsing
-                        # fmt: off
-                        cleaned_text = (
-                            full_text.strip()
-                            .replace("\r", "")  # Remove carriage returns
-                            .replace("\x00", "")  # Remove null bytes
-                            .replace("\x1a", "")  # Remove SUB characters
-                            .replace("\n", "")
-                            .replace("\\\'", "'")
-                            .replace("\t", "")
-                        )
-                        # fmt: on
-                        # Try to find the JSON object if there's additional text
-                        try:
-                            start_idx = cleaned_text.find("{")
-                            end_idx = cleaned_text.rindex("}") + 1
-                            if start_idx != -1 and end_idx != -1:
-                                cleaned_text = cleaned_text[start_idx:end_idx]
-                        except ValueError:
-                            pass
-
-                        response_data = json.loads(cleaned_text)
-
-                        logger.debug(response_data)
-
-                        veracity_score = int(response_data.get("veracity_score", 0))
-                        analysis_content = str(response_data.get("analysis", "No analysis provided"))
-
-                        veracity_score = max(0, min(100, veracity_score))
-
-                        current_analysis.veracity_score = float(veracity_score) / 100
-                        current_analysis.analysis_text = analysis_content
-                        current_analysis.status = AnalysisStatus.completed.value
-                        current_analysis.updated_at = datetime.now(UTC)
-
-                        updated_analysis = await self._analysis_repo.update(current_analysis)
-
-                        yield {
-                            "type": "analysis_complete",
-                            "content": {
-                                "analysis_id": str(updated_analysis.id),
-                                "veracity_score": updated_analysis.veracity_score,
-                                "num_sources": len(all_sources),
-                                "source_credibility": source_credibility,
-                            },
-                        }
-
-                    except json.JSONDecodeError as e:
-                        logger.error(f"JSON parsing error: {str(e)}\nFull text: {full_text}")
-                        import re
-
-                        try:
-                            veracity_match = re.search(r'"veracity_score":\s*(0?\.\d+)', cleaned_text)
-                            analysis_match = re.search(r'"analysis":\s*"([^"]+)"', cleaned_text)
-
-                            if veracity_match and analysis_match:
-                                veracity_score = int(veracity_match.group(1))
-                                analysis_content = analysis_match.group(1)
-
-                                current_analysis.veracity_score = float(veracity_score) / 100
-                                current_analysis.analysis_text = analysis_content
-                                current_analysis.status = AnalysisStatus.completed.value
-                                current_analysis.updated_at = datetime.now(UTC)
-
-                                updated_analysis = await self._analysis_repo.update(current_analysis)
-
-                                yield {
-                                    "type": "analysis_complete",
-                                    "content": {
-                                        "analysis_id": str(updated_analysis.id),
-                                        "veracity_score": updated_analysis.veracity_score,
-                                        "num_sources": len(all_sources),
-                                        "source_credibility": source_credibility,
-                                    },
-                                }
-                            else:
-                                raise ValueError("Could not extract required fields using regex")
-
-                        except Exception as regex_error:
-                            logger.error(f"Regex fallback failed: {str(regex_error)}")
-                            current_analysis.status = AnalysisStatus.failed.value
-                            await self._analysis_repo.update(current_analysis)
-                            yield {"type": "error", "content": f"Error parsing analysis response: {str(e)}"}
-                            raise
-
-                    except Exception as e:
-                        logger.error(f"Error processing analysis: {str(e)}")
-                        current_analysis.status = AnalysisStatus.failed.value
-                        await self._analysis_repo.update(current_analysis)
-                        yield {"type": "error", "content": f"Error creating analysis: {str(e)}"}
-                        raise
+            parser = VeracityStreamParser()
+            try:
+                async for event in self._stream_verdict(messages, parser, trace, research, deadline):
+                    if event["type"] != "timing" or emit_timing:
+                        yield event
+
+                with trace.span("veracity.parse"):
+                    parsed = parser.finish()
+            except MalformedLLMOutputError as e:
+                logger.error(f"Error parsing analysis response: {str(e)}\nFull text: {parser.text}")
+                current_analysis.status = AnalysisStatus.failed.value
+                await ctx.analysis_repo.update(current_analysis)
+                yield {"type": "error", "content": f"Error parsing analysis response: {str(e)}"}
+                raise
+
+            try:
+                current_analysis.veracity_score = float(parsed.veracity_score) / 100
+                current_analysis.analysis_text = parsed.analysis
+                current_analysis.status = AnalysisStatus.completed.value
+                current_analysis.updated_at = datetime.now(UTC)
+
+                with trace.span("analysis.persist") as persist_span:
+                    current_analysis.timing = trace.summary()
+                    current_analysis.llm_usage = usage.summary()
+                    updated_analysis = await ctx.analysis_repo.update(current_analysis)
+                self._cache_completed_analysis(claim_text, language, updated_analysis.id)
+
+                timing_summary = trace.summary()
+                logger.info(f"Analysis {updated_analysis.id} stage timings: {timing_summary}")
+                logger.info(
+                    f"Analysis {updated_analysis.id} LLM usage: {len(usage.calls)} calls, "
+                    f"${current_analysis.llm_usage['cost_usd']:.4f}"
+                )
+                if emit_timing:
+                    yield self._timing_event(persist_span)
+                    yield {"type": "timing", "content": {"summary": timing_summary}}
+
+                yield {
+                    "type": "analysis_complete",
+                    "content": {
+                        "analysis_id": str(updated_analysis.id),
+                        "veracity_score": updated_analysis.veracity_score,
+                        "num_sources": len(all_sources),
+                        "source_credibility": source_credibility,
+                        "best_effort": research.best_effort,
+                    },
+                }
+
+            except Exception as e:
+                logger.error(f"Error processing analysis: {str(e)}")
+                current_analysis.status = AnalysisStatus.failed.value
+                await ctx.analysis_repo.update(current_analysis)
+                yield {"type": "error", "content": f"Error creating analysis: {str(e)}"}
+                raise
 
         except Exception as e:
             logger.error(f"Error in _generate_analysis: {str(e)}", exc_info=True)
+            logger.info(f"Stage timings before failure: {trace.summary()}")
             yield {"type": "error", "content": str(e)}
             raise
+        finally:
+            end_trace()
+            end_usage_scope(usage)
+            await self._record_usage(ctx, usage, ctx.claim.user_id if ctx.claim else None)
+
+    async def _research(
+        self,
+        ctx: AnalysisContext,
+        prompt: AnalysisPromptAssembler,
+        analysis: Analysis,
+        language: str,
+        trace: StageTrace,
+        research: "_ResearchState",
+        deadline: Optional[AnalysisDeadline] = None,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Run the agent's search turns, collecting sources into ``research``; yields a timing event per stage.
+
+        Stops when the agent is ready, the evidence is sufficient, the turns run out, or the deadline
+        leaves no room for another turn (which marks the research as best effort).
+        """
+        seen_urls: Set[str] = set()
+        # Searches and sources are written once per turn instead of one commit per row
+        unit_of_work = ctx.new_unit_of_work()
+        slowest_turn_seconds = 0.0
+        for turn in range(1, MAX_NUM_TURNS + 1):
+            turn_started = time.monotonic()
+            if deadline is not None and deadline.remaining_for_research() <= slowest_turn_seconds:
+                logger.info(
+                    f"Skipping turn {turn}: {deadline.remaining_for_research():.1f}s left before the verdict, "
+                    f"slowest turn so far took {slowest_turn_seconds:.1f}s"
+                )
+                research.best_effort = True
+                return
+
+            try:
+                with trace.span("llm.agent_turn", turn=turn) as turn_span:
+                    main_agent_message = await self._stream_agent_turn(
+                        prompt.agent_messages(),
+                        language,
+                        timeout=deadline.remaining_for_research() if deadline else None,
+                    )
+            except TimeoutError:
+                logger.warning(f"Turn {turn} ran out of time; giving a verdict from the sources found so far")
+                research.best_effort = True
+                return
+            yield self._timing_event(turn_span)
+
+            assert main_agent_message, "Invalid Main Agent API response: empty message"
+
+            # If search is requested in a message, truncate that message
+            # up to the search request. (Discard anything after the query.)
+
+            if self._parallel_search:
+                search_requests = self._extract_search_queries(main_agent_message, language)
+            else:
+                search_request = self._extract_search_query_or_none(main_agent_message, language)
+                search_requests = [search_request] if search_request is not None else []
+
+            if not search_requests:
+                prompt.add_turn(main_agent_message)
+                if main_agent_message.strip().lower().endswith(("ready", "prêt", "prête")):
+                    return
+                continue
+
+            search_timeout = deadline.remaining_for_research() if deadline else None
+            with trace.span("search", turn=turn) as search_span:
+                if self._parallel_search:
+                    sources = await self._run_parallel_searches(
+                        ctx, search_requests, analysis.id, language, seen_urls, unit_of_work, timeout=search_timeout
+                    )
+                else:
+                    sources = await self._run_single_search(
+                        ctx, search_requests[0], analysis.id, language, unit_of_work, timeout=search_timeout
+                    )
+                if unit_of_work is not None:
+                    await unit_of_work.flush()
+                search_span.attributes["num_sources"] = len(sources)
+            yield self._timing_event(search_span)
+
+            research.sources += sources
+            prompt.add_turn(main_agent_message, sources)
+            slowest_turn_seconds = max(slowest_turn_seconds, time.monotonic() - turn_started)
+
+            # Early termination: stop searching once the evidence is good enough for a verdict
+            if self._sufficiency_policy.should_stop(research.sources, turn):
+                logger.info(f"Early termination after turn {turn}: evidence is sufficient for analysis")
+                return
+
+    async def _run_single_search(
+        self,
+        ctx: AnalysisContext,
+        search_request: _KeywordExtractionOutput,
+        analysis_id: UUID,
+        language: str,
+        unit_of_work: Optional[AnalysisUnitOfWork],
+        timeout: Optional[float] = None,
+    ) -> List[SourceModel]:
+        """Record and run the one search a turn asked for."""
+        initial_search = Search(
+            id=uuid4(),
+            analysis_id=analysis_id,
+            prompt=search_request.matched_content,
+            summary=search_request.content_up_to_match,
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
+        )
+        if unit_of_work is not None:
+            current_search = unit_of_work.add_search(initial_search)
+        else:
+            current_search = await ctx.search_repo.create(initial_search)
+        return await ctx.web_search.search_and_create_sources(
+            claim_text=search_request.matched_content,
+            search_id=current_search.id,
+            language=language,
+            unit_of_work=unit_of_work,
+            timeout=timeout,
+        )
+
+    async def _stream_verdict(
+        self,
+        messages: List[LLMMessage],
+        parser: VeracityStreamParser,
+        trace: StageTrace,
+        research: "_ResearchState",
+        deadline: Optional[AnalysisDeadline] = None,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Stream the verdict into ``parser``, yielding its text, the score as soon as it is known, and a timing event.
+
+        A verdict that runs out of time keeps what arrived and marks the research as best effort.
+        """
+        stream = self._llm.generate_stream(
+            messages,
+            timeout=deadline.verdict_timeout() if deadline else None,
+            max_tokens=settings.ANALYSIS_VERDICT_MAX_TOKENS,
+            response_format={"type": "json_object"} if settings.ANALYSIS_VERDICT_JSON_MODE else None,
+        )
+        with trace.span("llm.veracity") as veracity_span:
+            try:
+                async for chunk in stream:
+                    if chunk.is_complete:
+                        break
+                    yield {"type": "content", "content": chunk.text}
+
+                    early_score = parser.feed(chunk.text)
+                    if early_score is not None:
+                        yield {"type": "veracity", "content": {"veracity_score": float(early_score) / 100}}
+            except TimeoutError:
+                # Keep whatever arrived; finish() still fails if the score never did
+                logger.warning("Verdict stream timed out, using the partial response")
+                research.best_effort = True
+            finally:
+                # Closed here rather than by the garbage collector, so the provider and the usage
+                # metering are done with the call before the analysis is stored
+                await stream.aclose()
+        yield self._timing_event(veracity_span)
+
+    @staticmethod
+    async def _record_usage(ctx: AnalysisContext, usage: UsageScope, user_id: Optional[UUID]) -> None:
+        """Add a finished scope to the user's daily usage. Losing a rollup is not worth failing the request over."""
+        if user_id is None or not usage.calls:
+            return
+        try:
+            await ctx.usage_repo.add_scope(user_id, usage)
+        except Exception as e:
+            logger.warning(f"Could not record LLM usage for user {user_id}: {str(e)}")
+
+    @staticmethod
+    def _make_deadline(deadline_ms: Optional[int]) -> Optional[AnalysisDeadline]:
+        """Start the clock for a request's deadline, falling back to the configured default."""
+        return AnalysisDeadline.from_ms(
+            deadline_ms or settings.ANALYSIS_DEFAULT_DEADLINE_MS, settings.ANALYSIS_VERDICT_RESERVE_SECONDS
+        )
+
+    @staticmethod
+    def _timing_event(span: TimingSpan) -> Dict[str, Any]:
+        return {"type": "timing", "content": span.to_dict()}
+
+    async def _generate_analysis_once(
+        self,
+        ctx: AnalysisContext,
+        claim_text: str,
+        context: str,
+        language: str,
+        emit_timing: bool = False,
+        deadline: Optional[AnalysisDeadline] = None,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Run ``_generate_analysis``, sharing one run between concurrent requests for the same claim.
+
+        The first request for a normalized claim text and language leads and publishes its events.
+        Requests arriving while it runs replay and follow those events, and get a copy of the
+        finished analysis attached to their own claim. If the leader fails or goes away, each
+        follower falls back to analyzing the claim itself; followers only get the leader's verdict
+        text once it has completed, so a fallback never streams a second verdict after a partial one.
+        """
+        if self._analysis_flights is None:
+            async for event in self._generate_analysis(ctx, claim_text, context, language, emit_timing, deadline):
+                yield event
+            return
+
+        key = self._analysis_flights.make_key(claim_text, language)
+        leader_events = await self._analysis_flights.join(key)
+
+        if leader_events is None:
+            try:
+                async for event in self._generate_analysis(ctx, claim_text, context, language, True, deadline):
+                    await self._analysis_flights.publish(key, event)
+                    if event["type"] != "timing" or emit_timing:
+                        yield event
+            finally:
+                await self._analysis_flights.complete(key)
+            return
+
+        # The verdict text and score are held back until the leader completes: relayed live, a leader
+        # failing mid-verdict would leave the client with two verdicts once this request falls back
+        held_back: List[AnalysisEvent] = []
+        async for event in leader_events:
+            if event["type"] == "analysis_complete":
+                shared = await self._adopt_shared_analysis(ctx, event)
+                if shared is not None:
+                    for verdict_event in held_back:
+                        yield verdict_event
+                    yield shared
+                    return
+                break
+            if event["type"] == "error":
+                break
+            if event["type"] in ("content", "veracity"):
+                held_back.append(event)
+            elif event["type"] != "timing" or emit_timing:
+                yield event
+
+        logger.warning("Shared analysis did not complete, analyzing the claim independently")
+        yield {"type": "status", "content": "Analyzing claim independently..."}
+        async for event in self._generate_analysis(ctx, claim_text, context, language, emit_timing, deadline):
+            yield event
+
+    async def _adopt_shared_analysis(self, ctx: AnalysisContext, event: AnalysisEvent) -> Optional[Dict[str, Any]]:
+        """Copy the leader's finished analysis onto this request's claim and rewrite its completion event."""
+        try:
+            analysis = await ctx.analysis_repo.clone_to_claim(UUID(event["content"]["analysis_id"]), ctx.claim.id)
+        except Exception as e:
+            logger.error(f"Could not copy shared analysis {event['content'].get('analysis_id')}: {str(e)}")
+            return None
+        if analysis is None:
+            return None
+
+        return {
+            "type": "analysis_complete",
+            "content": {**event["content"], "analysis_id": str(analysis.id), "coalesced": True},
+        }
+
+    async def _stream_agent_turn(
+        self, messages: List[LLMMessage], language: str, timeout: Optional[float] = None
+    ) -> str:
+        """
+        Stream one agent turn and stop generating as soon as the turn's outcome is known.
+
+        The stream is closed once a complete "SEARCH: query" line has arrived (or, in parallel
+        search mode, once the maximum number of query lines has), or when the first line is just the
+        READY/PRÊT token. Closing the generator aborts the provider request, so no time or tokens
+        are spent on text the orchestrator would discard, and the search can start right away.
+
+        The provider is also told where to stop, so a turn ends server-side even when the abort is
+        slow to land: at a search result prefix starting a new line, which the model writes when it
+        goes on to invent the results itself, or after a completion cap sized to the number of
+        search requests. A turn that ends there with neither a search request nor READY is logged.
+
+        Raises ``TimeoutError`` if the turn has not finished within ``timeout`` seconds.
+        """
+        if language not in ("english", "french"):
+            raise ValidationError("Claim Language is invalid")
+
+        max_search_lines = self._max_parallel_queries if self._parallel_search else 1
+        text = ""
+        stopped_early = False
+        stream = self._llm.generate_stream(
+            messages,
+            timeout=timeout,
+            stop=["\n" + _RESULT_PREFIXES[language].rstrip()],
+            max_tokens=settings.ANALYSIS_AGENT_TURN_MAX_TOKENS_PER_QUERY * max_search_lines,
+        )
+        try:
+            async with asyncio.timeout(timeout):
+                async for chunk in stream:
+                    if chunk.is_complete:
+                        break
+                    text += chunk.text
+
+                    search_lines = list(_SEARCH_LINE_PATTERN.finditer(text))
+                    if len(search_lines) >= max_search_lines:
+                        text = text[: search_lines[max_search_lines - 1].end()].rstrip()
+                        logger.debug("Agent turn stopped early after a complete search request")
+                        stopped_early = True
+                        break
+
+                    # A partial "Ready" may still go on into a search request, so wait for its line to end
+                    first_line, newline, _ = text.partition("\n")
+                    if newline and _READY_ONLY_PATTERN.match(first_line):
+                        text = first_line.rstrip()
+                        logger.debug("Agent turn stopped early on the ready token")
+                        stopped_early = True
+                        break
+        finally:
+            await stream.aclose()
+
+        # The turn ran to the stop string or the token cap; the last search line may lack its newline
+        if not stopped_early and not _SEARCH_LINE_PATTERN.search(text + "\n") and not _READY_PATTERN.search(text):
+            logger.warning(
+                f"Agent turn ended with neither a search request nor READY ({len(text)} chars): {text[-200:]!r}"
+            )
+
+        return text
+
+    async def _reuse_cached_analysis(self, ctx: AnalysisContext, claim_text: str, language: str) -> Optional[Analysis]:
+        """Clone a recent completed analysis of the same claim onto the current claim, if one is cached."""
+        if self._analysis_cache is None:
+            return None
+
+        analysis_id = self._analysis_cache.get(claim_text, language)
+        if analysis_id is None:
+            return None
+
+        clone = await ctx.analysis_repo.clone_to_claim(analysis_id, ctx.claim.id)
+        if clone is None:
+            # The cached analysis was deleted or is no longer completed
+            self._analysis_cache.invalidate(claim_text, language)
+            return None
+
+        logger.info(f"Analysis cache hit: reused analysis {analysis_id} as {clone.id}")
+        return await ctx.analysis_repo.get_with_relations(clone.id)
+
+    async def _reuse_similar_analysis(self, ctx: AnalysisContext, claim_text: str, language: str) -> Optional[Analysis]:
+        """Clone the analysis of a previously analyzed paraphrase of the current claim, if one is close enough.
+
+        Also stores the current claim's embedding, so later paraphrases can be matched against it.
+        """
+        if not self._semantic_reuse or self._embedding_generator is None:
+            return None
+
+        claim = ctx.claim
+        embedding = claim.embedding
+        if embedding is None:
+            try:
+                embedding = await self._embedding_generator.generate_embedding(claim_text)
+            except Exception as e:
+                logger.warning(f"Skipping similar claim lookup, embedding failed: {str(e)}")
+                return None
+            await ctx.claim_repo.update_embedding(claim.id, embedding)
+            claim.embedding = embedding
+
+        matches = await ctx.claim_repo.find_similar_claim_ids(
+            embedding, language, min_similarity=self._semantic_reuse_threshold, limit=3, exclude_claim_id=claim.id
+        )
+        for similar_claim_id, similarity in matches:
+            previous = await ctx.analysis_repo.get_latest_by_claim(similar_claim_id)
+            if previous is None or previous.status != AnalysisStatus.completed.value:
+                continue
+
+            clone = await ctx.analysis_repo.clone_to_claim(previous.id, claim.id)
+            if clone is None:
+                continue
+
+            logger.info(
+                f"Similar claim {similar_claim_id} (similarity {similarity:.3f}): reused analysis {previous.id}"
+            )
+            return await ctx.analysis_repo.get_with_relations(clone.id)
+
+        return None
+
+    def _cache_completed_analysis(self, claim_text: str, language: str, analysis_id: UUID) -> None:
+        if self._analysis_cache is not None:
+            self._analysis_cache.put(claim_text, language, analysis_id)
 
     async def initialize_claim_conversation(
         self,
+        ctx: AnalysisContext,
         user_id: UUID,
         claim_text: str,
         analysis_text: str,
@@ -307,8 +654,8 @@ class AnalysisOrchestrator:
                 start_time=datetime.now(UTC),
                 status=ConversationStatus.active,
             )
-            conversation = await self._conversation_repo.create(conversation)
-            self._analysis_state.current_conversation = conversation
+            conversation = await ctx.conversation_repo.create(conversation)
+            ctx.conversation = conversation
 
             # Then create the claim conversation
             claim_conv = ClaimConversation(
@@ -318,8 +665,8 @@ class AnalysisOrchestrator:
                 start_time=datetime.now(UTC),
                 status=ConversationStatus.active,
             )
-            claim_conv = await self._claim_conversation_repo.create(claim_conv)
-            self._analysis_state.current_claim_conversation = claim_conv
+            claim_conv = await ctx.claim_conversation_repo.create(claim_conv)
+            ctx.claim_conversation = claim_conv
 
             # Create initial claim message
             user_message = Message(
@@ -331,7 +678,7 @@ class AnalysisOrchestrator:
                 timestamp=datetime.now(UTC),
                 claim_id=claim_id,
             )
-            await self._message_repo.create(user_message)
+            await ctx.message_repo.create(user_message)
 
             # Create analysis response message
             analysis_message = Message(
@@ -344,7 +691,7 @@ class AnalysisOrchestrator:
                 claim_id=claim_id,
                 analysis_id=analysis_id,
             )
-            await self._message_repo.create(analysis_message)
+            await ctx.message_repo.create(analysis_message)
 
             return {"conversation_id": conversation.id, "claim_conversation_id": claim_conv.id}
         except Exception as e:
@@ -352,90 +699,95 @@ class AnalysisOrchestrator:
             raise
 
     async def process_user_message(
-        self, user_id: UUID, content: str, conversation_id: Optional[UUID] = None
+        self,
+        ctx: AnalysisContext,
+        user_id: UUID,
+        content: str,
+        conversation_id: Optional[UUID] = None,
+        language: str = "english",
     ) -> AsyncGenerator[Dict[str, Any], None]:
-        """Process a user message, potentially containing a claim to analyze"""
+        """Process a user message, potentially containing claims to analyze"""
+        # Analyses started from the message are accounted in their own scope
+        usage = start_usage_scope("chat")
         try:
-            conversation = await self._initialize_conversation(user_id, conversation_id)
+            conversation = await self._initialize_conversation(ctx, user_id, conversation_id)
+            ctx.conversation = conversation
 
-            await self._store_user_message(conversation.id, content)
+            await self._store_user_message(ctx, conversation.id, content)
 
-            has_claim = await self._detect_claim(content)
+            detection = await self._claim_detector.detect(content)
 
-            if has_claim:
-                async for chunk in self._handle_claim_message(user_id, conversation.id, content):
-                    yield chunk
+            if detection.has_claim:
+                for claim_text in detection.claims:
+                    async for chunk in self._handle_claim_message(
+                        ctx, user_id, conversation.id, claim_text, content, language
+                    ):
+                        yield chunk
             else:
-                async for chunk in self._handle_regular_message(conversation.id, content):
+                async for chunk in self._handle_regular_message(ctx, conversation.id, content):
                     yield chunk
 
         except Exception as e:
             yield {"type": "error", "content": f"Error processing message: {str(e)}"}
+        finally:
+            end_usage_scope(usage)
+            await self._record_usage(ctx, usage, user_id)
 
-    async def _initialize_conversation(self, user_id: UUID, conversation_id: Optional[UUID]) -> Conversation:
+    async def _initialize_conversation(
+        self, ctx: AnalysisContext, user_id: UUID, conversation_id: Optional[UUID]
+    ) -> Conversation:
         """Initialize or retrieve conversation"""
         if conversation_id:
-            conversation = await self._conversation_repo.get(conversation_id)
+            conversation = await ctx.conversation_repo.get(conversation_id)
             if not conversation:
                 raise ValueError(f"Conversation {conversation_id} not found")
             return conversation
 
         conversation = Conversation(id=uuid4(), user_id=user_id, start_time=datetime.now())
-        return await self._conversation_repo.create(conversation)
+        return await ctx.conversation_repo.create(conversation)
 
-    async def _store_user_message(self, conversation_id: UUID, content: str) -> Message:
+    async def _store_user_message(self, ctx: AnalysisContext, conversation_id: UUID, content: str) -> Message:
         """Store user message in the database"""
         message = Message(
             id=uuid4(), conversation_id=conversation_id, sender_type="user", content=content, timestamp=datetime.now()
         )
-        return await self._message_repo.create(message)
-
-    async def _detect_claim(self, content: str) -> bool:
-        """Detect if message contains a claim using LLM"""
-        prompt = (
-            "Determine if the following message contains a verifiable claim that "
-            "could be fact-checked. Respond with 'true' or 'false':\n\n"
-            f"Message: {content}"
-        )
-        # Might force this to return True
-        response = await self._llm.generate_response([LLMMessage(role="user", content=prompt)])
-        return response.text.strip().lower() == "true"
+        return await ctx.message_repo.create(message)
 
     async def _handle_claim_message(
-        self, user_id: UUID, conversation_id: UUID, content: str, language: str
+        self, ctx: AnalysisContext, user_id: UUID, conversation_id: UUID, claim_text: str, content: str, language: str
     ) -> AsyncGenerator[Dict[str, Any], None]:
-        """Handle message containing a claim"""
-        claim_text = await self._extract_claim(content)
-
-        claim = Claim(id=uuid4(), user_id=user_id, claim_text=claim_text, context=content, created_at=datetime.now())
-        self._analysis_state.current_claim = await self._claim_repo.create(claim)
+        """Handle one claim found in a message"""
+        claim = Claim(
+            id=uuid4(),
+            user_id=user_id,
+            claim_text=claim_text,
+            context=content,
+            status=ClaimStatus.analyzing,
+            language=language,
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
+        )
+        ctx.claim = await ctx.claim_repo.create(claim)
 
         claim_conversation = ClaimConversation(
-            id=uuid4(), conversation_id=conversation_id, claim_id=claim.id, start_time=datetime.now()
+            id=uuid4(),
+            conversation_id=conversation_id,
+            claim_id=claim.id,
+            start_time=datetime.now(UTC),
+            status=ConversationStatus.active,
         )
-        # Create Claim Conversation does not exist, do I need to build out this method?
-        await self._conversation_repo.create_claim_conversation(claim_conversation)
+        ctx.claim_conversation = await ctx.claim_conversation_repo.create(claim_conversation)
 
         yield {"type": "status", "content": "Analyzing claim..."}
 
-        async for chunk in self._generate_analysis(claim_text, content, language):
+        async for chunk in self._generate_analysis(ctx, claim_text, content, language):
             if chunk["type"] == "content":
                 await self._store_bot_message(
-                    conversation_id=conversation_id, content=chunk["content"], claim_id=claim.id
+                    ctx, conversation_id=conversation_id, content=chunk["content"], claim_id=claim.id
                 )
             yield chunk
 
-    async def _extract_claim(self, content: str) -> str:
-        """Extract the main claim from message content"""
-        prompt = (
-            "Extract the main verifiable claim from the following message. "
-            "Return only the claim, nothing else:\n\n"
-            f"Message: {content}"
-        )
-        response = await self._llm.generate_response([LLMMessage(role="user", content=prompt)])
-        return response.text.strip()
-
-    async def _create_analysis(self, analysis_text: str, claim_id: UUID) -> Analysis:
+    async def _create_analysis(self, ctx: AnalysisContext, analysis_text: str, claim_id: UUID) -> Analysis:
         """Create analysis record from generated text"""
         scores_prompt = (
             "Extract the veracity and confidence scores from this analysis. "
@@ -454,18 +806,20 @@ class AnalysisOrchestrator:
             analysis_text=analysis_text,
             created_at=datetime.now(),
         )
-        return await self._analysis_repo.create(analysis)
+        return await ctx.analysis_repo.create(analysis)
 
     async def _handle_regular_message(
-        self, conversation_id: UUID, content: str
+        self, ctx: AnalysisContext, conversation_id: UUID, content: str
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """Handle regular conversational message"""
         async for chunk in self._llm.generate_stream([LLMMessage(role="user", content=content)]):
             if not chunk.is_complete:
-                await self._store_bot_message(conversation_id, chunk.text)
+                await self._store_bot_message(ctx, conversation_id, chunk.text)
                 yield {"type": "content", "content": chunk.text}
 
-    async def _store_bot_message(self, conversation_id: UUID, content: str, claim_id: Optional[UUID] = None) -> Message:
+    async def _store_bot_message(
+        self, ctx: AnalysisContext, conversation_id: UUID, content: str, claim_id: Optional[UUID] = None
+    ) -> Message:
         """Store bot message in the database"""
         message = Message(
             id=uuid4(),
@@ -475,33 +829,44 @@ class AnalysisOrchestrator:
             timestamp=datetime.now(),
             claim_id=claim_id,
         )
-        return await self._message_repo.create(message)
+        return await ctx.message_repo.create(message)
 
-    async def analyze_claim_stream(self, claim_id: UUID, user_id: UUID) -> AsyncGenerator[Dict[str, Any], None]:
+    async def analyze_claim_stream(
+        self,
+        ctx: AnalysisContext,
+        claim_id: UUID,
+        user_id: UUID,
+        include_timing: bool = False,
+        deadline_ms: Optional[int] = None,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
         """Stream the analysis process for a claim and initialize conversation."""
+        deadline = self._make_deadline(deadline_ms)
         try:
             logger.info(f"Starting analysis for claim {claim_id}")
 
-            claim = await self._claim_repo.get(claim_id)
+            claim = await ctx.claim_repo.get(claim_id)
             if not claim:
                 raise ValueError(f"Claim {claim_id} not found")
 
             logger.debug(f"Retrieved claim: {claim.claim_text}")
-            self._analysis_state.current_claim = claim
+            ctx.claim = claim
 
-            await self._claim_repo.update_status(claim_id, ClaimStatus.analyzing)
+            await ctx.claim_repo.update_status(claim_id, ClaimStatus.analyzing)
             yield {"type": "status", "content": "Starting analysis..."}
 
             # Generate analysis
             analysis_complete = False
-            async for chunk in self._generate_analysis(claim.claim_text, claim.context, claim.language):
+            async for chunk in self._generate_analysis_once(
+                ctx, claim.claim_text, claim.context, claim.language, emit_timing=include_timing, deadline=deadline
+            ):
                 if chunk["type"] == "analysis_complete":
                     analysis_complete = True
                     # Get the full analysis to create conversation
-                    analysis = await self._analysis_repo.get(UUID(chunk["content"]["analysis_id"]))
+                    analysis = await ctx.analysis_repo.get(UUID(chunk["content"]["analysis_id"]))
 
                     # Initialize conversation structure
                     conversation_ids = await self.initialize_claim_conversation(
+                        ctx,
                         user_id=user_id,
                         claim_text=claim.claim_text,
                         analysis_text=analysis.analysis_text,
@@ -516,43 +881,49 @@ class AnalysisOrchestrator:
                 yield chunk
 
             if analysis_complete:
-                await self._claim_repo.update_status(claim_id, ClaimStatus.analyzed)
+                await ctx.claim_repo.update_status(claim_id, ClaimStatus.analyzed)
                 logger.info(f"Completed analysis for claim {claim_id}")
             else:
-                await self._claim_repo.update_status(claim_id, ClaimStatus.failed)
+                await ctx.claim_repo.update_status(claim_id, ClaimStatus.failed)
                 logger.error(f"Analysis incomplete for claim {claim_id}")
 
         except Exception as e:
             logger.error(f"Error in analyze_claim_stream: {str(e)}", exc_info=True)
-            if self._analysis_state.current_claim:
-                await self._claim_repo.update_status(claim_id, ClaimStatus.rejected)
+            if ctx.claim:
+                await ctx.claim_repo.update_status(claim_id, ClaimStatus.rejected)
             yield {"type": "error", "content": str(e)}
             raise
 
-    async def analyze_claim_direct(self, claim_id: UUID, user_id: UUID) -> Dict[str, Any]:
-        claim = await self._claim_repo.get(claim_id)
+    async def analyze_claim_direct(
+        self, ctx: AnalysisContext, claim_id: UUID, user_id: UUID, deadline_ms: Optional[int] = None
+    ) -> Dict[str, Any]:
+        deadline = self._make_deadline(deadline_ms)
+        claim = await ctx.claim_repo.get(claim_id)
         if not claim:
             raise ValueError(f"Claim {claim_id} not found")
 
-        self._analysis_state.current_claim = claim
-        await self._claim_repo.update_status(claim_id, ClaimStatus.analyzing)
+        ctx.claim = claim
+        await ctx.claim_repo.update_status(claim_id, ClaimStatus.analyzing)
 
         analysis_complete = False
         final_chunk = None
 
-        async for chunk in self._generate_analysis(claim.claim_text, claim.context, claim.language):
+        async for chunk in self._generate_analysis_once(
+            ctx, claim.claim_text, claim.context, claim.language, deadline=deadline
+        ):
             if chunk["type"] == "analysis_complete":
                 analysis_complete = True
                 final_chunk = chunk
 
         if not analysis_complete:
-            await self._claim_repo.update_status(claim_id, ClaimStatus.failed)
+            await ctx.claim_repo.update_status(claim_id, ClaimStatus.failed)
             raise ValueError(f"Analysis incomplete for claim {claim_id}")
 
         # Get analysis and initialize conversations
-        analysis = await self._analysis_repo.get_with_relations(UUID(final_chunk["content"]["analysis_id"]))
+        analysis = await ctx.analysis_repo.get_with_relations(UUID(final_chunk["content"]["analysis_id"]))
 
         conversation_ids = await self.initialize_claim_conversation(
+            ctx,
             user_id=user_id,
             claim_text=claim.claim_text,
             analysis_text=analysis.analysis_text,
@@ -560,7 +931,7 @@ class AnalysisOrchestrator:
             analysis_id=analysis.id,
         )
 
-        await self._claim_repo.update_status(claim_id, ClaimStatus.analyzed)
+        await ctx.claim_repo.update_status(claim_id, ClaimStatus.analyzed)
 
         return {
             "conversation_id": conversation_ids["conversation_id"],
@@ -570,6 +941,7 @@ class AnalysisOrchestrator:
 
     async def stream_claim_discussion(
         self,
+        ctx: AnalysisContext,
         conversation_id: UUID,
         claim_conversation_id: UUID,
         claim_id: UUID,
@@ -577,14 +949,15 @@ class AnalysisOrchestrator:
         message_content: str,
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """Stream interactive discussion about a claim."""
+        usage = start_usage_scope("discussion")
         try:
             # First verify the conversation belongs to the user
-            conversation = await self._conversation_repo.get(conversation_id)
+            conversation = await ctx.conversation_repo.get(conversation_id)
             if not conversation or conversation.user_id != user_id:
                 raise NotAuthorizedException("Not authorized to access this conversation")
 
             # Verify the claim conversation
-            claim_conv = await self._claim_conversation_repo.get(claim_conversation_id)
+            claim_conv = await ctx.claim_conversation_repo.get(claim_conversation_id)
             if not claim_conv or claim_conv.conversation_id != conversation_id:
                 raise NotAuthorizedException("Not authorized to access this claim conversation")
 
@@ -598,10 +971,10 @@ class AnalysisOrchestrator:
                 timestamp=datetime.now(UTC),
                 claim_id=claim_id,
             )
-            await self._message_repo.create(user_message)
+            await ctx.message_repo.create(user_message)
 
             # Get conversation context (last few messages for context)
-            context_messages = await self._message_repo.get_claim_conversation_messages(
+            context_messages = await ctx.message_repo.get_claim_conversation_messages(
                 claim_conversation_id=claim_conversation_id,
                 limit=10,
             )
@@ -628,15 +1001,15 @@ class AnalysisOrchestrator:
                 timestamp=datetime.now(UTC),
                 claim_id=claim_id,
             )
-            await self._message_repo.create(bot_message)
+            await ctx.message_repo.create(bot_message)
 
             # Get claim and analysis for context
-            claim = await self._claim_repo.get(claim_id)
+            claim = await ctx.claim_repo.get(claim_id)
             if not claim:
                 raise NotFoundException("Claim not found")
 
             # Get latest analysis
-            analyses = await self._analysis_repo.get_by_claim(claim_id=claim_id, include_sources=True)
+            analyses = await ctx.analysis_repo.get_by_claim(claim_id=claim_id, include_sources=True)
             analysis = analyses[-1] if analyses else None
 
             if not analysis:
@@ -661,7 +1034,7 @@ class AnalysisOrchestrator:
                 if chunk.is_complete:
                     full_response = "".join(response_content)
                     bot_message.content = full_response
-                    await self._message_repo.update(bot_message)
+                    await ctx.message_repo.update(bot_message)
 
                     yield {"type": "message_complete", "message_id": str(bot_message.id)}
 
@@ -669,13 +1042,37 @@ class AnalysisOrchestrator:
             logger.error(f"Error in stream_claim_discussion: {str(e)}", exc_info=True)
             yield {"type": "error", "content": str(e)}
             raise
+        finally:
+            end_usage_scope(usage)
+            await self._record_usage(ctx, usage, user_id)
 
     def clean_text(text):
         cleaned_text = re.sub(r"[^a-zA-Z,.?!' ]", "", text)
         return cleaned_text
 
+    def _new_prompt_assembler(self, claim_text: str, language: str) -> AnalysisPromptAssembler:
+        return AnalysisPromptAssembler(
+            task_prompt=self._query_initial(claim_text, language),
+            result_prefix=_RESULT_PREFIXES["french" if language == "french" else "english"],
+            format_sources=lambda sources: self._web_search.format_sources_for_prompt(sources, language),
+            max_tokens=settings.ANALYSIS_PROMPT_MAX_TOKENS,
+            counter=get_token_counter(),
+            min_credibility=settings.ANALYSIS_PROMPT_MIN_SOURCE_CREDIBILITY,
+        )
+
     def _query_initial(self, statement: str, language: str):
 
+        if self._parallel_search:
+            if language == "english":
+                prompt = AnalysisPrompt.ORCHESTRATOR_MULTI_QUERY_PROMPT
+            elif language == "french":
+                prompt = AnalysisPrompt.ORCHESTRATOR_MULTI_QUERY_PROMPT_FR
+            else:
+                raise ValidationError("Claim Language is invalid")
+            return prompt.format(
+                statement=statement, date=datetime.now().isoformat(), max_queries=self._max_parallel_queries
+            )
+
         if language == "english":
             return AnalysisPrompt.ORCHESTRATOR_PROMPT.format(statement=statement, date=datetime.now().isoformat())
         elif language == "french":
@@ -714,6 +1111,92 @@ class AnalysisOrchestrator:
             matched_content=match.group(2),
         )
 
+    def _extract_search_queries(
+        self,
+        assistant_response: str,
+        language: str,
+    ) -> List[_KeywordExtractionOutput]:
+        """
+        Extract every "REASON: ... SEARCH: query" request from the main agent response.
+
+        Used in parallel search mode, where the agent may ask for several independent
+        searches in one message. Each query runs to the end of its line; duplicates are
+        dropped and at most ``self._max_parallel_queries`` requests are returned.
+        """
+        if language not in ("english", "french"):
+            raise ValidationError("Claim Language is invalid")
+
+        requests: List[_KeywordExtractionOutput] = []
+        seen_queries: Set[str] = set()
+        pattern = r"REASON\s*:\s*(.*?)\s*SEARCH\s*:\s+(.+?)\s*$"
+        for match in re.finditer(pattern, assistant_response, re.DOTALL | re.MULTILINE):
+            query = match.group(2).strip()
+            if not query or query.lower() in seen_queries:
+                continue
+            seen_queries.add(query.lower())
+            requests.append(_KeywordExtractionOutput(content_up_to_match=match.group(1), matched_content=query))
+            if len(requests) >= self._max_parallel_queries:
+                break
+
+        return requests
+
+    async def _run_parallel_searches(
+        self,
+        ctx: AnalysisContext,
+        search_requests: List[_KeywordExtractionOutput],
+        analysis_id: UUID,
+        language: str,
+        seen_urls: Set[str],
+        unit_of_work: Optional[AnalysisUnitOfWork] = None,
+        timeout: Optional[float] = None,
+    ) -> List[SourceModel]:
+        """Run several web searches concurrently and persist their merged, URL-deduplicated results.
+
+        Only the HTTP calls are fanned out; the session shared by the repositories is not safe
+        for concurrent use, so search records and sources are written one at a time afterwards.
+        """
+        results = await asyncio.gather(
+            *(
+                self._web_search.fetch_search_results(request.matched_content, language=language, timeout=timeout)
+                for request in search_requests
+            ),
+            return_exceptions=True,
+        )
+
+        sources: List[SourceModel] = []
+        for request, items in zip(search_requests, results):
+            if isinstance(items, BaseException):
+                logger.error(f"Search failed for query '{request.matched_content}': {str(items)}")
+                items = []
+
+            unique_items = []
+            for item in items:
+                url = item.get("link")
+                if not url or url in seen_urls:
+                    continue
+                seen_urls.add(url)
+                unique_items.append(item)
+
+            search = Search(
+                id=uuid4(),
+                analysis_id=analysis_id,
+                prompt=request.matched_content,
+                summary=request.content_up_to_match,
+                created_at=datetime.now(UTC),
+                updated_at=datetime.now(UTC),
+            )
+            if unit_of_work is not None:
+                search = unit_of_work.add_search(search)
+            else:
+                search = await ctx.search_repo.create(search)
+            if unique_items:
+                sources += await ctx.web_search.create_sources_from_results(
+                    unique_items, search.id, unit_of_work=unit_of_work
+                )
+
+        logger.info(f"Parallel search: {len(search_requests)} queries returned {len(sources)} unique sources")
+        return sources
+
     def _extract_search_summary_or_none(
         self,
         assistant_response: str,
@@ -0,0 +1,119 @@
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.utils.text import normalize_claim_text
+
+logger = logging.getLogger(__name__)
+
+AnalysisEvent = Dict[str, Any]
+
+
+class AnalysisFlightBackend(ABC):
+    """
+    Coordinates concurrent analyses of the same claim so only one of them does the work.
+
+    The first caller for a key becomes the leader and publishes its events; everyone who joins
+    while it runs receives those events from the start. Implementations backed by a shared
+    store (e.g. Redis pub/sub) can coalesce across instances behind the same interface.
+    """
+
+    @staticmethod
+    def make_key(claim_text: str, language: str) -> str:
+        return f"{(language or '').lower()}:{normalize_claim_text(claim_text)}"
+
+    @abstractmethod
+    async def join(self, key: str) -> Optional[AsyncIterator[AnalysisEvent]]:
+        """Return None if the caller leads the flight, otherwise an iterator over the leader's events."""
+        pass
+
+    @abstractmethod
+    async def publish(self, key: str, event: AnalysisEvent) -> None:
+        pass
+
+    @abstractmethod
+    async def complete(self, key: str) -> None:
+        """End the flight; followers see the end of their event stream."""
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {}
+
+
+class _Flight:
+    def __init__(self):
+        self.events: List[AnalysisEvent] = []
+        self.done = False
+        self.followers = 0
+        self._changed = asyncio.Condition()
+
+    async def publish(self, event: AnalysisEvent) -> None:
+        async with self._changed:
+            self.events.append(event)
+            self._changed.notify_all()
+
+    async def finish(self) -> None:
+        async with self._changed:
+            self.done = True
+            self._changed.notify_all()
+
+    async def subscribe(self) -> AsyncIterator[AnalysisEvent]:
+        index = 0
+        while True:
+            async with self._changed:
+                while index >= len(self.events) and not self.done:
+                    await self._changed.wait()
+                pending = self.events[index:]
+                index = len(self.events)
+                done = self.done
+
+            for event in pending:
+                yield event
+            if done and index >= len(self.events):
+                return
+
+
+class InProcessFlightBackend(AnalysisFlightBackend):
+    """Coalesces identical analyses running in this process."""
+
+    def __init__(self):
+        self._flights: Dict[str, _Flight] = {}
+        self.led = 0
+        self.coalesced = 0
+
+    async def join(self, key: str) -> Optional[AsyncIterator[AnalysisEvent]]:
+        flight = self._flights.get(key)
+        if flight is None:
+            self._flights[key] = _Flight()
+            self.led += 1
+            return None
+
+        flight.followers += 1
+        self.coalesced += 1
+        logger.info(f"Joining in-flight analysis ({flight.followers} followers)")
+        return flight.subscribe()
+
+    async def publish(self, key: str, event: AnalysisEvent) -> None:
+        flight = self._flights.get(key)
+        if flight is not None:
+            await flight.publish(event)
+
+    async def complete(self, key: str) -> None:
+        # Removed first, so anyone arriving from now on starts (or reuses) a finished analysis instead
+        flight = self._flights.pop(key, None)
+        if flight is not None:
+            await flight.finish()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"in_flight": len(self._flights), "led": self.led, "coalesced": self.coalesced}
+
+
+@lru_cache()
+def get_analysis_flights() -> Optional[AnalysisFlightBackend]:
+    """Process-wide single-flight registry, or None when coalescing is disabled."""
+    if not settings.ANALYSIS_SINGLE_FLIGHT_ENABLED:
+        return None
+    return InProcessFlightBackend()
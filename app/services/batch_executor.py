@@ -0,0 +1,148 @@
+import asyncio
+import logging
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db.session import AsyncSessionLocal
+from app.models.database.models import AnalysisStatus, ClaimStatus
+from app.repositories.implementations.analysis_repository import AnalysisRepository
+from app.repositories.implementations.claim_repository import ClaimRepository
+from app.services.analysis_orchestrator import AnalysisOrchestrator
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _BatchJob:
+    claim_id: UUID
+    user_id: UUID
+    future: "asyncio.Future[Dict[str, Any]]"
+
+
+class BatchAnalysisExecutor:
+    """Run batch claim analyses on a fixed pool of workers.
+
+    Pending claims are queued per user and workers take them round-robin across users, so one
+    large batch cannot starve batches submitted later by someone else. The workers share one
+    orchestrator, but every claim is analyzed with its own database session and analysis context,
+    since a session is not safe to share between concurrent analyses.
+    """
+
+    def __init__(
+        self,
+        orchestrator: AnalysisOrchestrator,
+        num_workers: int,
+        claim_timeout_seconds: float,
+        persist_margin_seconds: float = 10.0,
+        session_factory: async_sessionmaker = AsyncSessionLocal,
+    ):
+        self._orchestrator = orchestrator
+        self._num_workers = num_workers
+        self._claim_timeout_seconds = claim_timeout_seconds
+        # The verdict gets whatever the deadline leaves, so the deadline must end before the hard timeout
+        # with room to persist the analysis; never below half the timeout, should the margin be set too large
+        self._deadline_seconds = max(claim_timeout_seconds - persist_margin_seconds, claim_timeout_seconds / 2)
+        self._session_factory = session_factory
+        self._queues: "OrderedDict[UUID, Deque[_BatchJob]]" = OrderedDict()
+        self._ready: Optional[asyncio.Condition] = None
+        self._workers: List[asyncio.Task] = []
+
+    @property
+    def pending(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def _ensure_started(self) -> None:
+        if self._workers:
+            return
+        self._ready = asyncio.Condition()
+        self._workers = [
+            asyncio.create_task(self._worker(i), name=f"batch-analysis-worker-{i}") for i in range(self._num_workers)
+        ]
+        logger.info(f"Started {self._num_workers} batch analysis workers")
+
+    async def submit(self, user_id: UUID, claim_ids: List[UUID]) -> List["asyncio.Future[Dict[str, Any]]"]:
+        """Queue claims for analysis and return one future per claim, in the same order."""
+        self._ensure_started()
+        loop = asyncio.get_running_loop()
+        jobs = [_BatchJob(claim_id=claim_id, user_id=user_id, future=loop.create_future()) for claim_id in claim_ids]
+
+        async with self._ready:
+            self._queues.setdefault(user_id, deque()).extend(jobs)
+            self._ready.notify(len(jobs))
+
+        logger.info(f"Queued {len(jobs)} claims for user {user_id} ({self.pending} pending)")
+        return [job.future for job in jobs]
+
+    async def stop(self) -> None:
+        """Cancel the workers and any claims still waiting in the queue."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        for queue in self._queues.values():
+            for job in queue:
+                job.future.cancel()
+        self._queues.clear()
+
+    async def _next_job(self) -> _BatchJob:
+        async with self._ready:
+            while not self._queues:
+                await self._ready.wait()
+
+            # Take one claim from the user at the head of the rotation, then move them to the back
+            user_id, queue = self._queues.popitem(last=False)
+            job = queue.popleft()
+            if queue:
+                self._queues[user_id] = queue
+            return job
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            job = await self._next_job()
+            try:
+                result = await self._run_job(job)
+            except asyncio.CancelledError:
+                job.future.cancel()
+                raise
+            except Exception as e:
+                logger.error(f"Batch worker {index}: analysis failed for claim {job.claim_id}: {str(e)}")
+                if not job.future.done():
+                    job.future.set_exception(e)
+            else:
+                if not job.future.done():
+                    job.future.set_result(result)
+
+    async def _run_job(self, job: _BatchJob) -> Dict[str, Any]:
+        async with self._session_factory() as session:
+            ctx = self._orchestrator.new_context(session)
+            try:
+                return await asyncio.wait_for(
+                    # The deadline lets the analysis give and store a verdict before the hard timeout hits
+                    self._orchestrator.analyze_claim_direct(
+                        ctx, job.claim_id, job.user_id, deadline_ms=int(self._deadline_seconds * 1000)
+                    ),
+                    timeout=self._claim_timeout_seconds,
+                )
+            except asyncio.TimeoutError:
+                await self._mark_failed(session, job.claim_id)
+                raise TimeoutError(f"Analysis timed out after {self._claim_timeout_seconds}s")
+            except Exception:
+                await self._mark_failed(session, job.claim_id)
+                raise
+
+    async def _mark_failed(self, session: AsyncSession, claim_id: UUID) -> None:
+        """Leave the claim and its unfinished analysis in a failed state instead of stuck in progress."""
+        try:
+            await session.rollback()
+            analysis_repo = AnalysisRepository(session)
+            analysis = await analysis_repo.get_latest_by_claim(claim_id)
+            if analysis and analysis.status in (AnalysisStatus.pending.value, AnalysisStatus.processing.value):
+                await analysis_repo.update_status(analysis.id, AnalysisStatus.failed)
+            await ClaimRepository(session).update_status(claim_id, ClaimStatus.failed)
+        except Exception as e:
+            logger.error(f"Could not mark claim {claim_id} as failed: {str(e)}")
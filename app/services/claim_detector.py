@@ -0,0 +1,82 @@
+import json
+import logging
+from collections import OrderedDict
+from typing import List, NamedTuple
+
+from app.core.llm.interfaces import LLMProvider
+from app.core.llm.messages import Message as LLMMessage
+from app.core.llm.prompts import AnalysisPrompt
+from app.core.utils.text import normalize_claim_text
+
+logger = logging.getLogger(__name__)
+
+
+class ClaimDetection(NamedTuple):
+    has_claim: bool
+    claims: List[str]
+    confidence: float
+
+
+NO_CLAIM = ClaimDetection(has_claim=False, claims=[], confidence=0.0)
+
+
+class ClaimDetector:
+    """
+    Detect, extract and split the verifiable claims in a chat message with one structured LLM call.
+
+    Results are kept in a small LRU cache keyed on the normalized message text, since the same
+    message (a forwarded post, a repeated question) tends to arrive many times. The provider can
+    be a smaller, faster model than the one used for analysis.
+    """
+
+    def __init__(self, llm_provider: LLMProvider, cache_size: int):
+        self._llm = llm_provider
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[str, ClaimDetection]" = OrderedDict()
+
+    async def detect(self, message: str) -> ClaimDetection:
+        key = normalize_claim_text(message)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        prompt = AnalysisPrompt.CLAIM_DETECTION.format(message=message)
+        response = await self._llm.generate_response([LLMMessage(role="user", content=prompt)], temperature=0.0)
+        detection = self._parse(response.text)
+
+        self._cache[key] = detection
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return detection
+
+    @staticmethod
+    def _parse(text: str) -> ClaimDetection:
+        start, end = text.find("{"), text.rfind("}")
+        try:
+            data = json.loads(text[start : end + 1], strict=False) if start != -1 and end > start else None
+        except json.JSONDecodeError:
+            data = None
+        if not isinstance(data, dict):
+            logger.warning(f"Claim detection returned unparseable output, treating as no claim: {text[:200]}")
+            return NO_CLAIM
+
+        claims = data.get("claims")
+        if claims is None:
+            # The single-claim shape the prompt used to ask for
+            claims = [data.get("claim")]
+        elif isinstance(claims, str):
+            # A lone claim given as a string rather than a one-element list
+            claims = [claims]
+        elif not isinstance(claims, list):
+            claims = []
+        claims = [str(claim).strip() for claim in claims if claim and str(claim).strip()]
+
+        try:
+            confidence = float(data.get("confidence") or 0.0)
+        except (TypeError, ValueError):
+            confidence = 0.0
+
+        if not data.get("has_claim") or not claims:
+            return NO_CLAIM
+        return ClaimDetection(has_claim=True, claims=claims, confidence=confidence)
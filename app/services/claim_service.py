@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, UTC
 from typing import List, Optional, Tuple
 from uuid import UUID, uuid4
@@ -12,11 +13,12 @@ import plotly.express as px
 import pandas as pd
 import numpy as np
 
-from app.models.database.models import ClaimStatus
+from app.models.database.models import AnalysisStatus, ClaimStatus
 from app.models.domain.claim import Claim
+from app.models.domain.analysis import Analysis
 from app.repositories.implementations.claim_repository import ClaimRepository
 from app.repositories.implementations.analysis_repository import AnalysisRepository
-from app.services.analysis_orchestrator import AnalysisOrchestrator
+from app.services.batch_executor import BatchAnalysisExecutor
 
 from app.core.exceptions import NotFoundException, NotAuthorizedException
 
@@ -81,6 +83,28 @@ class ClaimService:
 
         return claim
 
+    async def find_similar_analyzed_claims(
+        self, claim: Claim, min_similarity: float, limit: int = 5
+    ) -> List[Tuple[Claim, Analysis, float]]:
+        """Find analyzed claims similar to the given one, with their latest completed analysis."""
+        if claim.embedding is None:
+            return []
+
+        matches = await self._claim_repo.find_similar_claim_ids(
+            claim.embedding, claim.language, min_similarity=min_similarity, limit=limit, exclude_claim_id=claim.id
+        )
+
+        results = []
+        for similar_claim_id, similarity in matches:
+            analysis = await self._analysis_repo.get_latest_by_claim(similar_claim_id)
+            if analysis is None or analysis.status != AnalysisStatus.completed.value:
+                continue
+            similar_claim = await self._claim_repo.get(similar_claim_id)
+            if similar_claim:
+                results.append((similar_claim, analysis, similarity))
+
+        return results
+
     async def list_user_claims(
         self, user_id: UUID, status: Optional[ClaimStatus] = None, limit: int = 50, offset: int = 0
     ) -> Tuple[List[Claim], int]:
@@ -224,14 +248,21 @@ class ClaimService:
         self,
         created_claims,
         user_id: str,
-        analysis_orchestrator: AnalysisOrchestrator,
+        batch_executor: BatchAnalysisExecutor,
     ):
         successes = []
         failures = []
 
-        for claim in created_claims:
+        futures = await batch_executor.submit(user_id, [claim.id for claim in created_claims])
+        results = await asyncio.gather(*futures, return_exceptions=True)
+
+        for claim, result in zip(created_claims, results):
+            if isinstance(result, BaseException):
+                logging.error(f"Analysis failed for claim {claim.id}: {str(result)}")
+                failures.append({"claim_id": str(claim.id), "status": "error", "message": str(result)})
+                continue
+
             try:
-                result = await analysis_orchestrator.analyze_claim_direct(claim.id, user_id)
                 analysis = result.get("analysis")
 
                 searches = analysis.searches or []
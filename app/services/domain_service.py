@@ -6,6 +6,7 @@ from app.models.domain.domain import Domain
 from app.repositories.implementations.domain_repository import DomainRepository
 from app.core.exceptions import NotFoundException
 from app.core.utils.url import normalize_domain_name
+from app.core.utils.timing import trace_span
 
 
 class DomainService:
@@ -40,7 +41,8 @@ class DomainService:
         return domain
 
     async def get_or_create_domain(self, domain_name: str) -> Tuple[Domain, bool]:
-        return await self._domain_repo.get_or_create(domain_name)
+        with trace_span("domain.get_or_create"):
+            return await self._domain_repo.get_or_create(domain_name)
 
     async def update_domain(
         self,
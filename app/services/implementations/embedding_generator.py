@@ -1,4 +1,5 @@
 from typing import List, Optional
+import asyncio
 import logging
 from app.services.interfaces.embedding_generator import EmbeddingGeneratorInterface
 
@@ -45,7 +46,9 @@ class EmbeddingGenerator(EmbeddingGeneratorInterface):
 
     async def generate_embedding(self, claim: str) -> List[float]:
         try:
-            embedding = self.model.encode(claim)
+            model = self.model
+            # Encoding is CPU bound; keep it off the event loop
+            embedding = await asyncio.to_thread(model.encode, claim)
             return embedding.tolist() if hasattr(embedding, 'tolist') else embedding
         except Exception as e:
             logger.error(f"Failed to generate embedding for claim: {e}")
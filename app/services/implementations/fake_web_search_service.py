@@ -0,0 +1,76 @@
+import asyncio
+import hashlib
+import random
+from typing import Optional
+
+from app.core.config import settings
+from app.core.exceptions import SearchAPIError
+from app.core.llm.fake_provider import SimulatedLatency
+from app.services.implementations.web_search_service import GoogleWebSearchService
+
+# Real, mostly reputable domains, so credibility scoring and the sufficiency policy behave as in production
+_FAKE_DOMAINS = (
+    "www.reuters.com",
+    "apnews.com",
+    "www.bbc.co.uk",
+    "www.nature.com",
+    "www.who.int",
+    "www.lemonde.fr",
+    "www.theguardian.com",
+    "www.nytimes.com",
+    "en.wikipedia.org",
+    "www.snopes.com",
+    "www.factcheck.org",
+    "example-blog.net",
+)
+# Snippets are drawn from this vocabulary so they are not near-duplicates of each other
+_SNIPPET_WORDS = (
+    "report data study officials said according analysis researchers survey published evidence figures "
+    "government agency experts review records statement confirmed investigation scientists sources trend "
+    "increase decline country region population percent million year months policy program health economy "
+    "climate energy history archive interview documents court ruling election campaign budget"
+).split()
+
+
+class FakeWebSearchService(GoogleWebSearchService):
+    """
+    Serves generated search results in the Custom Search API's shape instead of calling Google.
+
+    Only the HTTP request is simulated: retries, the circuit breaker, source creation and domain
+    lookups all run for real, which is what a load test needs to exercise. Results for a query are
+    always the same; latency and injected failures follow the configured distribution.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._results = settings.FAKE_SEARCH_RESULTS
+        self._latency_ms = settings.FAKE_SEARCH_LATENCY_MS
+        self._error_rate = settings.FAKE_SEARCH_ERROR_RATE
+        self._latency = SimulatedLatency(
+            settings.FAKE_LATENCY_DISTRIBUTION, settings.FAKE_LATENCY_SPREAD, settings.FAKE_SEED + 1
+        )
+
+    async def _request_search_results(self, params: dict, timeout: Optional[float] = None) -> dict:
+        delay = self._latency.sample(self._latency_ms)
+        if timeout and delay > timeout:
+            await asyncio.sleep(timeout)
+            raise TimeoutError(f"Simulated search timed out after {timeout}s")
+        await asyncio.sleep(delay)
+        if self._latency.fails(self._error_rate):
+            raise SearchAPIError("Simulated search API error", status_code=503)
+
+        query = params["q"]
+        digest = hashlib.sha256(query.encode("utf-8")).hexdigest()
+        offset = int(digest[:8], 16)
+        items = []
+        for rank in range(min(self._results, params.get("num", self._results))):
+            domain = _FAKE_DOMAINS[(offset + rank) % len(_FAKE_DOMAINS)]
+            words = random.Random(f"{digest}{rank}").sample(_SNIPPET_WORDS, 14)
+            items.append(
+                {
+                    "title": f"{query[:60]} - result {rank + 1}",
+                    "link": f"https://{domain}/fake/{digest[:12]}/{rank + 1}",
+                    "snippet": f"{query[:80]}: {' '.join(words)}.",
+                }
+            )
+        return {"items": items}
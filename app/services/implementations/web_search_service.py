@@ -1,3 +1,4 @@
+import copy
 from typing import List, Optional
 import aiohttp
 from datetime import UTC, datetime
@@ -7,102 +8,175 @@ from uuid import UUID, uuid4
 from app.core.config import settings
 from sqlalchemy.exc import IntegrityError
 
-from app.core.exceptions import ValidationError
+from app.core.exceptions import SearchAPIError, ValidationError
 from app.models.database.models import SourceModel
+from app.repositories.implementations.analysis_unit_of_work import AnalysisUnitOfWork
 from app.services.interfaces.web_search_service import WebSearchServiceInterface
 from app.repositories.implementations.source_repository import SourceRepository
 from app.services.domain_service import DomainService
 from app.core.utils.url import normalize_domain_name
+from app.core.utils.timing import trace_span
+from app.core.utils.resilience import get_resilience_policy
 
 logger = logging.getLogger(__name__)
 
 
 class GoogleWebSearchService(WebSearchServiceInterface):
-    def __init__(self, domain_service: DomainService, source_repository: SourceRepository):
+    def __init__(
+        self, domain_service: Optional[DomainService] = None, source_repository: Optional[SourceRepository] = None
+    ):
         self.search_endpoint = "https://customsearch.googleapis.com/customsearch/v1"
         self.api_key = settings.GOOGLE_SEARCH_API_KEY
         self.search_engine_id = settings.GOOGLE_SEARCH_ENGINE_ID
         self.domain_service = domain_service
         self.source_repository = source_repository
 
+    def bind(self, domain_service: DomainService, source_repository: SourceRepository) -> "GoogleWebSearchService":
+        """Return a copy that persists sources through the given, session-bound, domain service and repository.
+
+        The search client configuration is shared, so a process-wide instance can be bound once per analysis.
+        """
+        bound = copy.copy(self)
+        bound.domain_service = domain_service
+        bound.source_repository = source_repository
+        return bound
+
     async def search_and_create_sources(
-        self, claim_text: str, search_id: UUID, num_results: int = 5, language: str = "english"
+        self,
+        claim_text: str,
+        search_id: UUID,
+        num_results: int = 5,
+        language: str = "english",
+        unit_of_work: Optional[AnalysisUnitOfWork] = None,
+        timeout: Optional[float] = None,
     ) -> List[SourceModel]:
         """Search for sources and create or update records."""
         logger.info(f"🔍 Starting web search for claim: {claim_text[:50]}...")
         logger.info(f"Search ID: {search_id}, Language: {language}")
-        
+
+        items = await self.fetch_search_results(
+            claim_text, num_results=num_results, language=language, timeout=timeout
+        )
+        if not items:
+            return []
+
+        return await self.create_sources_from_results(items, search_id, unit_of_work=unit_of_work)
+
+    async def fetch_search_results(
+        self, query: str, num_results: int = 5, language: str = "english", timeout: Optional[float] = None
+    ) -> List[dict]:
+        """Call the search API and return the raw result items without touching the database.
+
+        Safe to run concurrently, which lets callers fan several queries out with ``asyncio.gather``.
+        """
         try:
             # Base parameters for Google Custom Search API
             params = {
                 "key": self.api_key,
                 "cx": self.search_engine_id,
-                "q": claim_text,
+                "q": query,
                 "num": min(num_results, 10),
                 "fields": "items(title,link,snippet)",
             }
-            
+
             # Add language restriction if specified
             if language == "english":
                 params["lr"] = "lang_en"
             elif language == "french":
                 params["lr"] = "lang_fr"
 
-            sources = []
             logger.info(f"📡 Calling Google Search API with query: {params['q']}")
-            logger.info(f"🔧 API Parameters: {json.dumps(params, indent=2)}")
-            logger.info(f"🌐 Full URL: {self.search_endpoint}")
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.search_endpoint, params=params) as response:
-                    logger.info(f"📊 Google API Response Status: {response.status}")
-                    
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"❌ Search API error ({response.status}): {error_text}")
-                        logger.error(f"🔧 Failed with parameters: {json.dumps(params, indent=2)}")
-                        logger.error(f"🌐 Request URL: {response.url}")
-                        return []
-
-                    data = await response.json()
-                    if "items" not in data:
-                        logger.warning("⚠️ No search results found in response")
-                        logger.debug(f"Response data: {json.dumps(data, indent=2)}")
-                        return []
-
-                    logger.info(f"✅ Found {len(data['items'])} search results")
-                    
-                    for i, item in enumerate(data["items"]):
-                        try:
-                            logger.debug(f"📌 Processing result {i+1}: {item['title'][:50]}...")
-                            domain_name = normalize_domain_name(item["link"])
-                            logger.debug(f"Domain name: {domain_name}")
-                            
-                            domain, is_new = await self.domain_service.get_or_create_domain(domain_name)
-
-                            if is_new:
-                                logger.info(f"🆕 Created new domain record for: {domain_name}")
-                            else:
-                                logger.debug(f"♻️ Using existing domain: {domain_name}")
-
-                            source = await self._create_new_source(item, search_id, domain.id, domain.credibility_score)
-                            if source:
-                                sources.append(source)
-                                logger.info(f"✅ Created source #{len(sources)} for URL: {item['link']}")
-                            else:
-                                logger.warning(f"⚠️ Failed to create source for: {item['link']}")
-
-                        except Exception as e:
-                            logger.error(f"❌ Error processing search result {i+1}: {str(e)}", exc_info=True)
-                            continue
-
-            logger.info(f"📊 Total sources created: {len(sources)}")
-            return sources
+            logger.debug(f"🌐 Full URL: {self.search_endpoint}")
+
+            with trace_span("search.fetch"):
+                data = await get_resilience_policy("google_search").call(
+                    lambda attempt_timeout: self._request_search_results(params, attempt_timeout), timeout
+                )
+            if "items" not in data:
+                logger.warning("⚠️ No search results found in response")
+                logger.debug(f"Response data: {json.dumps(data, indent=2)}")
+                return []
+
+            logger.info(f"✅ Found {len(data['items'])} search results")
+            return data["items"]
 
         except Exception as e:
             logger.error(f"Error performing web search: {str(e)}", exc_info=True)
             return []
 
+    async def _request_search_results(self, params: dict, timeout: Optional[float] = None) -> dict:
+        session_kwargs = {"timeout": aiohttp.ClientTimeout(total=timeout)} if timeout else {}
+        async with aiohttp.ClientSession(**session_kwargs) as session:
+            async with session.get(self.search_endpoint, params=params) as response:
+                logger.info(f"📊 Google API Response Status: {response.status}")
+
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"❌ Search API error ({response.status}): {error_text}")
+                    logger.error(f"🌐 Request URL: {response.url}")
+                    raise SearchAPIError(
+                        f"Search API error ({response.status}): {error_text}",
+                        status_code=response.status,
+                        retry_after=response.headers.get("Retry-After"),
+                    )
+
+                return await response.json()
+
+    async def create_sources_from_results(
+        self, items: List[dict], search_id: UUID, unit_of_work: Optional[AnalysisUnitOfWork] = None
+    ) -> List[SourceModel]:
+        """Resolve domains and persist sources for raw search result items.
+
+        With a unit of work the sources are only staged, to be written by its next flush.
+        """
+        if unit_of_work is not None:
+            return await self._stage_sources(items, search_id, unit_of_work)
+
+        sources = []
+        for i, item in enumerate(items):
+            try:
+                logger.debug(f"📌 Processing result {i+1}: {item['title'][:50]}...")
+                domain_name = normalize_domain_name(item["link"])
+                logger.debug(f"Domain name: {domain_name}")
+
+                domain, is_new = await self.domain_service.get_or_create_domain(domain_name)
+
+                if is_new:
+                    logger.info(f"🆕 Created new domain record for: {domain_name}")
+                else:
+                    logger.debug(f"♻️ Using existing domain: {domain_name}")
+
+                source = await self._create_new_source(item, search_id, domain.id, domain.credibility_score)
+                if source:
+                    sources.append(source)
+                    logger.info(f"✅ Created source #{len(sources)} for URL: {item['link']}")
+                else:
+                    logger.warning(f"⚠️ Failed to create source for: {item['link']}")
+
+            except Exception as e:
+                logger.error(f"❌ Error processing search result {i+1}: {str(e)}", exc_info=True)
+                continue
+
+        logger.info(f"📊 Total sources created: {len(sources)}")
+        return sources
+
+    async def _stage_sources(
+        self, items: List[dict], search_id: UUID, unit_of_work: AnalysisUnitOfWork
+    ) -> List[SourceModel]:
+        items = [item for item in items if item.get("link")]
+        domains = await unit_of_work.resolve_domains(normalize_domain_name(item["link"]) for item in items)
+
+        sources = []
+        for item in items:
+            try:
+                domain = domains[normalize_domain_name(item["link"])]
+                sources.append(unit_of_work.add_source(item, search_id, domain))
+            except Exception as e:
+                logger.error(f"❌ Error staging search result {item.get('link')}: {str(e)}", exc_info=True)
+
+        logger.info(f"📊 Total sources staged: {len(sources)}")
+        return sources
+
     async def _get_existing_source(self, url: str) -> Optional[SourceModel]:
         return await self.source_repository.get_by_url(url)
 
@@ -1,13 +1,40 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 from uuid import UUID
 from app.models.database.models import SourceModel
+from app.repositories.implementations.source_repository import SourceRepository
+from app.services.domain_service import DomainService
+
+if TYPE_CHECKING:
+    from app.repositories.implementations.analysis_unit_of_work import AnalysisUnitOfWork
 
 
 class WebSearchServiceInterface(ABC):
+    @abstractmethod
+    def bind(self, domain_service: DomainService, source_repository: SourceRepository) -> "WebSearchServiceInterface":
+        pass
+
     @abstractmethod
     async def search_and_create_sources(
-        self, claim_text: str, search_id: UUID, num_results: int = 5, language: str = "english"
+        self,
+        claim_text: str,
+        search_id: UUID,
+        num_results: int = 5,
+        language: str = "english",
+        unit_of_work: Optional["AnalysisUnitOfWork"] = None,
+        timeout: Optional[float] = None,
+    ) -> List[SourceModel]:
+        pass
+
+    @abstractmethod
+    async def fetch_search_results(
+        self, query: str, num_results: int = 5, language: str = "english", timeout: Optional[float] = None
+    ) -> List[dict]:
+        pass
+
+    @abstractmethod
+    async def create_sources_from_results(
+        self, items: List[dict], search_id: UUID, unit_of_work: Optional["AnalysisUnitOfWork"] = None
     ) -> List[SourceModel]:
         pass
 
@@ -0,0 +1,159 @@
+import logging
+import re
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Set
+
+from app.core.llm.messages import Message as LLMMessage
+from app.core.llm.tokens import TokenCounter, count_message_tokens
+from app.core.utils.text import is_redundant_snippet, snippet_words
+from app.models.database.models import SourceModel
+
+logger = logging.getLogger(__name__)
+
+SourceFormatter = Callable[[List[SourceModel]], str]
+
+_SEARCH_QUERY_PATTERN = re.compile(r"SEARCH\s*:\s+(.+)")
+_MAX_COMPACT_TURN_CHARS = 300
+
+
+@dataclass
+class _Turn:
+    assistant: str
+    # None when the turn did not search, as opposed to a search that found nothing
+    sources: Optional[List[SourceModel]]
+
+
+class AnalysisPromptAssembler:
+    """
+    Build the agent and verdict prompts for one analysis within a token budget.
+
+    Sources are deduplicated by URL across turns, and low-credibility or near-duplicate snippets
+    are dropped before they ever reach the prompt. Only the latest turn is sent in full; earlier
+    turns are collapsed to their search queries and the titles of what they found, and the oldest
+    of those are dropped if the prompt is still over budget. The verdict prompt carries every kept
+    source once, in a single block, instead of repeating each turn's results.
+    """
+
+    def __init__(
+        self,
+        task_prompt: str,
+        result_prefix: str,
+        format_sources: SourceFormatter,
+        max_tokens: int,
+        counter: TokenCounter,
+        min_credibility: float = 0.0,
+    ):
+        self._task = LLMMessage(role="user", content=task_prompt)
+        self._result_prefix = result_prefix
+        self._format_sources = format_sources
+        self._max_tokens = max_tokens
+        self._count = counter
+        self._min_credibility = min_credibility
+        self._turns: List[_Turn] = []
+        self._seen_urls: Set[str] = set()
+        self._kept_snippets: List[Set[str]] = []
+
+    @property
+    def sources(self) -> List[SourceModel]:
+        return [source for turn in self._turns for source in (turn.sources or [])]
+
+    def add_turn(self, assistant_message: str, sources: Optional[List[SourceModel]] = None) -> List[SourceModel]:
+        """Record an agent turn and the results of its search, returning the sources kept for the prompt."""
+        kept = self._select_sources(sources) if sources is not None else None
+        self._turns.append(_Turn(assistant=assistant_message, sources=kept))
+        return kept or []
+
+    def agent_messages(self) -> List[LLMMessage]:
+        """Messages for the next agent turn: the task, compacted earlier turns and the latest turn in full."""
+        if not self._turns:
+            return [self._task]
+
+        *earlier, latest = self._turns
+        latest_sources = list(latest.sources) if latest.sources is not None else None
+        compacted = [self._render(turn, compact=True) for turn in earlier]
+
+        while True:
+            messages = [self._task, *sum(compacted, []), *self._render(latest, sources=latest_sources)]
+            if self._fits(messages):
+                return messages
+            if compacted:
+                compacted.pop(0)
+            elif latest_sources:
+                latest_sources = self._without_weakest(latest_sources)
+            else:
+                return self._log_overflow(messages)
+
+    def verdict_messages(self, verdict_prompt: str, sources_heading: str) -> List[LLMMessage]:
+        """Messages for the final verdict: the compacted turns, then every kept source once and the prompt."""
+        compacted = [self._render(turn, compact=True) for turn in self._turns]
+        sources = self.sources
+
+        while True:
+            final_prompt = verdict_prompt
+            if sources:
+                final_prompt = f"{sources_heading}\n{self._format_sources(sources)}\n\n{verdict_prompt}"
+            messages = [self._task, *sum(compacted, []), LLMMessage(role="user", content=final_prompt)]
+            if self._fits(messages):
+                return messages
+            if compacted:
+                compacted.pop(0)
+            elif sources:
+                sources = self._without_weakest(sources)
+            else:
+                return self._log_overflow(messages)
+
+    def _select_sources(self, sources: List[SourceModel]) -> List[SourceModel]:
+        kept = []
+        for source in sources:
+            if source.url in self._seen_urls:
+                continue
+            self._seen_urls.add(source.url)
+
+            if source.credibility_score is not None and source.credibility_score < self._min_credibility:
+                logger.debug(f"Leaving low-credibility source out of the prompt: {source.url}")
+                continue
+
+            words = snippet_words(source.snippet)
+            if is_redundant_snippet(words, self._kept_snippets):
+                logger.debug(f"Leaving redundant snippet out of the prompt: {source.url}")
+                continue
+
+            self._kept_snippets.append(words)
+            kept.append(source)
+        return kept
+
+    def _render(
+        self, turn: _Turn, compact: bool = False, sources: Optional[List[SourceModel]] = None
+    ) -> List[LLMMessage]:
+        if compact:
+            queries = _SEARCH_QUERY_PATTERN.findall(turn.assistant)
+            assistant = "\n".join(f"SEARCH: {query.strip()}" for query in queries)
+            assistant = assistant or turn.assistant[:_MAX_COMPACT_TURN_CHARS]
+        else:
+            assistant = turn.assistant
+
+        messages = [LLMMessage(role="assistant", content=assistant)]
+        if turn.sources is None:
+            return messages
+
+        if compact:
+            results = "\n".join(f"- {source.title} ({source.url})" for source in turn.sources) or "-"
+        else:
+            results = self._format_sources(sources if sources is not None else turn.sources)
+        messages.append(LLMMessage(role="user", content=f"{self._result_prefix}{results}"))
+        return messages
+
+    def _fits(self, messages: List[LLMMessage]) -> bool:
+        return count_message_tokens(messages, self._count) <= self._max_tokens
+
+    @staticmethod
+    def _without_weakest(sources: List[SourceModel]) -> List[SourceModel]:
+        weakest = min(sources, key=lambda source: source.credibility_score or 0.0)
+        return [source for source in sources if source is not weakest]
+
+    def _log_overflow(self, messages: List[LLMMessage]) -> List[LLMMessage]:
+        logger.warning(
+            f"Prompt is {count_message_tokens(messages, self._count)} tokens after compaction, "
+            f"over the budget of {self._max_tokens}"
+        )
+        return messages
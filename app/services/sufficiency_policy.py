@@ -0,0 +1,154 @@
+import json
+import logging
+import re
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Set
+
+from app.core.config import settings
+from app.core.utils.text import is_redundant_snippet, snippet_words
+from app.core.utils.url import normalize_domain_name
+from app.models.database.models import SourceModel
+
+logger = logging.getLogger(__name__)
+
+# Wording that marks a snippet as refuting or debunking what it reports on
+_REFUTING_PATTERN = re.compile(
+    r"\b(false|fake|hoax|debunk\w*|misleading|myth|no evidence|not true|"
+    r"faux|fausse|infox|canular|trompeu\w*|démenti\w*|aucune preuve|intox)\b",
+    re.IGNORECASE,
+)
+
+
+class SufficiencyDecision(NamedTuple):
+    sufficient: bool
+    reason: str
+    metrics: Dict[str, Any]
+
+
+class EvidenceSufficiencyPolicy(ABC):
+    """Decide after each search turn whether the sources found so far are enough for a verdict."""
+
+    @abstractmethod
+    def evaluate(self, sources: List[SourceModel]) -> SufficiencyDecision:
+        pass
+
+    def should_stop(self, sources: List[SourceModel], turn: int) -> bool:
+        """Evaluate the sources and log the decision as one JSON line, so thresholds can be tuned offline."""
+        decision = self.evaluate(sources)
+        logger.info(
+            "Evidence sufficiency: "
+            + json.dumps(
+                {
+                    "policy": type(self).__name__,
+                    "turn": turn,
+                    "sufficient": decision.sufficient,
+                    "reason": decision.reason,
+                    **decision.metrics,
+                }
+            )
+        )
+        return decision.sufficient
+
+
+class SourceCountPolicy(EvidenceSufficiencyPolicy):
+    """The original rule: stop once a fixed number of sources has been found, whatever they are."""
+
+    def __init__(self, min_sources: int = 8):
+        self._min_sources = min_sources
+
+    def evaluate(self, sources: List[SourceModel]) -> SufficiencyDecision:
+        sufficient = len(sources) >= self._min_sources
+        reason = "enough sources" if sufficient else "too few sources"
+        return SufficiencyDecision(sufficient, reason, {"sources": len(sources)})
+
+
+class SourceQualityPolicy(EvidenceSufficiencyPolicy):
+    """
+    Stop once enough credible, independent sources agree with each other.
+
+    A source is credible when its domain is marked reliable or scores at least ``min_credibility``.
+    Sources only count as independent when they come from different domains and their snippets are
+    not near-copies of one already counted, so syndicated stories count once. Agreement is the share
+    of independent sources on the majority side of a refuting/not-refuting split of their snippets;
+    when sources conflict, searching continues so the verdict sees more of the disagreement.
+    """
+
+    def __init__(self, min_independent_sources: int, min_credibility: float, min_agreement: float):
+        self._min_independent_sources = min_independent_sources
+        self._min_credibility = min_credibility
+        self._min_agreement = min_agreement
+
+    def evaluate(self, sources: List[SourceModel]) -> SufficiencyDecision:
+        independent = self._independent_credible(sources)
+        refuting = sum(1 for source in independent if _REFUTING_PATTERN.search(source.snippet or ""))
+        agreement = max(refuting, len(independent) - refuting) / len(independent) if independent else 0.0
+
+        metrics = {
+            "sources": len(sources),
+            "domains": len({_domain_name(source) for source in sources}),
+            "independent_credible": len(independent),
+            "refuting": refuting,
+            "agreement": round(agreement, 3),
+            "mean_credibility": round(_mean_credibility(independent), 3),
+        }
+
+        if len(independent) < self._min_independent_sources:
+            return SufficiencyDecision(False, "too few independent credible sources", metrics)
+        if agreement < self._min_agreement:
+            return SufficiencyDecision(False, "credible sources disagree", metrics)
+        return SufficiencyDecision(True, "independent credible sources agree", metrics)
+
+    def _independent_credible(self, sources: List[SourceModel]) -> List[SourceModel]:
+        # Strongest sources first, so each domain is represented by its best result
+        ranked = sorted(sources, key=lambda source: source.credibility_score or 0.0, reverse=True)
+        seen_domains: Set[str] = set()
+        counted_snippets: List[Set[str]] = []
+        independent = []
+        for source in ranked:
+            if not self._is_credible(source):
+                continue
+            domain_name = _domain_name(source)
+            if domain_name in seen_domains:
+                continue
+            words = snippet_words(source.snippet)
+            if is_redundant_snippet(words, counted_snippets):
+                continue
+            seen_domains.add(domain_name)
+            counted_snippets.append(words)
+            independent.append(source)
+        return independent
+
+    def _is_credible(self, source: SourceModel) -> bool:
+        domain = source.__dict__.get("domain")
+        if domain is not None and domain.is_reliable:
+            return True
+        return source.credibility_score is not None and source.credibility_score >= self._min_credibility
+
+
+def _domain_name(source: SourceModel) -> str:
+    # Read the loaded relationship without triggering a lazy load on the async session
+    domain = source.__dict__.get("domain")
+    if domain is not None and domain.domain_name:
+        return domain.domain_name
+    return normalize_domain_name(source.url)
+
+
+def _mean_credibility(sources: List[SourceModel]) -> float:
+    scores = [source.credibility_score for source in sources if source.credibility_score is not None]
+    return sum(scores) / len(scores) if scores else 0.0
+
+
+@lru_cache()
+def get_sufficiency_policy(name: Optional[str] = None) -> EvidenceSufficiencyPolicy:
+    """Return the configured policy: ``quality`` (the default) or the original ``count`` rule."""
+    name = name or settings.ANALYSIS_SUFFICIENCY_POLICY
+    if name == "count":
+        return SourceCountPolicy(settings.ANALYSIS_SUFFICIENCY_MIN_SOURCES)
+    if name != "quality":
+        logger.warning(f"Unknown sufficiency policy '{name}', using 'quality'")
+    return SourceQualityPolicy(
+        min_independent_sources=settings.ANALYSIS_SUFFICIENCY_MIN_INDEPENDENT_SOURCES,
+        min_credibility=settings.ANALYSIS_SUFFICIENCY_MIN_CREDIBILITY,
+        min_agreement=settings.ANALYSIS_SUFFICIENCY_MIN_AGREEMENT,
+    )
@@ -0,0 +1,55 @@
+from datetime import date
+from typing import Any, Dict, List, Tuple
+from uuid import UUID
+
+from app.core.exceptions import NotAuthorizedException, NotFoundException, ValidationError
+from app.models.domain.llm_usage import LLMDailyUsage
+from app.repositories.implementations.analysis_repository import AnalysisRepository
+from app.repositories.implementations.claim_repository import ClaimRepository
+from app.repositories.implementations.llm_usage_repository import LLMUsageRepository
+
+_COUNTERS = ("calls", "cached_calls", "prompt_tokens", "completion_tokens", "cost_usd")
+MAX_RANGE_DAYS = 366
+
+
+class UsageService:
+    def __init__(
+        self,
+        usage_repository: LLMUsageRepository,
+        analysis_repository: AnalysisRepository,
+        claim_repository: ClaimRepository,
+    ):
+        self._usage_repo = usage_repository
+        self._analysis_repo = analysis_repository
+        self._claim_repo = claim_repository
+
+    async def get_user_usage(
+        self, user_id: UUID, start_date: date, end_date: date
+    ) -> Tuple[List[LLMDailyUsage], Dict[str, Any]]:
+        """A user's daily usage rows in a date range, with their totals."""
+        self._check_range(start_date, end_date)
+        rows = await self._usage_repo.get_daily(user_id, start_date, end_date)
+        return rows, _totals(rows)
+
+    async def get_analysis_usage(self, analysis_id: UUID, user_id: UUID) -> Dict[str, Any]:
+        """The usage stored with one analysis, for the user who owns its claim."""
+        analysis = await self._analysis_repo.get(analysis_id)
+        if not analysis:
+            raise NotFoundException("Analysis not found")
+        claim = await self._claim_repo.get(analysis.claim_id)
+        if not claim or claim.user_id != user_id:
+            raise NotAuthorizedException("Not authorized to access this analysis")
+        return analysis.llm_usage or {}
+
+    @staticmethod
+    def _check_range(start_date: date, end_date: date) -> None:
+        if end_date < start_date:
+            raise ValidationError("end_date must not be before start_date")
+        if (end_date - start_date).days >= MAX_RANGE_DAYS:
+            raise ValidationError(f"Date range must not exceed {MAX_RANGE_DAYS} days")
+
+
+def _totals(rows: List[LLMDailyUsage]) -> Dict[str, Any]:
+    totals: Dict[str, Any] = {name: sum(getattr(row, name) for row in rows) for name in _COUNTERS}
+    totals["cost_usd"] = round(totals["cost_usd"], 6)
+    return totals
@@ -0,0 +1,311 @@
+"""
+Offline benchmark for AnalysisOrchestrator.
+
+Replays recorded LLM responses and search results through the real orchestrator, repositories
+and a local Postgres, with simulated provider latency, and reports throughput, per-claim and
+per-stage latency and the number of database round trips.
+
+Replay (run from the repository root, against a migrated local database):
+
+    python -m benchmarks.orchestrator_benchmark --fixtures benchmarks/fixtures/sample_claims.json \\
+        --claims 50 --concurrency 10 --llm-first-token-ms 400 --llm-tokens-per-second 60 --search-ms 300
+
+Record new fixtures from live providers (needs the usual LLM and Google CSE credentials):
+
+    python -m benchmarks.orchestrator_benchmark --record benchmarks/fixtures/my_claims.json \\
+        --fixtures claims_to_record.json
+"""
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import time
+from datetime import UTC, datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies import get_llm_provider
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal, engine
+from app.models.database.models import ClaimStatus
+from app.models.domain.claim import Claim
+from app.models.domain.user import User
+from app.repositories.implementations.claim_repository import ClaimRepository
+from app.repositories.implementations.user_repository import UserRepository
+from app.services.analysis_orchestrator import AnalysisOrchestrator
+from app.services.analysis_single_flight import InProcessFlightBackend
+from app.services.interfaces.web_search_service import WebSearchServiceInterface
+from benchmarks.replay import (
+    ClaimFixture,
+    LatencyProfile,
+    RecordingLLMProvider,
+    RecordingWebSearchService,
+    ReplayLLMProvider,
+    ReplayWebSearchService,
+    load_fixtures,
+    save_fixtures,
+)
+
+logger = logging.getLogger("benchmarks.orchestrator")
+
+BENCHMARK_AUTH0_ID = "benchmark|orchestrator-replay"
+
+
+class DatabaseCounter:
+    """Counts statements and commits sent to the database through the shared engine."""
+
+    def __init__(self):
+        self.statements = 0
+        self.commits = 0
+        event.listen(engine.sync_engine, "before_cursor_execute", self._on_statement)
+        event.listen(engine.sync_engine, "commit", self._on_commit)
+
+    def _on_statement(self, *args) -> None:
+        self.statements += 1
+
+    def _on_commit(self, *args) -> None:
+        self.commits += 1
+
+    def reset(self) -> None:
+        self.statements = 0
+        self.commits = 0
+
+
+async def get_benchmark_user(session: AsyncSession) -> User:
+    user_repo = UserRepository(session)
+    user = await user_repo.get_by_auth0_id(BENCHMARK_AUTH0_ID)
+    if user:
+        return user
+
+    return await user_repo.create(
+        User(
+            id=uuid4(),
+            auth0_id=BENCHMARK_AUTH0_ID,
+            email="benchmark@localhost",
+            username="benchmark",
+            is_active=True,
+            last_login=None,
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
+        )
+    )
+
+
+async def create_claims(user_id: UUID, fixtures: List[ClaimFixture], count: int) -> List[UUID]:
+    async with AsyncSessionLocal() as session:
+        claim_repo = ClaimRepository(session)
+        claim_ids = []
+        for i in range(count):
+            fixture = fixtures[i % len(fixtures)]
+            claim = await claim_repo.create(
+                Claim(
+                    id=uuid4(),
+                    user_id=user_id,
+                    claim_text=fixture.claim_text,
+                    context=fixture.context,
+                    status=ClaimStatus.pending,
+                    language=fixture.language,
+                    created_at=datetime.now(UTC),
+                    updated_at=datetime.now(UTC),
+                )
+            )
+            claim_ids.append(claim.id)
+        return claim_ids
+
+
+def build_orchestrator(
+    llm_provider, web_search_service: WebSearchServiceInterface, flights: Optional[InProcessFlightBackend]
+) -> AnalysisOrchestrator:
+    # Replay providers are stateful per claim, so each claim gets its own (cheap) orchestrator
+    return AnalysisOrchestrator(
+        llm_provider=llm_provider,
+        web_search_service=web_search_service,
+        # The analysis cache is left out on purpose: replayed claims repeat, and every run should do the work
+        write_behind=settings.ANALYSIS_WRITE_BEHIND,
+        analysis_flights=flights,
+    )
+
+
+async def run_claim(
+    claim_id: UUID,
+    user_id: UUID,
+    fixture: ClaimFixture,
+    latency: LatencyProfile,
+    flights: Optional[InProcessFlightBackend],
+) -> Dict[str, Any]:
+    started = time.perf_counter()
+    orchestrator = build_orchestrator(
+        ReplayLLMProvider(fixture, latency), ReplayWebSearchService(fixture, latency), flights
+    )
+    async with AsyncSessionLocal() as session:
+        try:
+            result = await orchestrator.analyze_claim_direct(orchestrator.new_context(session), claim_id, user_id)
+        except Exception as e:
+            logger.error(f"Claim {claim_id} failed: {str(e)}")
+            return {"ok": False, "seconds": time.perf_counter() - started, "timing": None}
+
+    return {"ok": True, "seconds": time.perf_counter() - started, "timing": result["analysis"].timing}
+
+
+def merge_stage_timings(timings: List[Optional[Dict[str, Any]]]) -> Dict[str, Dict[str, float]]:
+    stages: Dict[str, Dict[str, float]] = {}
+    for timing in timings:
+        # Reused analyses carry the timings of the run they were copied from
+        if timing is None or "reused_from" in timing:
+            continue
+        for stage, summary in (timing.get("stages") or {}).items():
+            merged = stages.setdefault(stage, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            merged["count"] += summary["count"]
+            merged["total_ms"] += summary["total_ms"]
+            merged["max_ms"] = max(merged["max_ms"], summary["max_ms"])
+    for merged in stages.values():
+        merged["mean_ms"] = merged["total_ms"] / merged["count"] if merged["count"] else 0.0
+    return stages
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+async def replay(args: argparse.Namespace) -> Dict[str, Any]:
+    fixtures = load_fixtures(args.fixtures)
+    latency = LatencyProfile(
+        llm_first_token_ms=args.llm_first_token_ms,
+        llm_tokens_per_second=args.llm_tokens_per_second,
+        search_ms=args.search_ms,
+        jitter=args.jitter,
+    )
+    flights = InProcessFlightBackend() if args.coalesce else None
+
+    async with AsyncSessionLocal() as session:
+        user = await get_benchmark_user(session)
+    claim_ids = await create_claims(user.id, fixtures, args.claims)
+
+    counter = DatabaseCounter()
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def bounded(i: int, claim_id: UUID) -> Dict[str, Any]:
+        async with semaphore:
+            return await run_claim(claim_id, user.id, fixtures[i % len(fixtures)], latency, flights)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(bounded(i, claim_id) for i, claim_id in enumerate(claim_ids)))
+    wall_seconds = time.perf_counter() - started
+
+    succeeded = [result for result in results if result["ok"]]
+    latencies = [result["seconds"] for result in succeeded]
+    return {
+        "claims": len(results),
+        "succeeded": len(succeeded),
+        "failed": len(results) - len(succeeded),
+        "reused": sum(1 for result in succeeded if "reused_from" in (result["timing"] or {})),
+        "concurrency": args.concurrency,
+        "latency_profile": vars(latency),
+        "write_behind": settings.ANALYSIS_WRITE_BEHIND,
+        "coalesce": args.coalesce,
+        "wall_seconds": round(wall_seconds, 3),
+        "throughput_per_second": round(len(succeeded) / wall_seconds, 3) if wall_seconds else 0.0,
+        "latency_seconds": {
+            "mean": round(statistics.mean(latencies), 3) if latencies else 0.0,
+            "p50": round(percentile(latencies, 0.5), 3),
+            "p95": round(percentile(latencies, 0.95), 3),
+            "max": round(max(latencies), 3) if latencies else 0.0,
+        },
+        "db": {
+            "statements": counter.statements,
+            "commits": counter.commits,
+            "statements_per_claim": round(counter.statements / len(results), 1) if results else 0.0,
+            "commits_per_claim": round(counter.commits / len(results), 1) if results else 0.0,
+        },
+        "stages": {
+            stage: {key: round(value, 1) for key, value in summary.items()}
+            for stage, summary in sorted(merge_stage_timings([result["timing"] for result in succeeded]).items())
+        },
+    }
+
+
+async def record(args: argparse.Namespace) -> None:
+    """Run each claim once against the live providers and save what they returned as fixtures."""
+    claims = load_fixtures(args.fixtures)
+    live_provider = await get_llm_provider()
+
+    async with AsyncSessionLocal() as session:
+        user = await get_benchmark_user(session)
+    claim_ids = await create_claims(user.id, claims, len(claims))
+
+    recorded = []
+    for claim, claim_id in zip(claims, claim_ids):
+        fixture = ClaimFixture(claim_text=claim.claim_text, language=claim.language, context=claim.context)
+        orchestrator = build_orchestrator(
+            RecordingLLMProvider(live_provider, fixture), RecordingWebSearchService(fixture), None
+        )
+        async with AsyncSessionLocal() as session:
+            await orchestrator.analyze_claim_direct(orchestrator.new_context(session), claim_id, user.id)
+        recorded.append(fixture)
+        logger.info(f"Recorded {len(fixture.agent_responses)} turns for: {claim.claim_text[:60]}")
+
+    await live_provider.close()
+    save_fixtures(args.record, recorded)
+    logger.info(f"Saved {len(recorded)} fixtures to {args.record}")
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(
+        f"\nClaims: {report['succeeded']}/{report['claims']} succeeded ({report['reused']} reused), "
+        f"concurrency {report['concurrency']}"
+    )
+    print(f"Wall time: {report['wall_seconds']}s, throughput: {report['throughput_per_second']} claims/s")
+    latency = report["latency_seconds"]
+    print(f"Latency: mean {latency['mean']}s, p50 {latency['p50']}s, p95 {latency['p95']}s, max {latency['max']}s")
+    db = report["db"]
+    print(
+        f"DB: {db['statements']} statements ({db['statements_per_claim']}/claim), "
+        f"{db['commits']} commits ({db['commits_per_claim']}/claim)"
+    )
+    print(f"\n{'stage':<28}{'count':>8}{'mean ms':>12}{'max ms':>12}{'total ms':>14}")
+    for stage, summary in report["stages"].items():
+        print(
+            f"{stage:<28}{int(summary['count']):>8}{summary['mean_ms']:>12.1f}"
+            f"{summary['max_ms']:>12.1f}{summary['total_ms']:>14.1f}"
+        )
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Replay recorded analyses through AnalysisOrchestrator")
+    parser.add_argument("--fixtures", required=True, help="Fixture file to replay, or claims to record with --record")
+    parser.add_argument("--record", metavar="OUTPUT", help="Record fixtures from live providers into OUTPUT")
+    parser.add_argument("--claims", type=int, default=20, help="Number of analyses to run (fixtures are cycled)")
+    parser.add_argument("--concurrency", type=int, default=5)
+    parser.add_argument("--llm-first-token-ms", type=float, default=0.0)
+    parser.add_argument("--llm-tokens-per-second", type=float, default=0.0, help="0 streams without delay")
+    parser.add_argument("--search-ms", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0, help="Relative jitter applied to every delay")
+    parser.add_argument("--coalesce", action="store_true", help="Share identical in-flight analyses")
+    parser.add_argument("--json", metavar="PATH", help="Also write the report as JSON to PATH")
+    return parser.parse_args(argv)
+
+
+async def main(argv: List[str]) -> None:
+    args = parse_args(argv)
+    if args.record:
+        await record(args)
+        return
+
+    report = await replay(args)
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    asyncio.run(main(sys.argv[1:]))
@@ -0,0 +1,228 @@
+"""Recording and replaying LLM and search traffic for offline orchestrator benchmarks."""
+import asyncio
+import json
+import random
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
+from app.core.llm.interfaces import LLMProvider
+from app.core.llm.messages import Message, Response, ResponseChunk
+from app.core.llm.prompts import AnalysisPrompt
+from app.services.implementations.web_search_service import GoogleWebSearchService
+
+# Roughly one token per chunk, like the providers stream them
+_CHUNK_CHARS = 4
+_VERDICT_PROMPTS = (AnalysisPrompt.GET_VERACITY, AnalysisPrompt.GET_VERACITY_FR)
+
+
+@dataclass
+class LatencyProfile:
+    """Simulated provider latency; every value is jittered by up to ``jitter`` (a fraction) either way."""
+
+    llm_first_token_ms: float = 0.0
+    llm_tokens_per_second: float = 0.0
+    search_ms: float = 0.0
+    jitter: float = 0.0
+
+    def _jittered(self, seconds: float) -> float:
+        return max(0.0, seconds * (1 + random.uniform(-self.jitter, self.jitter)))
+
+    async def first_token(self) -> None:
+        await asyncio.sleep(self._jittered(self.llm_first_token_ms / 1000))
+
+    async def next_token(self) -> None:
+        if self.llm_tokens_per_second > 0:
+            await asyncio.sleep(self._jittered(1 / self.llm_tokens_per_second))
+
+    async def search(self) -> None:
+        await asyncio.sleep(self._jittered(self.search_ms / 1000))
+
+
+@dataclass
+class ClaimFixture:
+    """Recorded traffic for one claim: the agent turns, the final verdict and the raw search results."""
+
+    claim_text: str
+    language: str = "english"
+    context: str = ""
+    agent_responses: List[str] = field(default_factory=list)
+    verdict_response: str = ""
+    search_results: Dict[str, List[dict]] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ClaimFixture":
+        return cls(**data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "claim_text": self.claim_text,
+            "language": self.language,
+            "context": self.context,
+            "agent_responses": self.agent_responses,
+            "verdict_response": self.verdict_response,
+            "search_results": self.search_results,
+        }
+
+
+def load_fixtures(path: str) -> List[ClaimFixture]:
+    with open(path, "r") as f:
+        return [ClaimFixture.from_dict(claim) for claim in json.load(f)["claims"]]
+
+
+def save_fixtures(path: str, fixtures: List[ClaimFixture]) -> None:
+    with open(path, "w") as f:
+        json.dump({"claims": [fixture.to_dict() for fixture in fixtures]}, f, indent=2, ensure_ascii=False)
+
+
+def _apply_limits(text: str, stop: Optional[List[str]], max_tokens: Optional[int]) -> str:
+    """Cut a recorded response where a live call with the same stop strings and token cap would have ended."""
+    for stop_string in stop or ():
+        index = text.find(stop_string)
+        if index != -1:
+            text = text[:index]
+    return text[: max_tokens * _CHUNK_CHARS] if max_tokens else text
+
+
+def _is_verdict_request(messages: List[Message]) -> bool:
+    return any(prompt in messages[-1].content for prompt in _VERDICT_PROMPTS)
+
+
+class ReplayLLMProvider(LLMProvider):
+    """Replays one claim's recorded responses: agent turns in order, then the verdict when it is asked for."""
+
+    def __init__(self, fixture: ClaimFixture, latency: LatencyProfile):
+        self._fixture = fixture
+        self._latency = latency
+        self._next_turn = 0
+
+    def _next_response(self, messages: List[Message]) -> str:
+        if _is_verdict_request(messages):
+            return self._fixture.verdict_response
+
+        if self._next_turn >= len(self._fixture.agent_responses):
+            return "PRÊT" if self._fixture.language == "french" else "READY"
+        response = self._fixture.agent_responses[self._next_turn]
+        self._next_turn += 1
+        return response
+
+    async def generate_response(
+        self,
+        messages: List[Message],
+        temperature: float = 0.7,
+        timeout: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> Response:
+        text = _apply_limits(self._next_response(messages), stop, max_tokens)
+        await self._latency.first_token()
+        for _ in range(0, len(text), _CHUNK_CHARS):
+            await self._latency.next_token()
+        return Response(text=text, confidence_score=1.0, created_at=datetime.now(UTC), metadata={"replay": True})
+
+    async def generate_stream(
+        self,
+        messages: List[Message],
+        temperature: float = 0.7,
+        timeout: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> AsyncGenerator[ResponseChunk, None]:
+        text = _apply_limits(self._next_response(messages), stop, max_tokens)
+        await self._latency.first_token()
+        for start in range(0, len(text), _CHUNK_CHARS):
+            await self._latency.next_token()
+            yield ResponseChunk(text=text[start : start + _CHUNK_CHARS], is_complete=False, metadata={})
+        yield ResponseChunk(text="", is_complete=True, metadata={})
+
+
+class RecordingLLMProvider(LLMProvider):
+    """Passes calls through to a live provider and records what it answered into a fixture."""
+
+    def __init__(self, provider: LLMProvider, fixture: ClaimFixture):
+        self._provider = provider
+        self._fixture = fixture
+
+    def _record(self, messages: List[Message], text: str) -> None:
+        if _is_verdict_request(messages):
+            self._fixture.verdict_response = text
+        else:
+            self._fixture.agent_responses.append(text)
+
+    async def generate_response(
+        self,
+        messages: List[Message],
+        temperature: float = 0.7,
+        timeout: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> Response:
+        response = await self._provider.generate_response(
+            messages,
+            temperature=temperature,
+            timeout=timeout,
+            stop=stop,
+            max_tokens=max_tokens,
+            response_format=response_format,
+        )
+        self._record(messages, response.text)
+        return response
+
+    async def generate_stream(
+        self,
+        messages: List[Message],
+        temperature: float = 0.7,
+        timeout: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> AsyncGenerator[ResponseChunk, None]:
+        # Recorded even when the consumer stops early, since replay has to stop at the same point
+        text = ""
+        try:
+            stream = self._provider.generate_stream(
+                messages,
+                temperature=temperature,
+                timeout=timeout,
+                stop=stop,
+                max_tokens=max_tokens,
+                response_format=response_format,
+            )
+            async for chunk in stream:
+                text += chunk.text
+                yield chunk
+        finally:
+            self._record(messages, text)
+
+
+class ReplayWebSearchService(GoogleWebSearchService):
+    """Serves recorded search results; sources and domains still go through the real persistence path."""
+
+    def __init__(self, fixture: ClaimFixture, latency: LatencyProfile):
+        super().__init__()
+        self._fixture = fixture
+        self._latency = latency
+
+    async def fetch_search_results(
+        self, query: str, num_results: int = 5, language: str = "english", timeout: Optional[float] = None
+    ) -> List[dict]:
+        await self._latency.search()
+        return self._fixture.search_results.get(query.strip(), [])[:num_results]
+
+
+class RecordingWebSearchService(GoogleWebSearchService):
+    """Calls Google CSE for real and records the raw results by query."""
+
+    def __init__(self, fixture: ClaimFixture):
+        super().__init__()
+        self._fixture = fixture
+
+    async def fetch_search_results(
+        self, query: str, num_results: int = 5, language: str = "english", timeout: Optional[float] = None
+    ) -> List[dict]:
+        items = await super().fetch_search_results(query, num_results=num_results, language=language, timeout=timeout)
+        self._fixture.search_results[query.strip()] = items
+        return items
@@ -0,0 +1,32 @@
+"""add claim embedding vector index
+
+Revision ID: 5f3a9c1d7e24
+Revises: 142219b495ef
+Create Date: 2026-10-17 10:12:41.208113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5f3a9c1d7e24"
+down_revision: Union[str, None] = "142219b495ef"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+    # Expression index over the existing double precision[] column, so the column type and
+    # the code reading it stay unchanged while nearest-neighbour queries can use HNSW.
+    op.execute(
+        "CREATE INDEX ix_claims_embedding_hnsw ON claims "
+        "USING hnsw ((embedding::vector(384)) vector_cosine_ops) "
+        "WHERE embedding IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_claims_embedding_hnsw")
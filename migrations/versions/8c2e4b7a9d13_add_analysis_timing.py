@@ -0,0 +1,27 @@
+"""add analysis timing
+
+Revision ID: 8c2e4b7a9d13
+Revises: 5f3a9c1d7e24
+Create Date: 2026-10-17 11:03:27.514920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8c2e4b7a9d13"
+down_revision: Union[str, None] = "5f3a9c1d7e24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("analysis", sa.Column("timing", postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("analysis", "timing")
@@ -0,0 +1,59 @@
+"""add llm usage metering
+
+Revision ID: d4f1a6c8b2e5
+Revises: 8c2e4b7a9d13
+Create Date: 2026-10-17 16:42:08.301774
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d4f1a6c8b2e5"
+down_revision: Union[str, None] = "8c2e4b7a9d13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("analysis", sa.Column("llm_usage", postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+
+    op.create_table(
+        "llm_daily_usage",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("stage", sa.String(length=100), nullable=False),
+        sa.Column("model", sa.String(length=255), nullable=False),
+        sa.Column("calls", sa.Integer(), nullable=False),
+        sa.Column("cached_calls", sa.Integer(), nullable=False),
+        sa.Column("prompt_tokens", sa.Integer(), nullable=False),
+        sa.Column("completion_tokens", sa.Integer(), nullable=False),
+        sa.Column("cost_usd", sa.DOUBLE_PRECISION(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"], ["users.id"], name=op.f("fk_llm_daily_usage_user_id_users"), ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_llm_daily_usage")),
+    )
+    op.create_index(op.f("ix_llm_daily_usage_user_id"), "llm_daily_usage", ["user_id"], unique=False)
+    op.create_index(op.f("ix_llm_daily_usage_day"), "llm_daily_usage", ["day"], unique=False)
+    op.create_index(
+        "ix_llm_daily_usage_user_day_stage_model",
+        "llm_daily_usage",
+        ["user_id", "day", "stage", "model"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_llm_daily_usage_user_day_stage_model", table_name="llm_daily_usage")
+    op.drop_index(op.f("ix_llm_daily_usage_day"), table_name="llm_daily_usage")
+    op.drop_index(op.f("ix_llm_daily_usage_user_id"), table_name="llm_daily_usage")
+    op.drop_table("llm_daily_usage")
+    op.drop_column("analysis", "llm_usage")
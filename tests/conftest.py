@@ -0,0 +1,22 @@
+import pytest
+
+from app.core.config import Settings
+
+
+@pytest.fixture
+def fake_settings():
+    """Settings for the simulated backends with no latency and no injected failures; override per test."""
+
+    def build(**overrides) -> Settings:
+        values = dict(
+            FAKE_LATENCY_DISTRIBUTION="fixed",
+            FAKE_LLM_FIRST_TOKEN_MS=0.0,
+            FAKE_LLM_TOKENS_PER_SECOND=0.0,
+            FAKE_LLM_ERROR_RATE=0.0,
+            FAKE_SEARCH_LATENCY_MS=0.0,
+            FAKE_SEARCH_ERROR_RATE=0.0,
+        )
+        values.update(overrides)
+        return Settings(**values)
+
+    return build
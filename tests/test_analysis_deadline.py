@@ -0,0 +1,67 @@
+import pytest
+
+from app.services import analysis_deadline
+from app.services.analysis_deadline import AnalysisDeadline
+from app.services.batch_executor import BatchAnalysisExecutor
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(analysis_deadline.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_research_gets_the_budget_minus_the_reserve(clock):
+    deadline = AnalysisDeadline(budget_seconds=30.0, reserve_seconds=10.0)
+
+    assert deadline.remaining_for_research() == 20.0
+    assert deadline.verdict_timeout() == 30.0
+
+    clock[0] += 25.0
+    assert deadline.remaining_for_research() == 0.0
+    assert deadline.verdict_timeout() == 10.0
+
+
+def test_reserve_is_capped_at_the_budget(clock):
+    deadline = AnalysisDeadline(budget_seconds=5.0, reserve_seconds=10.0)
+
+    assert deadline.reserve_seconds == 5.0
+    assert deadline.remaining_for_research() == 0.0
+
+
+def test_verdict_keeps_the_reserve_after_the_budget_has_run_out(clock):
+    deadline = AnalysisDeadline(budget_seconds=30.0, reserve_seconds=10.0)
+
+    clock[0] += 60.0
+    assert deadline.remaining() == 0.0
+    assert deadline.remaining_for_research() == 0.0
+    assert deadline.verdict_timeout() == 10.0
+
+
+@pytest.mark.parametrize("deadline_ms", [None, 0, -100])
+def test_no_deadline_without_a_positive_budget(deadline_ms):
+    assert AnalysisDeadline.from_ms(deadline_ms, reserve_seconds=10.0) is None
+
+
+def test_from_ms_converts_to_seconds():
+    deadline = AnalysisDeadline.from_ms(45_000, reserve_seconds=10.0)
+
+    assert deadline.budget_seconds == 45.0
+    assert deadline.reserve_seconds == 10.0
+
+
+@pytest.mark.parametrize(
+    "claim_timeout, margin, expected",
+    [
+        (120.0, 10.0, 110.0),
+        # A margin larger than half the timeout would leave too little for the analysis
+        (20.0, 15.0, 10.0),
+    ],
+)
+def test_batch_deadline_ends_before_the_hard_claim_timeout(claim_timeout, margin, expected):
+    executor = BatchAnalysisExecutor(
+        orchestrator=None, num_workers=1, claim_timeout_seconds=claim_timeout, persist_margin_seconds=margin
+    )
+
+    assert executor._deadline_seconds == expected
@@ -0,0 +1,167 @@
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.core.llm.fake_provider import FakeLLMProvider
+from app.services.analysis_orchestrator import AnalysisOrchestrator
+from app.services.analysis_single_flight import InProcessFlightBackend
+from app.services.implementations.fake_web_search_service import FakeWebSearchService
+
+VERDICT = [
+    {"type": "status", "content": "Searching..."},
+    {"type": "veracity", "content": {"veracity_score": 80}},
+    {"type": "content", "content": "Mostly true."},
+]
+
+
+class CloningRepository:
+    def __init__(self, succeeds: bool = True):
+        self.succeeds = succeeds
+        self.cloned = []
+
+    async def clone_to_claim(self, analysis_id, claim_id):
+        self.cloned.append((analysis_id, claim_id))
+        return SimpleNamespace(id=uuid4()) if self.succeeds else None
+
+
+def make_context(repository: CloningRepository):
+    return SimpleNamespace(analysis_repo=repository, claim=SimpleNamespace(id=uuid4()))
+
+
+@pytest.fixture
+def coalescing(fake_settings):
+    flights = InProcessFlightBackend()
+    orchestrator = AnalysisOrchestrator(
+        FakeLLMProvider(fake_settings()), FakeWebSearchService(), analysis_flights=flights
+    )
+    return orchestrator, flights
+
+
+def scripted(orchestrator, events, release: asyncio.Event = None):
+    """Replace the real analysis with one that emits ``events``, pausing before the last until released."""
+    runs = []
+
+    async def generate(ctx, claim_text, context, language, emit_timing=False, deadline=None):
+        runs.append(claim_text)
+        for index, event in enumerate(events):
+            if release is not None and index == len(events) - 1:
+                await release.wait()
+            yield event
+            await asyncio.sleep(0)
+
+    orchestrator._generate_analysis = generate
+    return runs
+
+
+async def collect(stream):
+    return [event async for event in stream]
+
+
+@pytest.mark.asyncio
+async def test_late_joiner_replays_the_leaders_events_from_the_start():
+    flights = InProcessFlightBackend()
+    key = flights.make_key("The Earth is flat.", "english")
+    assert await flights.join(key) is None
+    await flights.publish(key, {"type": "status", "content": "first"})
+
+    follower = await flights.join(flights.make_key("  the earth is FLAT ", "English"))
+    await flights.publish(key, {"type": "status", "content": "second"})
+    await flights.complete(key)
+
+    assert [event["content"] for event in await collect(follower)] == ["first", "second"]
+    assert flights.stats() == {"in_flight": 0, "led": 1, "coalesced": 1}
+    # Once complete, the next request leads a new flight
+    assert await flights.join(key) is None
+
+
+@pytest.mark.asyncio
+async def test_follower_adopts_the_leaders_analysis(coalescing):
+    orchestrator, flights = coalescing
+    analysis_id = uuid4()
+    release = asyncio.Event()
+    runs = scripted(
+        orchestrator, VERDICT + [{"type": "analysis_complete", "content": {"analysis_id": str(analysis_id)}}], release
+    )
+    leader_repo, follower_repo = CloningRepository(), CloningRepository()
+
+    leader = asyncio.create_task(
+        collect(orchestrator._generate_analysis_once(make_context(leader_repo), "Claim", "", "english"))
+    )
+    await asyncio.sleep(0)
+    follower_ctx = make_context(follower_repo)
+    follower = asyncio.create_task(collect(orchestrator._generate_analysis_once(follower_ctx, "claim", "", "english")))
+    await asyncio.sleep(0.01)
+    release.set()
+    leader_events, follower_events = await asyncio.gather(leader, follower)
+
+    assert len(runs) == 1
+    assert [event["type"] for event in leader_events] == ["status", "veracity", "content", "analysis_complete"]
+    assert [event["type"] for event in follower_events] == ["status", "veracity", "content", "analysis_complete"]
+    completion = follower_events[-1]["content"]
+    assert completion["coalesced"] is True
+    assert completion["analysis_id"] != str(analysis_id)
+    assert follower_repo.cloned == [(analysis_id, follower_ctx.claim.id)]
+
+
+@pytest.mark.asyncio
+async def test_verdict_is_held_back_until_the_leader_completes(coalescing):
+    orchestrator, flights = coalescing
+    key = flights.make_key("claim", "english")
+    assert await flights.join(key) is None
+
+    follower_events = []
+
+    async def follow():
+        async for event in orchestrator._generate_analysis_once(
+            make_context(CloningRepository()), "claim", "", "english"
+        ):
+            follower_events.append(event)
+
+    follower = asyncio.create_task(follow())
+    await asyncio.sleep(0)
+    for event in VERDICT:
+        await flights.publish(key, event)
+    await asyncio.sleep(0.01)
+
+    assert [event["type"] for event in follower_events] == ["status"]
+
+    await flights.publish(key, {"type": "analysis_complete", "content": {"analysis_id": str(uuid4())}})
+    await flights.complete(key)
+    await follower
+    assert [event["type"] for event in follower_events] == ["status", "veracity", "content", "analysis_complete"]
+
+
+@pytest.mark.asyncio
+# The leader fails, completes an analysis that cannot be copied, or goes away without completing
+@pytest.mark.parametrize(
+    "ending, clone_succeeds",
+    [
+        ({"type": "error", "content": "Leader failed"}, True),
+        ({"type": "analysis_complete", "content": {"analysis_id": str(uuid4())}}, False),
+        (None, True),
+    ],
+)
+async def test_follower_falls_back_without_the_leaders_partial_verdict(coalescing, ending, clone_succeeds):
+    orchestrator, flights = coalescing
+    key = flights.make_key("claim", "english")
+    assert await flights.join(key) is None
+    runs = scripted(orchestrator, [{"type": "content", "content": "Own verdict."}])
+
+    follower = asyncio.create_task(
+        collect(
+            orchestrator._generate_analysis_once(
+                make_context(CloningRepository(clone_succeeds)), "claim", "", "english"
+            )
+        )
+    )
+    await asyncio.sleep(0)
+    for event in VERDICT + ([ending] if ending else []):
+        await flights.publish(key, event)
+    await flights.complete(key)
+    events = await follower
+
+    assert len(runs) == 1
+    assert [event["content"] for event in events if event["type"] == "content"] == ["Own verdict."]
+    assert not any(event["type"] == "veracity" for event in events)
@@ -0,0 +1,128 @@
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.dml import Insert
+
+from app.models.database.models import DomainModel, SourceModel
+from app.repositories.implementations.analysis_unit_of_work import AnalysisUnitOfWork
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def scalars(self):
+        return SimpleNamespace(all=lambda: list(self._rows))
+
+
+class FakeSession:
+    """Answers the unit of work's statements as Postgres would after another request won a domain insert race."""
+
+    def __init__(self, known_domains=(), inserted_by_others=()):
+        self._known = {domain.domain_name: domain for domain in known_domains}
+        self._inserted_by_others = {domain.domain_name: domain for domain in inserted_by_others}
+        self.statements = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        if _is_insert(statement):
+            if statement.table.name != DomainModel.__tablename__:
+                return _Result([])
+            # ON CONFLICT DO NOTHING ... RETURNING only reports the rows this insert created
+            names = [row["domain_name"] for row in _rows(statement)]
+            return _Result([name for name in names if name not in self._inserted_by_others])
+        # A select of domains by name: the ones known up front, or after a lost race the ones others inserted
+        lookup = self._known if not any(_is_insert(s) for s in self.statements[:-1]) else self._inserted_by_others
+        return _Result(list(lookup.values()))
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+def _is_insert(statement) -> bool:
+    return isinstance(statement, Insert)
+
+
+def _rows(statement):
+    # ``insert().values([...])`` keeps one dict of column values per row
+    return [{getattr(key, "key", key): value for key, value in row.items()} for row in statement._multi_values[0]]
+
+
+def domain(name: str) -> DomainModel:
+    now = datetime.now(UTC)
+    return DomainModel(
+        id=uuid4(),
+        domain_name=name,
+        credibility_score=0.9,
+        is_reliable=True,
+        description=None,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def search_item(url: str):
+    return {"link": url, "title": "Title", "snippet": "Snippet"}
+
+
+def inserted_sources(session: FakeSession):
+    inserts = [s for s in session.statements if _is_insert(s) and s.table.name == SourceModel.__tablename__]
+    return _rows(inserts[0])
+
+
+@pytest.mark.asyncio
+async def test_new_domains_are_inserted_with_on_conflict_do_nothing():
+    session = FakeSession()
+    unit_of_work = AnalysisUnitOfWork(session)
+
+    domains = await unit_of_work.resolve_domains(["news.example"])
+    unit_of_work.add_source(search_item("https://news.example/a"), uuid4(), domains["news.example"])
+    await unit_of_work.flush()
+
+    domain_insert = next(s for s in session.statements if _is_insert(s) and s.table.name == DomainModel.__tablename__)
+    sql = str(domain_insert.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (domain_name) DO NOTHING" in sql
+    assert "RETURNING" in sql
+    assert inserted_sources(session)[0]["domain_id"] == domains["news.example"].id
+    assert session.commits == 1
+    assert unit_of_work.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_sources_are_repointed_at_a_domain_inserted_concurrently():
+    winner = domain("news.example")
+    session = FakeSession(inserted_by_others=[winner])
+    unit_of_work = AnalysisUnitOfWork(session)
+
+    staged = (await unit_of_work.resolve_domains(["news.example"]))["news.example"]
+    source = unit_of_work.add_source(search_item("https://news.example/a"), uuid4(), staged)
+    assert source.domain_id == staged.id
+    await unit_of_work.flush()
+
+    assert inserted_sources(session)[0]["domain_id"] == winner.id
+    assert inserted_sources(session)[0]["credibility_score"] == 0.9
+    assert source.domain is winner
+    # Later sources for the same domain use the existing row straight away
+    assert (await unit_of_work.resolve_domains(["news.example"]))["news.example"] is winner
+
+
+@pytest.mark.asyncio
+async def test_known_domains_are_not_inserted_again():
+    known = domain("wiki.example")
+    session = FakeSession(known_domains=[known])
+    unit_of_work = AnalysisUnitOfWork(session)
+
+    domains = await unit_of_work.resolve_domains(["https://wiki.example/page"])
+    unit_of_work.add_source(search_item("https://wiki.example/page"), uuid4(), domains["wiki.example"])
+    await unit_of_work.flush()
+
+    assert not any(_is_insert(s) and s.table.name == DomainModel.__tablename__ for s in session.statements)
+    assert inserted_sources(session)[0]["domain_id"] == known.id
@@ -0,0 +1,129 @@
+import time
+
+import pytest
+
+from app.core.exceptions import LLMProviderError
+from app.core.llm.fake_provider import FakeLLMProvider
+from app.core.llm.messages import Message
+from app.core.llm.router import RoutingLLMProvider
+
+MESSAGES = [Message(role="user", content="Is the Earth flat?")]
+
+
+class RejectingProvider(FakeLLMProvider):
+    """Refuses every request the way an API rejects a bad one."""
+
+    async def generate_response(self, messages, **kwargs):
+        raise LLMProviderError("Bad request", status_code=400)
+
+
+class RecordingProvider(FakeLLMProvider):
+    def __init__(self, settings, model=None):
+        super().__init__(settings, model)
+        self.calls = []
+
+    async def generate_response(self, messages, **kwargs):
+        self.calls.append(kwargs)
+        return await super().generate_response(messages, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_transient_failure_fails_over_and_cools_the_backend_down(fake_settings):
+    router = RoutingLLMProvider(
+        [
+            ("down", FakeLLMProvider(fake_settings(FAKE_LLM_ERROR_RATE=1.0), "down")),
+            ("up", FakeLLMProvider(fake_settings(), "up")),
+        ]
+    )
+
+    response = await router.generate_response(MESSAGES)
+
+    assert response.metadata["model"] == "up"
+    stats = router.stats()
+    assert stats["down.response"]["cooling_down"]
+    assert stats["down.response"]["error_rate"] == 1.0
+    # The cooled-down backend is now tried last
+    assert [name for name, _ in router._ranked("response")] == ["up", "down"]
+
+
+@pytest.mark.asyncio
+async def test_rejection_is_raised_without_failing_over(fake_settings):
+    fallback = RecordingProvider(fake_settings(), "fallback")
+    router = RoutingLLMProvider([("rejecting", RejectingProvider(fake_settings())), ("fallback", fallback)])
+
+    with pytest.raises(LLMProviderError):
+        await router.generate_response(MESSAGES)
+    assert fallback.calls == []
+    assert not router.stats()["rejecting.response"]["cooling_down"]
+
+
+@pytest.mark.asyncio
+async def test_error_from_the_last_backend_is_raised_when_all_fail(fake_settings):
+    failing = fake_settings(FAKE_LLM_ERROR_RATE=1.0)
+    router = RoutingLLMProvider([("a", FakeLLMProvider(failing)), ("b", FakeLLMProvider(failing))])
+
+    with pytest.raises((LLMProviderError, TimeoutError)):
+        await router.generate_response(MESSAGES)
+
+
+@pytest.mark.asyncio
+async def test_stream_fails_over_before_its_first_chunk(fake_settings):
+    router = RoutingLLMProvider(
+        [
+            ("down", FakeLLMProvider(fake_settings(FAKE_LLM_ERROR_RATE=1.0), "down")),
+            ("up", FakeLLMProvider(fake_settings(), "up")),
+        ]
+    )
+
+    chunks = [chunk async for chunk in router.generate_stream(MESSAGES)]
+
+    assert chunks[-1].is_complete
+    assert chunks[-1].metadata["model"] == "up"
+    assert "".join(chunk.text for chunk in chunks).startswith("This is a simulated reply")
+
+
+@pytest.mark.asyncio
+async def test_slow_call_is_hedged_on_the_runner_up(fake_settings):
+    router = RoutingLLMProvider(
+        [
+            ("slow", FakeLLMProvider(fake_settings(FAKE_LLM_FIRST_TOKEN_MS=2000.0), "slow")),
+            ("fast", FakeLLMProvider(fake_settings(), "fast")),
+        ],
+        hedge=True,
+        hedge_min_delay_seconds=0.05,
+    )
+
+    started = time.monotonic()
+    response = await router.generate_response(MESSAGES)
+
+    assert response.metadata["model"] == "fast"
+    assert time.monotonic() - started < 1.0
+
+
+@pytest.mark.asyncio
+async def test_slow_stream_is_hedged_on_the_runner_up(fake_settings):
+    router = RoutingLLMProvider(
+        [
+            ("slow", FakeLLMProvider(fake_settings(FAKE_LLM_FIRST_TOKEN_MS=2000.0), "slow")),
+            ("fast", FakeLLMProvider(fake_settings(), "fast")),
+        ],
+        hedge=True,
+        hedge_min_delay_seconds=0.05,
+    )
+
+    started = time.monotonic()
+    chunks = [chunk async for chunk in router.generate_stream(MESSAGES)]
+
+    assert chunks[-1].metadata["model"] == "fast"
+    assert time.monotonic() - started < 1.0
+
+
+@pytest.mark.asyncio
+async def test_default_temperature_is_sent_when_the_caller_leaves_it_out(fake_settings):
+    backend = RecordingProvider(fake_settings())
+    router = RoutingLLMProvider([("only", backend)], default_temperature=0.0)
+
+    await router.generate_response(MESSAGES)
+    await router.generate_response(MESSAGES, temperature=0.5)
+
+    assert [call["temperature"] for call in backend.calls] == [0.0, 0.5]
@@ -0,0 +1,178 @@
+import pytest
+
+from app.core.config import settings
+from app.core.exceptions import CircuitOpenError, LLMProviderError
+from app.core.utils import resilience
+from app.core.utils.resilience import (
+    CircuitBreaker,
+    ResiliencePolicy,
+    get_resilience_policy,
+    is_transient_error,
+    parse_retry_after,
+)
+from app.services.implementations.fake_web_search_service import FakeWebSearchService
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(resilience.time, "monotonic", lambda: now[0])
+    return now
+
+
+def make_policy(**options) -> ResiliencePolicy:
+    breaker = CircuitBreaker("test", failure_threshold=options.pop("failure_threshold", 5), reset_timeout_seconds=30.0)
+    return ResiliencePolicy(
+        breaker, initial_backoff_seconds=0.001, max_backoff_seconds=0.002, max_retry_after_seconds=1.0, **options
+    )
+
+
+def failing(*errors):
+    """An operation that raises ``errors`` in turn, then succeeds."""
+    calls = []
+
+    async def operation(timeout):
+        calls.append(timeout)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return "ok"
+
+    return operation, calls
+
+
+@pytest.mark.parametrize("status_code", [408, 425, 429, 500, 503])
+def test_transient_status_codes(status_code):
+    assert is_transient_error(LLMProviderError("failed", status_code=status_code))
+
+
+@pytest.mark.parametrize("status_code", [400, 401, 404, 409, 422])
+def test_rejections_are_not_transient(status_code):
+    assert not is_transient_error(LLMProviderError("rejected", status_code=status_code))
+
+
+def test_retry_after_in_seconds_or_as_a_date():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+
+
+@pytest.mark.asyncio
+async def test_transient_failures_are_retried():
+    policy = make_policy(max_attempts=3)
+    operation, calls = failing(LLMProviderError("busy", status_code=503), TimeoutError())
+
+    assert await policy.call(operation) == "ok"
+    assert len(calls) == 3
+    assert policy.retries == 2
+    assert policy.breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_rejections_are_raised_at_once_and_do_not_count_against_the_breaker():
+    policy = make_policy(max_attempts=3, failure_threshold=1)
+    operation, calls = failing(LLMProviderError("conflict", status_code=409))
+
+    with pytest.raises(LLMProviderError):
+        await policy.call(operation)
+    assert len(calls) == 1
+    assert policy.breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_retry_after_beyond_the_cap_fails_fast():
+    policy = make_policy(max_attempts=3)
+    operation, calls = failing(LLMProviderError("slow down", status_code=429, retry_after="120"))
+
+    with pytest.raises(LLMProviderError):
+        await policy.call(operation)
+    assert len(calls) == 1
+    assert policy.retries == 0
+
+
+@pytest.mark.asyncio
+async def test_attempts_share_the_callers_timeout():
+    policy = make_policy(max_attempts=3)
+    operation, calls = failing(TimeoutError())
+
+    assert await policy.call(operation, timeout=5.0) == "ok"
+    assert calls[0] == pytest.approx(5.0, abs=0.1)
+    assert calls[1] < calls[0]
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_after_consecutive_failures_and_short_circuits(clock):
+    policy = make_policy(max_attempts=1, failure_threshold=2)
+    down, _ = failing(*[LLMProviderError("down", status_code=503)] * 10)
+
+    for _ in range(2):
+        with pytest.raises(LLMProviderError):
+            await policy.call(down)
+    assert policy.breaker.state == "open"
+
+    operation, calls = failing()
+    with pytest.raises(CircuitOpenError):
+        await policy.call(operation)
+    assert calls == []
+    assert policy.breaker.short_circuited == 1
+
+
+@pytest.mark.asyncio
+async def test_half_open_breaker_closes_after_a_successful_trial(clock):
+    policy = make_policy(max_attempts=1, failure_threshold=1)
+    down, _ = failing(LLMProviderError("down", status_code=503))
+    with pytest.raises(LLMProviderError):
+        await policy.call(down)
+
+    clock[0] += 31.0
+    assert policy.breaker.state == "half_open"
+    operation, _ = failing()
+    assert await policy.call(operation) == "ok"
+    assert policy.breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_failed_trial_reopens_the_breaker(clock):
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout_seconds=30.0)
+    breaker.record_failure()
+
+    clock[0] += 31.0
+    breaker.before_call()
+    # Only one trial at a time
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.times_opened == 2
+
+
+@pytest.fixture
+def search_settings(monkeypatch):
+    monkeypatch.setattr(settings, "FAKE_SEARCH_LATENCY_MS", 0.0)
+    monkeypatch.setattr(settings, "RESILIENCE_INITIAL_BACKOFF_SECONDS", 0.001)
+    monkeypatch.setattr(settings, "RESILIENCE_MAX_BACKOFF_SECONDS", 0.002)
+    get_resilience_policy.cache_clear()
+    yield settings
+    get_resilience_policy.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_search_results_come_through_the_shared_policy(search_settings):
+    search = FakeWebSearchService()
+
+    items = await search.fetch_search_results("is the earth flat", num_results=3)
+
+    assert len(items) == 3
+    assert items == await search.fetch_search_results("is the earth flat", num_results=3)
+    assert get_resilience_policy("google_search").stats()["calls"] == 2
+
+
+@pytest.mark.asyncio
+async def test_failing_search_is_retried_then_gives_no_results(search_settings, monkeypatch):
+    monkeypatch.setattr(search_settings, "FAKE_SEARCH_ERROR_RATE", 1.0)
+    search = FakeWebSearchService()
+
+    assert await search.fetch_search_results("is the earth flat") == []
+    stats = get_resilience_policy("google_search").stats()
+    assert stats["retries"] == search_settings.RESILIENCE_MAX_ATTEMPTS - 1
+    assert stats["failures"] == 1
@@ -0,0 +1,72 @@
+import pytest
+
+from app.core.exceptions import MalformedLLMOutputError
+from app.core.llm.veracity_parser import VeracityStreamParser
+
+
+def feed_all(parser: VeracityStreamParser, chunks):
+    return [parser.feed(chunk) for chunk in chunks]
+
+
+def test_score_is_reported_once_its_value_has_ended():
+    parser = VeracityStreamParser()
+
+    # "8" alone could still become "85"
+    assert feed_all(parser, ['{"veracity_score": 8', "5", ', "analysis": "Mostly ', 'true."}']) == [
+        None,
+        None,
+        85,
+        None,
+    ]
+    assert parser.finish().analysis == "Mostly true."
+
+
+def test_key_split_across_chunks_is_found():
+    parser = VeracityStreamParser()
+
+    assert feed_all(parser, ['Here you go:\n{"verac', "ity_sc", 'ore": "40",', ' "analysis": "x"}']) == [
+        None,
+        None,
+        40,
+        None,
+    ]
+
+
+@pytest.mark.parametrize("raw, expected", [("0.42", 42), ("72.6", 73), ("150", 100), ("-3", 0)])
+def test_scores_are_normalized(raw, expected):
+    parser = VeracityStreamParser()
+    parser.feed(f'{{"veracity_score": {raw}, "analysis": "a"}}')
+
+    assert parser.finish().veracity_score == expected
+
+
+def test_unescaped_quotes_and_newlines_in_the_analysis_are_tolerated():
+    parser = VeracityStreamParser()
+    feed_all(parser, ['{"veracity_score": 30, "analysis": "The so-called "study"\n', 'was never published."}'])
+
+    parsed = parser.finish()
+    assert parsed.veracity_score == 30
+    assert parsed.analysis == 'The so-called "study"\nwas never published.'
+
+
+def test_long_preamble_without_json_fails_early():
+    parser = VeracityStreamParser()
+
+    with pytest.raises(MalformedLLMOutputError):
+        parser.feed("I cannot answer that. " * 40)
+
+
+def test_finish_without_an_object_fails():
+    parser = VeracityStreamParser()
+    parser.feed("no json here")
+
+    with pytest.raises(MalformedLLMOutputError):
+        parser.finish()
+
+
+def test_finish_without_a_score_fails():
+    parser = VeracityStreamParser()
+    parser.feed('{"analysis": "no score given"}')
+
+    with pytest.raises(MalformedLLMOutputError):
+        parser.finish()